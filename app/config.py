@@ -59,6 +59,12 @@ class Settings(BaseSettings):
     REDIS_URL: str = "redis://localhost:6379"
     CACHE_TTL: int = 300  # 5 minutes default cache time
     
+    # Signal Disk Cache (indicator values keyed by symbol, period and the
+    # analyzed closes); opt-in: set a directory private to the service to
+    # enable it, empty (the default) disables it
+    SIGNAL_DISK_CACHE_DIR: str = ""
+    SIGNAL_DISK_CACHE_SIZE_LIMIT: int = 2 ** 30  # 1 GiB
+    
     # External API Keys
     ALPHA_VANTAGE_API_KEY: str = "demo"  # Replace with real API key
     YAHOO_FINANCE_ENABLED: bool = True
@@ -14,9 +14,9 @@ Key Features:
 - Error handling and fallback mechanisms
 """
 
-import json
 import pickle
-from typing import Any, Optional, Union, Dict, List
+from typing import Any, Optional, Union, Dict, List, Tuple
+import orjson
 import redis.asyncio as redis
 import logging
 from datetime import datetime, timedelta
@@ -82,20 +82,33 @@ class CacheManager:
             if value is None:
                 return default
             
-            # Try to deserialize as JSON first, then pickle
-            try:
-                return json.loads(value.decode('utf-8'))
-            except (json.JSONDecodeError, TypeError, UnicodeDecodeError):
-                try:
-                    return pickle.loads(value)
-                except (pickle.PickleError, TypeError):
-                    # Return raw string if deserialization fails
-                    return value.decode('utf-8') if isinstance(value, bytes) else value
+            return self._deserialize(value)
                     
         except Exception as e:
             logger.error(f"Cache get error for key {key}: {e}")
             return default
     
+    async def get_many(self, keys: List[str], namespace: str = "") -> List[Any]:
+        """
+        Get several values from cache in a single MGET round trip.
+        
+        Args:
+            keys: Cache keys
+            namespace: Optional namespace
+            
+        Returns:
+            List[Any]: Cached values aligned with keys (None where missing)
+        """
+        if not keys:
+            return []
+        
+        try:
+            values = await self.redis.mget([self._generate_key(key, namespace) for key in keys])
+            return [None if value is None else self._deserialize(value) for value in values]
+        except Exception as e:
+            logger.error(f"Cache get_many error for {len(keys)} keys: {e}")
+            return [None] * len(keys)
+    
     async def set(
         self, 
         key: str, 
@@ -119,22 +132,86 @@ class CacheManager:
             full_key = self._generate_key(key, namespace)
             ttl = ttl or self.default_ttl
             
-            # Serialize value
-            if isinstance(value, (dict, list)):
-                serialized_value = json.dumps(value)
-            elif isinstance(value, (str, int, float, bool)):
-                serialized_value = json.dumps(value)
-            else:
-                # Use pickle for complex objects
-                serialized_value = pickle.dumps(value)
-            
-            await self.redis.setex(full_key, ttl, serialized_value)
+            await self.redis.setex(full_key, ttl, self._serialize(value))
             return True
             
         except Exception as e:
             logger.error(f"Cache set error for key {key}: {e}")
             return False
     
+    async def set_many(
+        self,
+        items: Dict[str, Any],
+        ttl: Optional[int] = None,
+        namespace: str = ""
+    ) -> bool:
+        """
+        Set several values with the same TTL in one pipelined round trip.
+        
+        Args:
+            items: Mapping of cache key to value
+            ttl: Time to live in seconds (uses default if None)
+            namespace: Optional namespace
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        if not items:
+            return True
+        
+        try:
+            ttl = ttl or self.default_ttl
+            pipeline = self.redis.pipeline(transaction=False)
+            for key, value in items.items():
+                pipeline.setex(self._generate_key(key, namespace), ttl, self._serialize(value))
+            await pipeline.execute()
+            return True
+            
+        except Exception as e:
+            logger.error(f"Cache set_many error for {len(items)} keys: {e}")
+            return False
+    
+    @staticmethod
+    def _serialize(value: Any) -> bytes:
+        """
+        Serialize a value for storage.
+        
+        Args:
+            value: Value to serialize
+            
+        Returns:
+            bytes: Compact JSON (orjson) for plain data, pickle for complex
+            objects or data JSON cannot represent
+        """
+        if isinstance(value, (dict, list, str, int, float, bool)):
+            try:
+                return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+            except orjson.JSONEncodeError:
+                pass
+        # Use pickle for complex objects
+        return pickle.dumps(value)
+    
+    @staticmethod
+    def _deserialize(value: bytes) -> Any:
+        """
+        Deserialize a stored value.
+        
+        Args:
+            value: Raw value from Redis
+            
+        Returns:
+            Any: Decoded value
+        """
+        # Try to deserialize as JSON first, then pickle
+        try:
+            return orjson.loads(value)
+        except (orjson.JSONDecodeError, TypeError):
+            try:
+                return pickle.loads(value)
+            except (pickle.PickleError, TypeError):
+                # Return raw string if deserialization fails
+                return value.decode('utf-8') if isinstance(value, bytes) else value
+    
     async def delete(self, key: str, namespace: str = "") -> bool:
         """
         Delete key from cache.
@@ -357,6 +434,72 @@ async def get_cached_price_data(symbol: str) -> Optional[Dict[str, Any]]:
     return await cache.get(f"price:{symbol}", "market_data")
 
 
+async def get_cached_price_data_batch(symbols: List[str]) -> List[Optional[Dict[str, Any]]]:
+    """
+    Get cached price data for several symbols in one round trip.
+    
+    Args:
+        symbols: Stock/crypto symbols (or price cache keys)
+        
+    Returns:
+        List[Optional[Dict]]: Cached price data aligned with symbols
+    """
+    cache = get_cache()
+    return await cache.get_many([f"price:{symbol}" for symbol in symbols], "market_data")
+
+
+async def cache_price_data_batch(items: Dict[str, Dict[str, Any]], ttl: int = 300) -> bool:
+    """
+    Cache price data for several symbols in one round trip.
+    
+    Args:
+        items: Mapping of symbol (or price cache key) to price data
+        ttl: Time to live in seconds
+        
+    Returns:
+        bool: True if successful
+    """
+    cache = get_cache()
+    return await cache.set_many(
+        {f"price:{symbol}": data for symbol, data in items.items()}, ttl, "market_data"
+    )
+
+
+async def get_provider_failures(provider: str, symbols: List[str]) -> List[bool]:
+    """
+    Check which symbols a market data provider recently failed for.
+    
+    Args:
+        provider: Provider name
+        symbols: Stock/crypto symbols
+        
+    Returns:
+        List[bool]: Whether a failure marker exists, aligned with symbols
+    """
+    cache = get_cache()
+    markers = await cache.get_many([f"fail:{provider}:{symbol}" for symbol in symbols], "market_data")
+    return [marker is not None for marker in markers]
+
+
+async def cache_provider_failures(provider: str, symbols: List[str], ttl: int = 60) -> bool:
+    """
+    Record that a market data provider returned no data for symbols.
+    
+    Args:
+        provider: Provider name
+        symbols: Stock/crypto symbols
+        ttl: Time to live in seconds
+        
+    Returns:
+        bool: True if successful
+    """
+    cache = get_cache()
+    marker = {"_fail": provider, "_ts": datetime.utcnow().isoformat()}
+    return await cache.set_many(
+        {f"fail:{provider}:{symbol}": marker for symbol in symbols}, ttl, "market_data"
+    )
+
+
 async def cache_technical_indicator(symbol: str, indicator: str, data: Any, ttl: int = 600) -> bool:
     """
     Cache technical indicator data.
@@ -389,6 +532,41 @@ async def get_cached_indicator(symbol: str, indicator: str) -> Optional[Any]:
     return await cache.get(f"indicator:{symbol}:{indicator}", "technical")
 
 
+async def get_cached_indicators_batch(keys: List[Tuple[str, str]]) -> List[Optional[Any]]:
+    """
+    Get several cached technical indicators in one round trip.
+    
+    Args:
+        keys: (symbol, indicator) pairs
+        
+    Returns:
+        List[Optional[Any]]: Cached indicator data aligned with keys
+    """
+    cache = get_cache()
+    return await cache.get_many(
+        [f"indicator:{symbol}:{indicator}" for symbol, indicator in keys], "technical"
+    )
+
+
+async def cache_technical_indicators_batch(entries: List[Tuple[str, str, Any]], ttl: int = 600) -> bool:
+    """
+    Cache several technical indicators in one round trip.
+    
+    Args:
+        entries: (symbol, indicator, data) triples
+        ttl: Time to live in seconds
+        
+    Returns:
+        bool: True if successful
+    """
+    cache = get_cache()
+    return await cache.set_many(
+        {f"indicator:{symbol}:{indicator}": data for symbol, indicator, data in entries},
+        ttl,
+        "technical"
+    )
+
+
 async def health_check() -> bool:
     """
     Check Redis cache health.
@@ -0,0 +1,26 @@
+"""
+Optional JIT Compilation
+========================
+
+This module centralizes the optional numba dependency for compiled kernels:
+- njit: numba.njit when numba is installed, otherwise a no-op decorator
+  so kernel loops run as plain Python
+- NUMBA_AVAILABLE: whether kernels are actually compiled, for callers
+  that prefer a NumPy path over interpreted loops
+
+Kernel modules import both names from here instead of each handling the
+missing dependency on its own.
+"""
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised only without numba
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is not installed."""
+        def decorator(func):
+            return func
+        return decorator
+
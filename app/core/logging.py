@@ -57,6 +57,10 @@ def configure_logging(
                 "encoding": "utf-8",
             },
         },
+        "loggers": {
+            # numba's compiler logs bytecode at DEBUG; keep it out of app logs
+            "numba": {"level": "WARNING"},
+        },
         "root": {
             "level": log_level,
             "handlers": handlers,
@@ -2,15 +2,33 @@
 General utility functions used across the application.
 """
 
-from typing import Any, Dict
+import time
+from typing import Any, Dict, Tuple
 from datetime import datetime
 
+# (epoch second, ISO string) of the most recent utc_iso_now() call
+_ts_cache: Tuple[int, str] = (0, "")
+
 
 def now_iso() -> str:
     """Return current UTC time in ISO 8601 format."""
     return datetime.utcnow().isoformat() + "Z"
 
 
+def utc_iso_now() -> str:
+    """
+    Return current UTC time in ISO 8601 format, at one-second resolution.
+
+    The string is formatted once per second and shared by every call
+    within that second, for response timestamps on high-traffic routes.
+    """
+    global _ts_cache
+    second = int(time.time())
+    if second != _ts_cache[0]:
+        _ts_cache = (second, datetime.utcfromtimestamp(second).isoformat())
+    return _ts_cache[1]
+
+
 def safe_float(value: Any, default: float = 0.0) -> float:
     """Convert value to float safely with default fallback."""
     try:
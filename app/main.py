@@ -22,6 +22,7 @@ License: MIT
 """
 
 import time
+import asyncio
 import uuid
 from typing import Dict, Any
 from datetime import datetime
@@ -61,6 +62,7 @@ async def lifespan(app: FastAPI):
     This function handles:
     - Database initialization and health checks
     - Redis cache setup and validation
+    - Compiled kernel warmup
     - Performance monitoring setup
     - Graceful shutdown and cleanup
     """
@@ -92,12 +94,23 @@ async def lifespan(app: FastAPI):
         else:
             logger.warning("⚠️ Cache health check failed")
         
+        # Compile the numba kernels now rather than on the first request
+        from app.services import indicator_kernels, portfolio_kernels, screener_kernels
+        if indicator_kernels.NUMBA_AVAILABLE:
+            for name, kernels in (
+                ("indicator", indicator_kernels),
+                ("screener", screener_kernels),
+                ("portfolio", portfolio_kernels)
+            ):
+                logger.info(f"✅ Warmed up {name} kernels in {kernels.warmup() * 1000:.0f} ms")
+        
         # Log configuration summary
         logger.info("📋 Configuration Summary:")
         logger.info(f"   - Database: {settings.DATABASE_URL.split('@')[1] if '@' in settings.DATABASE_URL else 'configured'}")
         logger.info(f"   - Redis: {settings.REDIS_URL}")
         logger.info(f"   - CORS Origins: {len(settings.CORS_ORIGINS)} configured")
         logger.info(f"   - Log Level: {settings.LOG_LEVEL}")
+        logger.info(f"   - Event Loop: {type(asyncio.get_running_loop()).__module__}")
         
         logger.info("🎉 InsightFinance API is ready!")
         logger.info(f"📚 API Documentation: http://localhost:8000/docs")
@@ -123,6 +136,10 @@ async def lifespan(app: FastAPI):
         await close_cache()
         logger.info("✅ Cache connections closed")
         
+        # Close the shared market data HTTP client
+        from app.services.alphavantage_service import close_http_client
+        await close_http_client()
+        
         logger.info("✅ Cleanup completed successfully")
     except Exception as e:
         logger.error(f"❌ Error during shutdown: {e}")
@@ -19,11 +19,15 @@ Features:
 - Transaction history and reporting
 """
 
+import copy
+import operator
+from collections import defaultdict
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
 from decimal import Decimal
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Path
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field, validator
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, and_
@@ -40,6 +44,44 @@ from app.services.portfolio_service import compute_portfolio_metrics_for_analyti
 logger = get_logger(__name__)
 router = APIRouter()
 
+# Recommendation rules: (metric key, default, comparison, threshold, message)
+_RULES = (
+    ("diversification_score", 0, operator.lt, 30,
+     "Portfolio is highly concentrated. Consider diversifying across more assets."),
+    ("beta", 1.0, operator.gt, 1.3,
+     "Portfolio has high market sensitivity. Consider reducing exposure to high-beta assets."),
+    ("sharpe_ratio", 0, operator.lt, 0.5,
+     "Risk-adjusted returns are low. Consider rebalancing for better risk-return profile."),
+    ("volatility", 0, operator.gt, 0.25,
+     "Portfolio volatility is high. Consider adding defensive positions to reduce risk."),
+)
+_DEFAULT_RECOMMENDATION = "Portfolio metrics are within acceptable ranges. Continue monitoring performance."
+
+# Analytics body for portfolios with no positions or no market value; the
+# recommendation is added per case
+_EMPTY_ANALYTICS_TEMPLATE = {
+    "performance_metrics": {
+        "total_return": 0.0,
+        "annualized_return": 0.0,
+        "volatility": 0.0,
+        "sharpe_ratio": 0.0,
+        "max_drawdown": 0.0,
+        "win_rate": 0.0
+    },
+    "risk_metrics": {
+        "beta": 0.0,
+        "alpha": 0.0,
+        "var_95": 0.0,
+        "expected_shortfall": 0.0
+    },
+    "allocation_analysis": {
+        "sector_allocation": {},
+        "asset_allocation": {}
+    }
+}
+_NO_POSITIONS_RECOMMENDATION = "Add positions to start tracking portfolio performance"
+_NO_VALUE_RECOMMENDATION = "Positions have no current market value. Review quantities and prices to track performance."
+
 
 class PositionData(BaseModel):
     """Individual position data model."""
@@ -138,7 +180,7 @@ async def get_user_portfolios(
         PortfolioListResponse: List of user's portfolios
     """
     try:
-        logger.info(f"Fetching portfolios for user {user.id}")
+        logger.info("Fetching portfolios for user %s", user.id)
         
         # Query user's portfolios
         result = await db.execute(
@@ -162,11 +204,11 @@ async def get_user_portfolios(
             total_count=len(portfolio_list)
         )
         
-        logger.info(f"Found {len(portfolio_list)} portfolios for user {user.id}")
+        logger.info("Found %d portfolios for user %s", len(portfolio_list), user.id)
         return response
         
-    except Exception as e:
-        logger.error(f"Error fetching portfolios for user {user.id}: {e}")
+    except Exception:
+        logger.exception("Error fetching portfolios for user %s", user.id)
         raise HTTPException(
             status_code=500,
             detail="Internal server error while fetching portfolios"
@@ -194,7 +236,7 @@ async def create_portfolio(
         HTTPException: If portfolio creation fails
     """
     try:
-        logger.info(f"Creating portfolio '{request.name}' for user {user.id}")
+        logger.info("Creating portfolio '%s' for user %s", request.name, user.id)
         
         # Create new portfolio
         portfolio = Portfolio(
@@ -230,11 +272,11 @@ async def create_portfolio(
             risk_metrics={}
         )
         
-        logger.info(f"Successfully created portfolio {portfolio.id} for user {user.id}")
+        logger.info("Successfully created portfolio %s for user %s", portfolio.id, user.id)
         return response
         
-    except Exception as e:
-        logger.error(f"Error creating portfolio for user {user.id}: {e}")
+    except Exception:
+        logger.exception("Error creating portfolio for user %s", user.id)
         await db.rollback()
         raise HTTPException(
             status_code=500,
@@ -263,7 +305,7 @@ async def get_portfolio(
         HTTPException: If portfolio not found or access denied
     """
     try:
-        logger.info(f"Fetching portfolio {portfolio_id} for user {user.id}")
+        logger.info("Fetching portfolio %s for user %s", portfolio_id, user.id)
         
         # Query portfolio
         result = await db.execute(
@@ -378,13 +420,13 @@ async def get_portfolio(
             risk_metrics=risk_metrics
         )
         
-        logger.info(f"Successfully fetched portfolio {portfolio_id} with {len(positions)} positions")
+        logger.info("Successfully fetched portfolio %s with %d positions", portfolio_id, len(positions))
         return response
         
     except HTTPException:
         raise
-    except Exception as e:
-        logger.error(f"Error fetching portfolio {portfolio_id}: {e}")
+    except Exception:
+        logger.exception("Error fetching portfolio %s", portfolio_id)
         raise HTTPException(
             status_code=500,
             detail="Internal server error while fetching portfolio"
@@ -414,7 +456,7 @@ async def update_portfolio(
         HTTPException: If portfolio not found or update fails
     """
     try:
-        logger.info(f"Updating portfolio {portfolio_id} for user {user.id}")
+        logger.info("Updating portfolio %s for user %s", portfolio_id, user.id)
         
         # Query portfolio
         result = await db.execute(
@@ -464,13 +506,13 @@ async def update_portfolio(
             risk_metrics={}
         )
         
-        logger.info(f"Successfully updated portfolio {portfolio_id}")
+        logger.info("Successfully updated portfolio %s", portfolio_id)
         return response
         
     except HTTPException:
         raise
-    except Exception as e:
-        logger.error(f"Error updating portfolio {portfolio_id}: {e}")
+    except Exception:
+        logger.exception("Error updating portfolio %s", portfolio_id)
         await db.rollback()
         raise HTTPException(
             status_code=500,
@@ -499,7 +541,7 @@ async def delete_portfolio(
         HTTPException: If portfolio not found or deletion fails
     """
     try:
-        logger.info(f"Deleting portfolio {portfolio_id} for user {user.id}")
+        logger.info("Deleting portfolio %s for user %s", portfolio_id, user.id)
         
         # Query portfolio
         result = await db.execute(
@@ -526,13 +568,13 @@ async def delete_portfolio(
         await db.delete(portfolio)
         await db.commit()
         
-        logger.info(f"Successfully deleted portfolio {portfolio_id}")
+        logger.info("Successfully deleted portfolio %s", portfolio_id)
         return {"message": "Portfolio deleted successfully"}
         
     except HTTPException:
         raise
-    except Exception as e:
-        logger.error(f"Error deleting portfolio {portfolio_id}: {e}")
+    except Exception:
+        logger.exception("Error deleting portfolio %s", portfolio_id)
         await db.rollback()
         raise HTTPException(
             status_code=500,
@@ -563,7 +605,7 @@ async def add_position(
         HTTPException: If portfolio not found or position creation fails
     """
     try:
-        logger.info(f"Adding position {request.asset_symbol} to portfolio {portfolio_id}")
+        logger.info("Adding position %s to portfolio %s", request.asset_symbol, portfolio_id)
         
         # Verify portfolio ownership
         result = await db.execute(
@@ -633,13 +675,13 @@ async def add_position(
         
         await db.commit()
         
-        logger.info(f"Successfully added position {request.asset_symbol} to portfolio {portfolio_id}")
+        logger.info("Successfully added position %s to portfolio %s", request.asset_symbol, portfolio_id)
         return {"message": "Position added successfully"}
         
     except HTTPException:
         raise
-    except Exception as e:
-        logger.error(f"Error adding position to portfolio {portfolio_id}: {e}")
+    except Exception:
+        logger.exception("Error adding position to portfolio %s", portfolio_id)
         await db.rollback()
         raise HTTPException(
             status_code=500,
@@ -672,7 +714,7 @@ async def update_position(
         HTTPException: If portfolio/position not found or update fails
     """
     try:
-        logger.info(f"Updating position {position_id} in portfolio {portfolio_id}")
+        logger.info("Updating position %s in portfolio %s", position_id, portfolio_id)
         
         # Verify portfolio ownership
         portfolio_result = await db.execute(
@@ -726,13 +768,13 @@ async def update_position(
         
         await db.commit()
         
-        logger.info(f"Successfully updated position {position_id} in portfolio {portfolio_id}")
+        logger.info("Successfully updated position %s in portfolio %s", position_id, portfolio_id)
         return {"message": "Position updated successfully"}
         
     except HTTPException:
         raise
-    except Exception as e:
-        logger.error(f"Error updating position {position_id}: {e}")
+    except Exception:
+        logger.exception("Error updating position %s", position_id)
         await db.rollback()
         raise HTTPException(
             status_code=500,
@@ -763,7 +805,7 @@ async def delete_position(
         HTTPException: If portfolio/position not found or deletion fails
     """
     try:
-        logger.info(f"Deleting position {position_id} from portfolio {portfolio_id}")
+        logger.info("Deleting position %s from portfolio %s", position_id, portfolio_id)
         
         # Verify portfolio ownership
         portfolio_result = await db.execute(
@@ -800,13 +842,13 @@ async def delete_position(
         await db.delete(position)
         await db.commit()
         
-        logger.info(f"Successfully deleted position {position_id} from portfolio {portfolio_id}")
+        logger.info("Successfully deleted position %s from portfolio %s", position_id, portfolio_id)
         return {"message": "Position deleted successfully"}
         
     except HTTPException:
         raise
-    except Exception as e:
-        logger.error(f"Error deleting position {position_id}: {e}")
+    except Exception:
+        logger.exception("Error deleting position %s", position_id)
         await db.rollback()
         raise HTTPException(
             status_code=500,
@@ -814,7 +856,31 @@ async def delete_position(
         )
 
 
-@router.get("/{portfolio_id}/analytics", response_model=PortfolioAnalyticsResponse, summary="Get Portfolio Analytics")
+def _empty_analytics(portfolio_id: int, recommendation: str) -> PortfolioAnalyticsResponse:
+    """
+    Build zeroed analytics from the shared empty template.
+    
+    Args:
+        portfolio_id: Portfolio ID
+        recommendation: Sole recommendation explaining the empty analytics
+        
+    Returns:
+        PortfolioAnalyticsResponse: Analytics with zeroed metrics
+    """
+    return PortfolioAnalyticsResponse.construct(
+        portfolio_id=portfolio_id,
+        timestamp=datetime.utcnow().isoformat(),
+        recommendations=[recommendation],
+        **copy.deepcopy(_EMPTY_ANALYTICS_TEMPLATE)
+    )
+
+
+@router.get(
+    "/{portfolio_id}/analytics",
+    response_model=PortfolioAnalyticsResponse,
+    response_class=ORJSONResponse,
+    summary="Get Portfolio Analytics"
+)
 async def get_portfolio_analytics(
     portfolio_id: int = Path(..., description="Portfolio ID"),
     user=Depends(get_current_active_user),
@@ -835,7 +901,7 @@ async def get_portfolio_analytics(
         HTTPException: If portfolio not found or analytics fail
     """
     try:
-        logger.info(f"Computing analytics for portfolio {portfolio_id}")
+        logger.info("Computing analytics for portfolio %s", portfolio_id)
         
         # Verify portfolio ownership
         result = await db.execute(
@@ -861,47 +927,17 @@ async def get_portfolio_analytics(
         
         if not positions_data:
             # Return empty analytics for portfolio with no positions
-            analytics = PortfolioAnalyticsResponse(
-                portfolio_id=portfolio_id,
-                timestamp=datetime.utcnow().isoformat(),
-                performance_metrics={
-                    "total_return": 0.0,
-                    "annualized_return": 0.0,
-                    "volatility": 0.0,
-                    "sharpe_ratio": 0.0,
-                    "max_drawdown": 0.0,
-                    "win_rate": 0.0
-                },
-                risk_metrics={
-                    "beta": 0.0,
-                    "alpha": 0.0,
-                    "var_95": 0.0,
-                    "expected_shortfall": 0.0
-                },
-                allocation_analysis={
-                    "sector_allocation": {},
-                    "asset_allocation": {}
-                },
-                recommendations=[
-                    "Add positions to start tracking portfolio performance"
-                ]
-            )
-            logger.info(f"Returned empty analytics for portfolio {portfolio_id} with no positions")
-            return analytics
+            logger.info("Returned empty analytics for portfolio %s with no positions", portfolio_id)
+            return _empty_analytics(portfolio_id, _NO_POSITIONS_RECOMMENDATION)
         
         # Get current prices for all positions
         symbols = [pos.Asset.symbol for pos in positions_data]
         current_prices = await get_multiple_prices(symbols) if symbols else {}
         
-        # Calculate real portfolio metrics
-        metrics = await compute_portfolio_metrics_for_analytics(
-            portfolio_id, positions_data, current_prices
-        )
-        
         # Calculate allocation analysis
         total_value = 0.0
-        sector_allocation = {}
-        asset_allocation = {}
+        sector_allocation = defaultdict(float)
+        asset_allocation = defaultdict(float)
         
         for position, asset in positions_data:
             current_price = current_prices.get(asset.symbol, {}).get("current_price", position.avg_cost)
@@ -910,43 +946,43 @@ async def get_portfolio_analytics(
             
             # Sector allocation (simplified - would need real sector data)
             sector = getattr(asset, 'sector', 'Other') or 'Other'
-            sector_allocation[sector] = sector_allocation.get(sector, 0.0) + market_value
+            sector_allocation[sector] += market_value
             
             # Asset type allocation
             asset_type = asset.type or 'stock'
-            asset_allocation[asset_type.capitalize()] = asset_allocation.get(asset_type.capitalize(), 0.0) + market_value
-        
-        # Convert to percentages
-        if total_value > 0:
-            sector_allocation = {k: (v / total_value * 100) for k, v in sector_allocation.items()}
-            asset_allocation = {k: (v / total_value * 100) for k, v in asset_allocation.items()}
-        
-        # Generate recommendations based on metrics
-        recommendations = []
+            asset_allocation[asset_type.capitalize()] += market_value
         
-        if metrics.get("diversification_score", 0) < 30:
-            recommendations.append("Portfolio is highly concentrated. Consider diversifying across more assets.")
+        if total_value <= 0:
+            # Liquidated or zero-valued portfolio: metrics would be meaningless
+            logger.info("Returned empty analytics for portfolio %s with no market value", portfolio_id)
+            return _empty_analytics(portfolio_id, _NO_VALUE_RECOMMENDATION)
         
-        if metrics.get("beta", 1.0) > 1.3:
-            recommendations.append("Portfolio has high market sensitivity. Consider reducing exposure to high-beta assets.")
-        
-        if metrics.get("sharpe_ratio", 0) < 0.5:
-            recommendations.append("Risk-adjusted returns are low. Consider rebalancing for better risk-return profile.")
+        # Calculate real portfolio metrics
+        metrics = await compute_portfolio_metrics_for_analytics(
+            portfolio_id, positions_data, current_prices
+        )
         
-        if metrics.get("volatility", 0) > 0.25:
-            recommendations.append("Portfolio volatility is high. Consider adding defensive positions to reduce risk.")
+        # Convert to percentages with a single scale factor per pass
+        scale = 100.0 / total_value
+        sector_allocation = {k: v * scale for k, v in sector_allocation.items()}
+        asset_allocation = {k: v * scale for k, v in asset_allocation.items()}
         
-        if not recommendations:
-            recommendations.append("Portfolio metrics are within acceptable ranges. Continue monitoring performance.")
+        # Generate recommendations based on metrics
+        recommendations = [
+            message for key, default, compare, threshold, message in _RULES
+            if compare(metrics.get(key, default), threshold)
+        ] or [_DEFAULT_RECOMMENDATION]
         
         # Calculate alpha (simplified: assume market return of 10%)
         market_return = 0.10
+        rf = metrics.get("risk_free_rate", 0.02)
         portfolio_return = metrics.get("annualized_return", 0.0)
         beta = metrics.get("beta", 1.0)
-        alpha = portfolio_return - (metrics.get("risk_free_rate", 0.02) + beta * (market_return - metrics.get("risk_free_rate", 0.02)))
+        volatility = metrics.get("volatility", 0.0)
+        alpha = portfolio_return - (rf + beta * (market_return - rf))
         
         # Calculate VaR (simplified: 95% VaR = -2 * volatility)
-        var_95 = -2.0 * metrics.get("volatility", 0.0) if metrics.get("volatility", 0.0) > 0 else 0.0
+        var_95 = -2.0 * volatility if volatility > 0 else 0.0
         expected_shortfall = var_95 * 1.5  # Simplified calculation
         
         analytics = PortfolioAnalyticsResponse(
@@ -954,14 +990,14 @@ async def get_portfolio_analytics(
             timestamp=datetime.utcnow().isoformat(),
             performance_metrics={
                 "total_return": metrics.get("total_return", 0.0) * 100,  # Convert to percentage
-                "annualized_return": metrics.get("annualized_return", 0.0) * 100,
-                "volatility": metrics.get("volatility", 0.0) * 100,
+                "annualized_return": portfolio_return * 100,
+                "volatility": volatility * 100,
                 "sharpe_ratio": metrics.get("sharpe_ratio", 0.0),
                 "max_drawdown": metrics.get("max_drawdown", 0.0) * 100,
                 "win_rate": 65.0  # Would need trade history to calculate accurately
             },
             risk_metrics={
-                "beta": metrics.get("beta", 1.0),
+                "beta": beta,
                 "alpha": alpha * 100,
                 "var_95": var_95,
                 "expected_shortfall": expected_shortfall
@@ -973,13 +1009,13 @@ async def get_portfolio_analytics(
             recommendations=recommendations
         )
         
-        logger.info(f"Successfully computed analytics for portfolio {portfolio_id}")
+        logger.info("Successfully computed analytics for portfolio %s", portfolio_id)
         return analytics
         
     except HTTPException:
         raise
-    except Exception as e:
-        logger.error(f"Error computing analytics for portfolio {portfolio_id}: {e}")
+    except Exception:
+        logger.exception("Error computing analytics for portfolio %s", portfolio_id)
         raise HTTPException(
             status_code=500,
             detail="Internal server error while computing analytics"
@@ -18,10 +18,13 @@ Features:
 - Rate limiting and validation
 """
 
+import time
+from functools import lru_cache
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Path
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field, validator
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -64,6 +67,16 @@ class HistoricalData(BaseModel):
     volume: int
 
 
+class ColumnarHistory(BaseModel):
+    """Column-oriented historical data (one list per OHLCV field)."""
+    dates: List[str] = []
+    open: List[float] = []
+    high: List[float] = []
+    low: List[float] = []
+    close: List[float] = []
+    volume: List[int] = []
+
+
 class PriceResponse(BaseModel):
     """Complete price response model."""
     symbol: str
@@ -80,6 +93,7 @@ class PriceResponse(BaseModel):
     asset_type: str
     period: str
     history: List[HistoricalData] = []
+    history_columns: Optional[ColumnarHistory] = None
     market_status: str = "unknown"
 
 
@@ -90,12 +104,13 @@ class MultiplePricesRequest(BaseModel):
     @validator('symbols')
     def validate_symbols(cls, v):
         """Validate symbol format."""
-        for symbol in v:
-            if not symbol or len(symbol.strip()) == 0:
+        normalized = [symbol.strip().upper() for symbol in v]
+        for symbol in normalized:
+            if not symbol:
                 raise ValueError("Symbol cannot be empty")
             if len(symbol) > 10:
                 raise ValueError("Symbol too long")
-        return [s.upper().strip() for s in v]
+        return normalized
 
 
 class MultiplePricesResponse(BaseModel):
@@ -131,10 +146,43 @@ class MarketSummaryResponse(BaseModel):
     most_active: List[Dict[str, Any]] = []
 
 
+def _build_columnar_history(history: Any) -> ColumnarHistory:
+    """
+    Build a ColumnarHistory from service history data.
+    
+    Accepts either a list of row dicts or a mapping of column arrays
+    (lists or NumPy arrays keyed by ColumnarHistory field names). Each
+    column is assigned in bulk, skipping per-row model validation.
+    
+    Args:
+        history: Row-oriented list or column-oriented mapping
+        
+    Returns:
+        ColumnarHistory: Column-oriented history
+    """
+    if isinstance(history, dict):
+        columns = {
+            field: (values.tolist() if hasattr(values, "tolist") else list(values))
+            for field, values in history.items()
+            if field in ColumnarHistory.__fields__
+        }
+        return ColumnarHistory.construct(**columns)
+    
+    return ColumnarHistory.construct(
+        dates=[str(h.get("date", "")) for h in history],
+        open=[float(h.get("open", 0.0)) for h in history],
+        high=[float(h.get("high", 0.0)) for h in history],
+        low=[float(h.get("low", 0.0)) for h in history],
+        close=[float(h.get("close", 0.0)) for h in history],
+        volume=[int(h.get("volume", 0)) for h in history]
+    )
+
+
 @router.get("/{symbol}", response_model=PriceResponse, summary="Get Current Price Data")
 async def get_price(
     symbol: str = Path(..., description="Asset symbol (e.g., AAPL, BTC, EURUSD)"),
     period: str = Query("1mo", description="Historical period (1d, 1wk, 1mo, 3mo, 6mo, 1y)"),
+    columnar: bool = Query(False, description="Return history as OHLCV columns instead of rows"),
     user=Depends(get_current_user)
 ) -> PriceResponse:
     """
@@ -146,9 +194,13 @@ async def get_price(
     - Historical data for the specified period
     - Asset type detection and market status
     
+    With ``columnar=true`` the history is returned in ``history_columns``
+    as six parallel lists rather than one object per bar.
+    
     Args:
         symbol: Asset symbol (stocks, crypto, forex)
         period: Historical period for analysis
+        columnar: Return history in column-oriented form
         user: Authenticated user
         
     Returns:
@@ -157,11 +209,11 @@ async def get_price(
     Raises:
         HTTPException: If symbol not found or data unavailable
     """
+    symbol_upper = symbol.strip().upper()
     try:
-        logger.info(f"Fetching price data for {symbol} (period: {period})")
+        logger.info("Fetching price data for %s (period: %s)", symbol_upper, period)
         
         # Validate symbol format
-        symbol_upper = symbol.upper().strip()
         if not symbol_upper or len(symbol_upper) > 10:
             raise HTTPException(
                 status_code=400,
@@ -173,20 +225,24 @@ async def get_price(
         if data is None:
             raise HTTPException(
                 status_code=404,
-                detail=f"Symbol '{symbol}' not found or data unavailable"
+                detail=f"Symbol '{symbol_upper}' not found or data unavailable"
             )
         
         # Convert history data
         history = []
-        for h in data.get("history", []):
-            history.append(HistoricalData(
-                date=h.get("date", ""),
-                open=h.get("open", 0.0),
-                high=h.get("high", 0.0),
-                low=h.get("low", 0.0),
-                close=h.get("close", 0.0),
-                volume=h.get("volume", 0)
-            ))
+        history_columns = None
+        if columnar:
+            history_columns = _build_columnar_history(data.get("history", []))
+        else:
+            for h in data.get("history", []):
+                history.append(HistoricalData(
+                    date=h.get("date", ""),
+                    open=h.get("open", 0.0),
+                    high=h.get("high", 0.0),
+                    low=h.get("low", 0.0),
+                    close=h.get("close", 0.0),
+                    volume=h.get("volume", 0)
+                ))
         
         # Determine market status (simplified)
         market_status = "open"  # In production, check actual market hours
@@ -206,133 +262,162 @@ async def get_price(
             asset_type=data.get("asset_type", "unknown"),
             period=period,
             history=history,
+            history_columns=history_columns,
             market_status=market_status
         )
         
-        logger.info(f"Successfully fetched price data for {symbol}")
+        logger.info("Successfully fetched price data for %s", symbol_upper)
         return response
         
     except HTTPException:
         raise
-    except Exception as e:
-        logger.error(f"Error fetching price data for {symbol}: {e}")
+    except Exception:
+        logger.exception("Error fetching price data for %s", symbol_upper)
         raise HTTPException(
             status_code=500,
             detail="Internal server error while fetching price data"
         )
 
 
-@router.post("/batch", response_model=MultiplePricesResponse, summary="Get Multiple Symbol Prices")
+def _price_payload(data: Dict[str, Any], timestamp: str) -> Dict[str, Any]:
+    """
+    Shape raw service price data into a PriceData-compatible dict.
+    
+    Args:
+        data: Price data returned by the market data service
+        timestamp: Fallback timestamp when the source provides none
+        
+    Returns:
+        Dict: Plain dict matching the PriceData schema
+    """
+    current_price = float(data["current_price"])
+    return {
+        "symbol": data["symbol"],
+        "current_price": current_price,
+        "change": float(data.get("change", 0.0)),
+        "change_percent": float(data.get("change_percent", 0.0)),
+        "volume": int(data.get("volume", 0)),
+        "high": float(data.get("high", current_price)),
+        "low": float(data.get("low", current_price)),
+        "open": float(data.get("open", current_price)),
+        "previous_close": float(data.get("previous_close", current_price)),
+        "source": data.get("source", "unknown"),
+        "timestamp": data.get("timestamp", timestamp)
+    }
+
+
+@router.post(
+    "/batch",
+    response_model=None,
+    responses={200: {"model": MultiplePricesResponse}},
+    summary="Get Multiple Symbol Prices"
+)
 async def get_multiple_prices_endpoint(
     request: MultiplePricesRequest,
     user=Depends(get_current_user)
-) -> MultiplePricesResponse:
+) -> ORJSONResponse:
     """
     Get current price data for multiple symbols in a single request.
     
     This endpoint efficiently fetches price data for up to 20 symbols
     concurrently, providing better performance than individual requests.
+    Prices are shaped into plain dicts and encoded with orjson, avoiding
+    per-item PriceData instances and pydantic serialization.
     
     Args:
         request: List of symbols to fetch
         user: Authenticated user
         
     Returns:
-        MultiplePricesResponse: Price data for all requested symbols
+        ORJSONResponse: Price data for all requested symbols (MultiplePricesResponse schema)
         
     Raises:
         HTTPException: If request validation fails
     """
     try:
-        logger.info(f"Fetching prices for {len(request.symbols)} symbols")
+        logger.info("Fetching prices for %d symbols", len(request.symbols))
         
         # Get prices for all symbols concurrently
         results = await get_multiple_prices(request.symbols)
         
         # Process results
+        timestamp = datetime.utcnow().isoformat()
         prices = {}
         errors = {}
         successful = 0
         
         for symbol in request.symbols:
-            if symbol in results and results[symbol] is not None:
-                data = results[symbol]
-                prices[symbol] = PriceData(
-                    symbol=data["symbol"],
-                    current_price=data["current_price"],
-                    change=data.get("change", 0.0),
-                    change_percent=data.get("change_percent", 0.0),
-                    volume=data.get("volume", 0),
-                    high=data.get("high", data["current_price"]),
-                    low=data.get("low", data["current_price"]),
-                    open=data.get("open", data["current_price"]),
-                    previous_close=data.get("previous_close", data["current_price"]),
-                    source=data.get("source", "unknown"),
-                    timestamp=data.get("timestamp", datetime.utcnow().isoformat())
-                )
+            data = results.get(symbol)
+            if data is not None:
+                prices[symbol] = _price_payload(data, timestamp)
                 successful += 1
             else:
                 prices[symbol] = None
                 errors[symbol] = "Data unavailable"
         
-        response = MultiplePricesResponse(
-            timestamp=datetime.utcnow().isoformat(),
-            total_symbols=len(request.symbols),
-            successful_requests=successful,
-            failed_requests=len(request.symbols) - successful,
-            prices=prices,
-            errors=errors
-        )
+        response = ORJSONResponse({
+            "timestamp": timestamp,
+            "total_symbols": len(request.symbols),
+            "successful_requests": successful,
+            "failed_requests": len(request.symbols) - successful,
+            "prices": prices,
+            "errors": errors
+        })
         
-        logger.info(f"Successfully fetched prices for {successful}/{len(request.symbols)} symbols")
+        logger.info("Successfully fetched prices for %d/%d symbols", successful, len(request.symbols))
         return response
         
-    except Exception as e:
-        logger.error(f"Error fetching multiple prices: {e}")
+    except Exception:
+        logger.exception("Error fetching multiple prices")
         raise HTTPException(
             status_code=500,
             detail="Internal server error while fetching multiple prices"
         )
 
 
-@router.post("/search", response_model=SymbolSearchResponse, summary="Search Symbols")
+@router.post(
+    "/search",
+    response_model=None,
+    responses={200: {"model": SymbolSearchResponse}},
+    summary="Search Symbols"
+)
 async def search_symbols_endpoint(
     request: SymbolSearchRequest,
     user=Depends(get_current_user)
-) -> SymbolSearchResponse:
+) -> ORJSONResponse:
     """
     Search for symbols matching a query string.
     
     This endpoint helps users find symbols by name or symbol code,
-    supporting both exact matches and partial matches.
+    supporting both exact matches and partial matches. The upstream results
+    are a plain passthrough, so they are encoded directly with orjson rather
+    than re-validated through SymbolSearchResponse.
     
     Args:
         request: Search query and parameters
         user: Authenticated user
         
     Returns:
-        SymbolSearchResponse: Matching symbols with metadata
+        ORJSONResponse: Matching symbols with metadata (SymbolSearchResponse schema)
         
     Raises:
         HTTPException: If search fails
     """
     try:
-        logger.info(f"Searching symbols for query: {request.query}")
+        logger.info("Searching symbols for query: %s", request.query)
         
         # Search for symbols
-        results = search_symbols(request.query, request.limit)
+        results = await search_symbols(request.query, request.limit)
         
-        response = SymbolSearchResponse(
-            query=request.query,
-            total_results=len(results),
-            symbols=results
-        )
-        
-        logger.info(f"Found {len(results)} symbols for query: {request.query}")
-        return response
+        logger.info("Found %d symbols for query: %s", len(results), request.query)
+        return ORJSONResponse({
+            "query": request.query,
+            "total_results": len(results),
+            "symbols": results
+        })
         
-    except Exception as e:
-        logger.error(f"Error searching symbols: {e}")
+    except Exception:
+        logger.exception("Error searching symbols")
         raise HTTPException(
             status_code=500,
             detail="Internal server error while searching symbols"
@@ -384,14 +469,45 @@ async def get_market_summary_endpoint(
         
     except HTTPException:
         raise
-    except Exception as e:
-        logger.error(f"Error fetching market summary: {e}")
+    except Exception:
+        logger.exception("Error fetching market summary")
         raise HTTPException(
             status_code=500,
             detail="Internal server error while fetching market summary"
         )
 
 
+@lru_cache(maxsize=2)
+def _market_status(epoch_minute: int) -> Dict[str, Any]:
+    """
+    Compute the market status for a given epoch minute.
+    
+    The result only changes at minute granularity, so it is memoized per
+    epoch minute; polling clients within the same minute share one dict.
+    
+    Args:
+        epoch_minute: Seconds since the epoch divided by 60
+        
+    Returns:
+        Dict: Market status information
+    """
+    # Simplified market status - in production, check actual market hours
+    current_time = datetime.utcfromtimestamp(epoch_minute * 60)
+    
+    # Basic market hours logic (simplified)
+    is_weekday = current_time.weekday() < 5
+    is_trading_hours = 9 <= current_time.hour < 16  # 9 AM - 4 PM UTC
+    
+    market_status = "open" if is_weekday and is_trading_hours else "closed"
+    
+    return {
+        "status": market_status,
+        "timestamp": current_time.isoformat(),
+        "next_open": "Next trading day at 9:00 AM UTC",
+        "next_close": "Today at 4:00 PM UTC" if is_trading_hours else "Next trading day at 4:00 PM UTC"
+    }
+
+
 @router.get("/market/status", summary="Get Market Status")
 async def get_market_status(user=Depends(get_current_user)) -> Dict[str, Any]:
     """
@@ -404,24 +520,10 @@ async def get_market_status(user=Depends(get_current_user)) -> Dict[str, Any]:
         Dict: Market status information
     """
     try:
-        # Simplified market status - in production, check actual market hours
-        current_time = datetime.utcnow()
-        
-        # Basic market hours logic (simplified)
-        is_weekday = current_time.weekday() < 5
-        is_trading_hours = 9 <= current_time.hour < 16  # 9 AM - 4 PM UTC
-        
-        market_status = "open" if is_weekday and is_trading_hours else "closed"
+        return _market_status(int(time.time() // 60))
         
-        return {
-            "status": market_status,
-            "timestamp": current_time.isoformat(),
-            "next_open": "Next trading day at 9:00 AM UTC",
-            "next_close": "Today at 4:00 PM UTC" if is_trading_hours else "Next trading day at 4:00 PM UTC"
-        }
-        
-    except Exception as e:
-        logger.error(f"Error fetching market status: {e}")
+    except Exception:
+        logger.exception("Error fetching market status")
         raise HTTPException(
             status_code=500,
             detail="Internal server error while fetching market status"
@@ -443,8 +545,8 @@ async def validate_symbol(
     Returns:
         Dict: Validation result and symbol information
     """
+    symbol_upper = symbol.strip().upper()
     try:
-        symbol_upper = symbol.upper().strip()
         
         # Try to get basic price data to validate symbol
         data = await get_price_with_history(symbol_upper, "1d")
@@ -465,12 +567,10 @@ async def validate_symbol(
                 "error": "Symbol not found or data unavailable"
             }
             
-    except Exception as e:
-        logger.error(f"Error validating symbol {symbol}: {e}")
+    except Exception:
+        logger.exception("Error validating symbol %s", symbol_upper)
         return {
             "valid": False,
-            "symbol": symbol.upper(),
+            "symbol": symbol_upper,
             "error": "Validation failed"
         }
-
-
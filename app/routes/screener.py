@@ -19,23 +19,86 @@ Features:
 - Market breadth indicators
 """
 
-from typing import List, Optional, Dict, Any
-from datetime import datetime, timedelta
+import asyncio
+import hashlib
+import heapq
+from bisect import bisect_left
+import time
+from collections import Counter
+from typing import List, Optional, Dict, Any, Tuple
 from enum import Enum
+from types import MappingProxyType
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Path
+import numpy as np
+import orjson
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Path, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel, Field, validator
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.security import get_current_user
 from app.core.database import get_db
 from app.core.logging import get_logger
+from app.core.utils import utc_iso_now
 from app.services.alphavantage_service import get_multiple_prices
 from app.services.analysis_service import compute_signal_bundle, get_market_overview
-from app.services.asset_service import batch_get_metadata, get_sector_for_symbol, get_industry_for_symbol
+from app.services.asset_service import batch_get_metadata, get_default_classification
+from app.services.screener_kernels import get_scoring_kernel
 
 logger = get_logger(__name__)
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Maximum concurrent signal computations per screening request
+SIGNAL_CONCURRENCY = 32
+
+# Universe of symbols to screen, de-duplicated in order
+# In production, this would come from a comprehensive asset database
+SCREENING_UNIVERSE: Tuple[str, ...] = tuple(dict.fromkeys([
+    "AAPL", "GOOGL", "MSFT", "AMZN", "TSLA", "NVDA", "META", "NFLX",
+    "ADBE", "CRM", "ORCL", "INTC", "AMD", "QCOM", "AVGO", "TXN",
+    "JPM", "BAC", "WFC", "GS", "MS", "C", "AXP", "V", "MA",
+    "JNJ", "PFE", "UNH", "ABBV", "MRK", "TMO", "ABT", "DHR",
+    "KO", "PEP", "WMT", "PG", "JPM", "HD", "DIS", "NKE"
+]))
+
+# Broad market universe used for breadth analysis
+BREADTH_UNIVERSE: Tuple[str, ...] = tuple(dict.fromkeys([
+    "AAPL", "GOOGL", "MSFT", "AMZN", "TSLA", "NVDA", "META", "NFLX",
+    "JPM", "BAC", "WFC", "GS", "MS", "C", "AXP", "V", "MA",
+    "JNJ", "PFE", "UNH", "ABBV", "MRK", "TMO", "ABT", "DHR",
+    "KO", "PEP", "WMT", "PG", "HD", "DIS", "NKE", "BA", "CAT"
+]))
+
+# Sectors and their representative symbols
+SECTOR_UNIVERSES = MappingProxyType({
+    "Technology": ("AAPL", "GOOGL", "MSFT", "NVDA", "META"),
+    "Healthcare": ("JNJ", "PFE", "UNH", "ABBV", "MRK"),
+    "Financial": ("JPM", "BAC", "WFC", "GS", "MS"),
+    "Consumer": ("KO", "PEP", "WMT", "PG", "HD"),
+    "Industrial": ("BA", "CAT", "GE", "MMM", "HON"),
+    "Energy": ("XOM", "CVX", "COP", "EOG", "SLB")
+})
+
+# Flattened sector membership: symbol per member and its sector index
+_SECTOR_MEMBERS: Tuple[str, ...] = tuple(s for symbols in SECTOR_UNIVERSES.values() for s in symbols)
+_SECTOR_MEMBER_IDS = np.fromiter(
+    (i for i, symbols in enumerate(SECTOR_UNIVERSES.values()) for _ in symbols), dtype=np.intp
+)
+_SECTOR_MEMBER_IDS.flags.writeable = False
+_SECTOR_ALL_SYMBOLS: Tuple[str, ...] = tuple(dict.fromkeys(_SECTOR_MEMBERS))
+
+# Short-lived price cache shared by screening endpoints
+PRICE_CACHE_TTL = 30.0
+PRICE_CACHE_MAXSIZE = 64
+_price_cache: Dict[Tuple[str, ...], Tuple[float, Dict[str, Any]]] = {}
+
+# Market sentiment bands: breadth above each threshold moves up one label
+_SENTIMENT_THRESHOLDS = (-0.3, -0.1, 0.1, 0.3)
+_SENTIMENT_LABELS = ("Very Bearish", "Bearish", "Neutral", "Bullish", "Very Bullish")
+
+# Numeric signal codes for vectorized scoring (HOLD is 0)
+_SIGNAL_CODES = {"BUY": 1, "HOLD": 0, "SELL": -1}
 
 
 class ScreeningStrategy(str, Enum):
@@ -110,7 +173,7 @@ class SectorAnalysisResponse(BaseModel):
     """Response model for sector analysis."""
     timestamp: str
     sectors: List[Dict[str, Any]]
-    sector_rotation_signals: Dict[str, str]
+    sector_rotation_signals: Dict[str, Any]
     top_performing_sectors: List[str]
     bottom_performing_sectors: List[str]
 
@@ -121,16 +184,16 @@ class MarketBreadthResponse(BaseModel):
     advancing_stocks: int
     declining_stocks: int
     unchanged_stocks: int
-    advance_decline_ratio: float
+    advance_decline_ratio: Optional[float] = None  # None when there are no declining stocks
     new_highs: int
     new_lows: int
     market_sentiment: str
     breadth_indicator: float
 
 
-# Pre-defined screening strategies
+# Pre-defined screening strategies, keyed by ScreeningStrategy value
 SCREENING_STRATEGIES = {
-    ScreeningStrategy.MOMENTUM: {
+    "momentum": {
         "name": "Momentum Strategy",
         "description": "Stocks with strong price momentum and volume",
         "criteria": {
@@ -140,7 +203,7 @@ SCREENING_STRATEGIES = {
             "rsi_min": 30
         }
     },
-    ScreeningStrategy.VALUE: {
+    "value": {
         "name": "Value Strategy",
         "description": "Undervalued stocks with strong fundamentals",
         "criteria": {
@@ -150,7 +213,7 @@ SCREENING_STRATEGIES = {
             "price_min": 5.0
         }
     },
-    ScreeningStrategy.GROWTH: {
+    "growth": {
         "name": "Growth Strategy",
         "description": "High-growth stocks with strong earnings",
         "criteria": {
@@ -160,7 +223,7 @@ SCREENING_STRATEGIES = {
             "price_min": 10.0
         }
     },
-    ScreeningStrategy.QUALITY: {
+    "quality": {
         "name": "Quality Strategy",
         "description": "High-quality stocks with strong balance sheets",
         "criteria": {
@@ -170,7 +233,7 @@ SCREENING_STRATEGIES = {
             "beta_max": 1.2
         }
     },
-    ScreeningStrategy.DIVIDEND: {
+    "dividend": {
         "name": "Dividend Strategy",
         "description": "High dividend yield stocks",
         "criteria": {
@@ -180,7 +243,7 @@ SCREENING_STRATEGIES = {
             "volume_min": 100000
         }
     },
-    ScreeningStrategy.LOW_VOLATILITY: {
+    "low_volatility": {
         "name": "Low Volatility Strategy",
         "description": "Stable, low-risk stocks",
         "criteria": {
@@ -190,7 +253,7 @@ SCREENING_STRATEGIES = {
             "market_cap_min": 500000000
         }
     },
-    ScreeningStrategy.HIGH_BETA: {
+    "high_beta": {
         "name": "High Beta Strategy",
         "description": "High-beta stocks for aggressive growth",
         "criteria": {
@@ -200,7 +263,7 @@ SCREENING_STRATEGIES = {
             "price_min": 5.0
         }
     },
-    ScreeningStrategy.TECHNICAL: {
+    "technical": {
         "name": "Technical Strategy",
         "description": "Stocks with strong technical signals",
         "criteria": {
@@ -212,12 +275,68 @@ SCREENING_STRATEGIES = {
     }
 }
 
+SCREENING_STRATEGIES = MappingProxyType(SCREENING_STRATEGIES)
+
+
+# Static /strategies payload and its validator, computed once per process
+_STRATEGIES_PAYLOAD = {
+    "strategies": dict(SCREENING_STRATEGIES),
+    "total_strategies": len(SCREENING_STRATEGIES),
+    "custom_filters_available": True
+}
+_STRATEGIES_ETAG = '"{}"'.format(hashlib.md5(
+    orjson.dumps(_STRATEGIES_PAYLOAD, option=orjson.OPT_SORT_KEYS)
+).hexdigest())
+_STRATEGIES_HEADERS = {
+    "ETag": _STRATEGIES_ETAG,
+    "Cache-Control": "public, max-age=3600"
+}
+
+
+async def _cached_prices(symbols: Tuple[str, ...]) -> Dict[str, Any]:
+    """
+    Fetch prices through a short TTL cache keyed on the sorted symbol set.
+    
+    Overlapping screener requests within PRICE_CACHE_TTL seconds share one
+    upstream fetch. The returned mapping is shared and must not be mutated.
+    
+    Args:
+        symbols: Symbols to fetch
+        
+    Returns:
+        Dict: Mapping of symbol to price data (or None)
+    """
+    key = tuple(sorted(set(symbols)))
+    now = time.monotonic()
+    
+    cached = _price_cache.get(key)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+    
+    prices = await get_multiple_prices(list(key))
+    
+    if len(_price_cache) >= PRICE_CACHE_MAXSIZE:
+        # Drop expired entries first, then the oldest insertion
+        for stale in [k for k, (expires, _) in _price_cache.items() if expires <= now]:
+            del _price_cache[stale]
+        if len(_price_cache) >= PRICE_CACHE_MAXSIZE:
+            del _price_cache[next(iter(_price_cache))]
+    _price_cache[key] = (now + PRICE_CACHE_TTL, prices)
+    
+    return prices
+
 
-@router.post("/", response_model=ScreeningResponse, summary="Screen Assets")
+@router.post(
+    "/",
+    response_model=None,
+    responses={200: {"model": ScreeningResponse}},
+    summary="Screen Assets"
+)
 async def screen_assets(
     request: ScreeningRequest,
+    stream: bool = Query(False, description="Stream results as NDJSON (header line, then one asset per line)"),
     user=Depends(get_current_user)
-) -> ScreeningResponse:
+) -> ORJSONResponse:
     """
     Screen assets based on specified criteria and strategies.
     
@@ -228,12 +347,17 @@ async def screen_assets(
     - Technical indicator-based screening
     - Performance scoring and ranking
     
+    With ``stream=true`` the response is NDJSON: the first line holds the
+    ScreeningResponse fields except ``assets``, followed by one line per
+    screened asset in rank order.
+    
     Args:
         request: Screening criteria and parameters
+        stream: Stream results as NDJSON
         user: Authenticated user
         
     Returns:
-        ScreeningResponse: Screened assets with analysis
+        ORJSONResponse: Screened assets with analysis (ScreeningResponse schema)
         
     Raises:
         HTTPException: If screening fails
@@ -242,27 +366,23 @@ async def screen_assets(
         logger.info(f"Screening assets with strategy: {request.strategy}")
         
         # Get universe of symbols to screen
-        # In production, this would come from a comprehensive asset database
-        universe_symbols = [
-            "AAPL", "GOOGL", "MSFT", "AMZN", "TSLA", "NVDA", "META", "NFLX",
-            "ADBE", "CRM", "ORCL", "INTC", "AMD", "QCOM", "AVGO", "TXN",
-            "JPM", "BAC", "WFC", "GS", "MS", "C", "AXP", "V", "MA",
-            "JNJ", "PFE", "UNH", "ABBV", "MRK", "TMO", "ABT", "DHR",
-            "KO", "PEP", "WMT", "PG", "JPM", "HD", "DIS", "NKE"
-        ]
+        universe_symbols = SCREENING_UNIVERSE
         
         # Apply strategy-specific criteria
-        if request.strategy and request.strategy in SCREENING_STRATEGIES:
-            strategy_criteria = SCREENING_STRATEGIES[request.strategy]["criteria"]
+        strategy_config = SCREENING_STRATEGIES.get(request.strategy.value) if request.strategy else None
+        if strategy_config is not None:
+            strategy_criteria = strategy_config["criteria"]
             logger.info(f"Applying {request.strategy} strategy criteria")
         
         # Get current prices and signals for universe
-        price_data = await get_multiple_prices(universe_symbols)
+        price_data = await _cached_prices(universe_symbols)
         
         # Screen assets based on criteria
         screened_assets = []
         filters_applied = []
         
+        # Pass 1: apply cheap price/volume filters
+        candidates = []
         for symbol in universe_symbols:
             if symbol not in price_data or price_data[symbol] is None:
                 continue
@@ -277,81 +397,119 @@ async def screen_assets(
             if request.volume_min and data.get("volume", 0) < request.volume_min:
                 continue
             
-            # Get technical analysis
-            signal_data = await compute_signal_bundle(symbol)
-            
-            # Get asset metadata
-            asset_metadata = await batch_get_metadata([symbol])
-            metadata = asset_metadata.get(symbol, {})
-            
-            # Get fundamentals if available
-            from app.services.asset_service import get_fundamentals
-            fundamentals = await get_fundamentals(symbol)
+            candidates.append(symbol)
+        
+        # Pass 2: compute technical analysis for all candidates concurrently
+        semaphore = asyncio.Semaphore(SIGNAL_CONCURRENCY)
+        
+        async def bounded_signal(symbol: str) -> Optional[Dict[str, Any]]:
+            async with semaphore:
+                return await compute_signal_bundle(symbol)
+        
+        signals = await asyncio.gather(
+            *(bounded_signal(symbol) for symbol in candidates),
+            return_exceptions=True
+        )
+        
+        # Fetch metadata (which includes fundamentals) once for all candidates
+        asset_metadata = await batch_get_metadata(candidates)
+        
+        rows = []
+        signal_list = []
+        for symbol, signal_data in zip(candidates, signals):
+            if isinstance(signal_data, Exception):
+                logger.warning(f"Signal computation failed for {symbol}: {signal_data}")
+                signal_data = None
             
-            # Calculate score based on strategy
-            score = calculate_screening_score(symbol, data, signal_data, request.strategy)
+            data = price_data[symbol]
+            metadata = asset_metadata.get(symbol) or {}
             
-            # Create screened asset with real metadata
-            sector = metadata.get("sector") or await get_sector_for_symbol(symbol)
-            industry = metadata.get("industry") or await get_industry_for_symbol(symbol)
+            # Create screened asset fields with real metadata
+            default_sector, default_industry = get_default_classification(symbol)
+            sector = metadata.get("sector") or default_sector
+            industry = metadata.get("industry") or default_industry
             
-            asset = ScreenedAsset(
+            # Values are cast here once since rows are returned without validation
+            rows.append(dict(
                 symbol=symbol,
-                name=metadata.get("name", f"{symbol} Corporation"),
-                sector=sector,
-                industry=industry,
-                price=data["current_price"],
-                change=data.get("change", 0.0),
-                change_percent=data.get("change_percent", 0.0),
-                volume=data.get("volume", 0),
-                market_cap=fundamentals.get("market_cap") or (data.get("current_price", 0) * 1000000),  # Use real if available
-                pe_ratio=fundamentals.get("pe_ratio"),
-                pb_ratio=fundamentals.get("pb_ratio"),
-                dividend_yield=fundamentals.get("dividend_yield"),
-                beta=fundamentals.get("beta") or metadata.get("beta", 1.0),
-                score=score,
-                rank=0,  # Will be set after sorting
-                signal=signal_data["signal"] if signal_data else "HOLD",
-                confidence=signal_data["confidence"] if signal_data else 50.0
-            )
-            
-            screened_assets.append(asset)
-        
-        # Sort by score and assign ranks
-        screened_assets.sort(key=lambda x: x.score, reverse=True)
-        for i, asset in enumerate(screened_assets):
-            asset.rank = i + 1
-        
-        # Apply limit
-        screened_assets = screened_assets[:request.limit]
+                name=str(metadata.get("name", f"{symbol} Corporation")),
+                sector=str(sector),
+                industry=str(industry),
+                price=float(data["current_price"]),
+                change=float(data.get("change", 0.0)),
+                change_percent=float(data.get("change_percent", 0.0)),
+                volume=int(data.get("volume", 0)),
+                market_cap=float(metadata.get("market_cap") or (data.get("current_price", 0) * 1000000)),  # Use real if available
+                pe_ratio=metadata.get("pe_ratio"),
+                pb_ratio=metadata.get("pb_ratio"),
+                dividend_yield=metadata.get("dividend_yield"),
+                beta=float(metadata.get("beta") or 1.0),
+                signal=str(signal_data["signal"]) if signal_data else "HOLD",
+                confidence=float(signal_data["confidence"]) if signal_data else 50.0
+            ))
+            signal_list.append(signal_data)
+        
+        # Score all assets at once on column arrays
+        change_pct = np.fromiter(
+            (row["change_percent"] for row in rows), dtype=np.float64, count=len(rows)
+        )
+        confidence = np.fromiter(
+            (s.get("confidence", 50) if s else 50 for s in signal_list), dtype=np.float64, count=len(rows)
+        )
+        signal_codes = np.fromiter(
+            (_SIGNAL_CODES.get(s.get("signal"), 0) if s else 0 for s in signal_list), dtype=np.int8, count=len(rows)
+        )
+        has_signal = np.fromiter((bool(s) for s in signal_list), dtype=bool, count=len(rows))
+        scores = calculate_screening_scores(change_pct, confidence, signal_codes, has_signal, request.strategy)
+        
+        # Select the top results by score (ties keep universe order)
+        score_list = scores.tolist()
+        top = heapq.nlargest(request.limit, range(len(score_list)), key=score_list.__getitem__)
+        screened_assets = [
+            {**rows[i], "score": score_list[i], "rank": rank}
+            for rank, i in enumerate(top, start=1)
+        ]
         
-        # Calculate sector breakdown
-        sector_breakdown = {}
+        # Calculate sector breakdown and performance summary in one pass
+        sector_breakdown = Counter()
+        signal_counts = Counter()
+        score_sum = change_sum = 0.0
         for asset in screened_assets:
-            sector_breakdown[asset.sector] = sector_breakdown.get(asset.sector, 0) + 1
+            sector_breakdown[asset["sector"]] += 1
+            signal_counts[asset["signal"]] += 1
+            score_sum += asset["score"]
+            change_sum += asset["change_percent"]
         
-        # Calculate performance summary
+        result_count = len(screened_assets)
         performance_summary = {
-            "average_score": sum(a.score for a in screened_assets) / len(screened_assets) if screened_assets else 0,
-            "average_change": sum(a.change_percent for a in screened_assets) / len(screened_assets) if screened_assets else 0,
-            "buy_signals": sum(1 for a in screened_assets if a.signal == "BUY"),
-            "sell_signals": sum(1 for a in screened_assets if a.signal == "SELL"),
-            "hold_signals": sum(1 for a in screened_assets if a.signal == "HOLD")
+            "average_score": score_sum / result_count if result_count else 0,
+            "average_change": change_sum / result_count if result_count else 0,
+            "buy_signals": signal_counts["BUY"],
+            "sell_signals": signal_counts["SELL"],
+            "hold_signals": signal_counts["HOLD"]
         }
         
-        response = ScreeningResponse(
-            strategy=request.strategy.value if request.strategy else "custom",
-            timestamp=datetime.utcnow().isoformat(),
-            total_assets_screened=len(universe_symbols),
-            total_results=len(screened_assets),
-            filters_applied=filters_applied,
-            assets=screened_assets,
-            sector_breakdown=sector_breakdown,
-            performance_summary=performance_summary
-        )
+        header = {
+            "strategy": request.strategy.value if request.strategy else "custom",
+            "timestamp": utc_iso_now(),
+            "total_assets_screened": len(universe_symbols),
+            "total_results": len(screened_assets),
+            "filters_applied": filters_applied,
+            "sector_breakdown": dict(sector_breakdown),
+            "performance_summary": performance_summary
+        }
         
         logger.info(f"Successfully screened {len(screened_assets)} assets from {len(universe_symbols)} universe")
-        return response
+        
+        if stream:
+            async def ndjson_lines():
+                yield orjson.dumps(header) + b"\n"
+                for asset in screened_assets:
+                    yield orjson.dumps(asset) + b"\n"
+            
+            return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+        
+        return ORJSONResponse({**header, "assets": screened_assets})
         
     except Exception as e:
         logger.error(f"Error screening assets: {e}")
@@ -362,24 +520,37 @@ async def screen_assets(
 
 
 @router.get("/strategies", summary="Get Available Strategies")
-async def get_screening_strategies(user=Depends(get_current_user)) -> Dict[str, Any]:
+async def get_screening_strategies(
+    request: Request,
+    response: Response,
+    user=Depends(get_current_user)
+) -> Dict[str, Any]:
     """
     Get available screening strategies and their criteria.
     
+    The payload is static per process, so it is built once at import time
+    and served with an ETag; clients sending a matching If-None-Match get
+    an empty 304 response.
+    
     Returns:
         Dict: Available strategies with descriptions and criteria
     """
-    return {
-        "strategies": SCREENING_STRATEGIES,
-        "total_strategies": len(SCREENING_STRATEGIES),
-        "custom_filters_available": True
-    }
+    if request.headers.get("if-none-match") == _STRATEGIES_ETAG:
+        return Response(status_code=304, headers=_STRATEGIES_HEADERS)
+    
+    response.headers.update(_STRATEGIES_HEADERS)
+    return _STRATEGIES_PAYLOAD
 
 
-@router.get("/sectors", response_model=SectorAnalysisResponse, summary="Get Sector Analysis")
+@router.get(
+    "/sectors",
+    response_model=None,
+    responses={200: {"model": SectorAnalysisResponse}},
+    summary="Get Sector Analysis"
+)
 async def get_sector_analysis(
     user=Depends(get_current_user)
-) -> SectorAnalysisResponse:
+) -> ORJSONResponse:
     """
     Get comprehensive sector analysis and rotation signals.
     
@@ -387,7 +558,7 @@ async def get_sector_analysis(
         user: Authenticated user
         
     Returns:
-        SectorAnalysisResponse: Sector analysis data
+        ORJSONResponse: Sector analysis data (SectorAnalysisResponse schema)
         
     Raises:
         HTTPException: If sector analysis fails
@@ -395,46 +566,55 @@ async def get_sector_analysis(
     try:
         logger.info("Computing sector analysis")
         
-        # Define sectors and their representative symbols
-        sectors = {
-            "Technology": ["AAPL", "GOOGL", "MSFT", "NVDA", "META"],
-            "Healthcare": ["JNJ", "PFE", "UNH", "ABBV", "MRK"],
-            "Financial": ["JPM", "BAC", "WFC", "GS", "MS"],
-            "Consumer": ["KO", "PEP", "WMT", "PG", "HD"],
-            "Industrial": ["BA", "CAT", "GE", "MMM", "HON"],
-            "Energy": ["XOM", "CVX", "COP", "EOG", "SLB"]
-        }
+        sector_names = list(SECTOR_UNIVERSES)
+        sector_count = len(sector_names)
+        
+        # Fetch prices for all sectors at once and overviews concurrently
+        price_data, overviews = await asyncio.gather(
+            _cached_prices(_SECTOR_ALL_SYMBOLS),
+            asyncio.gather(*(get_market_overview(list(symbols)) for symbols in SECTOR_UNIVERSES.values()))
+        )
         
-        sector_analysis = []
-        sector_performance = {}
+        # Reduce per sector with bincount over the precomputed member ids
+        member_ids = _SECTOR_MEMBER_IDS
+        member_prices = [price_data.get(s) for s in _SECTOR_MEMBERS]
+        prices = np.fromiter(
+            (data["current_price"] if data else 0.0 for data in member_prices), dtype=np.float64
+        )
+        has_price = np.fromiter((bool(data) for data in member_prices), dtype=np.float64)
+        price_sums = np.bincount(member_ids, weights=prices, minlength=sector_count)
+        price_counts = np.bincount(member_ids, weights=has_price, minlength=sector_count)
+        avg_prices = np.divide(
+            price_sums, price_counts, out=np.zeros(sector_count), where=price_counts > 0
+        )
         
-        for sector_name, symbols in sectors.items():
-            # Get sector performance
-            price_data = await get_multiple_prices(symbols)
-            sector_signals = await get_market_overview(symbols)
-            
-            # Calculate sector metrics
-            valid_prices = [data["current_price"] for data in price_data.values() if data]
-            avg_price = sum(valid_prices) / len(valid_prices) if valid_prices else 0
-            
-            buy_signals = sum(1 for s in sector_signals.get("symbols", {}).values() 
-                             if s.get("signal") == "BUY")
-            total_signals = len(sector_signals.get("symbols", {}))
-            
-            sector_performance[sector_name] = {
-                "average_price": avg_price,
-                "buy_signal_ratio": buy_signals / total_signals if total_signals > 0 else 0,
-                "symbols_count": len(symbols)
-            }
-            
-            sector_analysis.append({
+        signal_ids = np.fromiter(
+            (i for i, overview in enumerate(overviews) for _ in overview.get("symbols", {})), dtype=np.intp
+        )
+        is_buy = np.fromiter(
+            (s.get("signal") == "BUY" for overview in overviews for s in overview.get("symbols", {}).values()),
+            dtype=np.float64
+        )
+        buy_counts = np.bincount(signal_ids, weights=is_buy, minlength=sector_count).astype(int)
+        total_counts = np.bincount(signal_ids, minlength=sector_count)
+        signal_ratios = np.divide(
+            buy_counts, total_counts, out=np.zeros(sector_count), where=total_counts > 0
+        )
+        
+        sector_analysis = [
+            {
                 "sector": sector_name,
                 "performance": avg_price,
                 "buy_signals": buy_signals,
                 "total_signals": total_signals,
-                "signal_ratio": buy_signals / total_signals if total_signals > 0 else 0,
+                "signal_ratio": signal_ratio,
                 "trend": "bullish" if buy_signals > total_signals / 2 else "bearish"
-            })
+            }
+            for sector_name, avg_price, buy_signals, total_signals, signal_ratio in zip(
+                sector_names, avg_prices.tolist(), buy_counts.tolist(),
+                total_counts.tolist(), signal_ratios.tolist()
+            )
+        ]
         
         # Sort sectors by performance
         sector_analysis.sort(key=lambda x: x["signal_ratio"], reverse=True)
@@ -449,13 +629,13 @@ async def get_sector_analysis(
             "rotation_signal": "Technology to Healthcare" if "Technology" in top_sectors else "No clear rotation"
         }
         
-        response = SectorAnalysisResponse(
-            timestamp=datetime.utcnow().isoformat(),
-            sectors=sector_analysis,
-            sector_rotation_signals=sector_rotation_signals,
-            top_performing_sectors=top_sectors,
-            bottom_performing_sectors=bottom_sectors
-        )
+        response = ORJSONResponse({
+            "timestamp": utc_iso_now(),
+            "sectors": sector_analysis,
+            "sector_rotation_signals": sector_rotation_signals,
+            "top_performing_sectors": top_sectors,
+            "bottom_performing_sectors": bottom_sectors
+        })
         
         logger.info("Successfully computed sector analysis")
         return response
@@ -468,10 +648,15 @@ async def get_sector_analysis(
         )
 
 
-@router.get("/breadth", response_model=MarketBreadthResponse, summary="Get Market Breadth")
+@router.get(
+    "/breadth",
+    response_model=None,
+    responses={200: {"model": MarketBreadthResponse}},
+    summary="Get Market Breadth"
+)
 async def get_market_breadth(
     user=Depends(get_current_user)
-) -> MarketBreadthResponse:
+) -> ORJSONResponse:
     """
     Get market breadth analysis and sentiment indicators.
     
@@ -479,7 +664,7 @@ async def get_market_breadth(
         user: Authenticated user
         
     Returns:
-        MarketBreadthResponse: Market breadth data
+        ORJSONResponse: Market breadth data (MarketBreadthResponse schema)
         
     Raises:
         HTTPException: If breadth analysis fails
@@ -487,54 +672,35 @@ async def get_market_breadth(
     try:
         logger.info("Computing market breadth analysis")
         
-        # Get broad market symbols
-        market_symbols = [
-            "AAPL", "GOOGL", "MSFT", "AMZN", "TSLA", "NVDA", "META", "NFLX",
-            "JPM", "BAC", "WFC", "GS", "MS", "C", "AXP", "V", "MA",
-            "JNJ", "PFE", "UNH", "ABBV", "MRK", "TMO", "ABT", "DHR",
-            "KO", "PEP", "WMT", "PG", "HD", "DIS", "NKE", "BA", "CAT"
-        ]
-        
-        # Get market signals
-        market_signals = await get_market_overview(market_symbols)
+        # Get market signals for the broad market universe
+        market_signals = await get_market_overview(list(BREADTH_UNIVERSE))
         
         # Calculate breadth metrics
-        advancing_stocks = sum(1 for s in market_signals.get("symbols", {}).values() 
-                              if s.get("signal") == "BUY")
-        declining_stocks = sum(1 for s in market_signals.get("symbols", {}).values() 
-                              if s.get("signal") == "SELL")
-        unchanged_stocks = sum(1 for s in market_signals.get("symbols", {}).values() 
-                              if s.get("signal") == "HOLD")
+        signal_counts = Counter(s.get("signal") for s in market_signals.get("symbols", {}).values())
+        advancing_stocks = signal_counts["BUY"]
+        declining_stocks = signal_counts["SELL"]
+        unchanged_stocks = signal_counts["HOLD"]
         
         total_stocks = advancing_stocks + declining_stocks + unchanged_stocks
-        advance_decline_ratio = advancing_stocks / declining_stocks if declining_stocks > 0 else float('inf')
+        advance_decline_ratio = advancing_stocks / declining_stocks if declining_stocks else None
         
         # Calculate breadth indicator (simplified)
         breadth_indicator = (advancing_stocks - declining_stocks) / total_stocks if total_stocks > 0 else 0
         
         # Determine market sentiment
-        if breadth_indicator > 0.3:
-            market_sentiment = "Very Bullish"
-        elif breadth_indicator > 0.1:
-            market_sentiment = "Bullish"
-        elif breadth_indicator > -0.1:
-            market_sentiment = "Neutral"
-        elif breadth_indicator > -0.3:
-            market_sentiment = "Bearish"
-        else:
-            market_sentiment = "Very Bearish"
-        
-        response = MarketBreadthResponse(
-            timestamp=datetime.utcnow().isoformat(),
-            advancing_stocks=advancing_stocks,
-            declining_stocks=declining_stocks,
-            unchanged_stocks=unchanged_stocks,
-            advance_decline_ratio=advance_decline_ratio,
-            new_highs=advancing_stocks // 2,  # Placeholder
-            new_lows=declining_stocks // 2,   # Placeholder
-            market_sentiment=market_sentiment,
-            breadth_indicator=breadth_indicator
-        )
+        market_sentiment = _SENTIMENT_LABELS[bisect_left(_SENTIMENT_THRESHOLDS, breadth_indicator)]
+        
+        response = ORJSONResponse({
+            "timestamp": utc_iso_now(),
+            "advancing_stocks": advancing_stocks,
+            "declining_stocks": declining_stocks,
+            "unchanged_stocks": unchanged_stocks,
+            "advance_decline_ratio": advance_decline_ratio,
+            "new_highs": advancing_stocks // 2,  # Placeholder
+            "new_lows": declining_stocks // 2,   # Placeholder
+            "market_sentiment": market_sentiment,
+            "breadth_indicator": breadth_indicator
+        })
         
         logger.info(f"Successfully computed market breadth: {market_sentiment}")
         return response
@@ -547,34 +713,47 @@ async def get_market_breadth(
         )
 
 
-def calculate_screening_score(symbol: str, price_data: Dict, signal_data: Optional[Dict], strategy: Optional[ScreeningStrategy]) -> float:
-    """Calculate screening score based on strategy."""
-    score = 50.0  # Base score
+def calculate_screening_scores(
+    change_percent: np.ndarray,
+    confidence: np.ndarray,
+    signal_codes: np.ndarray,
+    has_signal: np.ndarray,
+    strategy: Optional[ScreeningStrategy]
+) -> np.ndarray:
+    """
+    Calculate screening scores for many assets at once based on strategy.
     
-    if not price_data or not signal_data:
-        return score
+    Args:
+        change_percent: Price change percentages per asset
+        confidence: Signal confidence per asset
+        signal_codes: Signal codes per asset (BUY=1, HOLD=0, SELL=-1)
+        has_signal: Whether signal data was available per asset
+        strategy: Screening strategy
+        
+    Returns:
+        np.ndarray: Scores clipped to the 0-100 range
+    """
+    # Use the compiled kernel when numba is available
+    kernel = get_scoring_kernel(strategy.value if strategy else None)
+    if kernel is not None:
+        return kernel(change_percent, confidence, signal_codes, has_signal)
+    
+    score = np.full(change_percent.shape, 50.0)  # Base score
     
     # Strategy-specific scoring
     if strategy == ScreeningStrategy.MOMENTUM:
-        score += price_data.get("change_percent", 0) * 2
-        score += min(signal_data.get("confidence", 50), 100) * 0.3
-        if signal_data.get("signal") == "BUY":
-            score += 20
+        score += change_percent * 2
+        score += np.minimum(confidence, 100) * 0.3
+        score += 20.0 * (signal_codes == 1)
     elif strategy == ScreeningStrategy.VALUE:
         # Placeholder for value metrics
-        score += 30 if price_data.get("change_percent", 0) < 5 else 10
+        score += np.where(change_percent < 5, 30.0, 10.0)
     elif strategy == ScreeningStrategy.GROWTH:
-        score += price_data.get("change_percent", 0) * 1.5
-        score += signal_data.get("confidence", 50) * 0.2
+        score += change_percent * 1.5
+        score += confidence * 0.2
     elif strategy == ScreeningStrategy.TECHNICAL:
-        score += signal_data.get("confidence", 50) * 0.5
-        if signal_data.get("signal") == "BUY":
-            score += 30
-        elif signal_data.get("signal") == "SELL":
-            score -= 20
+        score += confidence * 0.5
+        score += 30.0 * (signal_codes == 1) - 20.0 * (signal_codes == -1)
     
-    return max(0, min(100, score))
-
-
-
-
+    # Assets without signal data keep the base score
+    return np.where(has_signal, np.clip(score, 0, 100), 50.0)
@@ -19,10 +19,15 @@ Features:
 - Caching for performance optimization
 """
 
-from typing import List, Optional, Dict, Any
+import hashlib
+import re
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, Iterable
 from datetime import datetime, timedelta
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Path
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Path, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel, Field, validator
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
@@ -30,17 +35,107 @@ from sqlalchemy import select
 from app.core.security import get_current_user
 from app.core.database import get_db
 from app.core.logging import get_logger
+from app.core.utils import utc_iso_now
 from app.models.asset import Asset
 from app.models.signal import Signal
 from app.services.analysis_service import (
-    compute_signal_bundle,
+    compute_signal_bundle_incremental,
     get_market_overview,
     SignalStrength,
     TrendDirection
 )
+from app.services.signal_cache import async_ttl_cache
 
 logger = get_logger(__name__)
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Valid normalized symbol: 1-10 uppercase letters, digits or ticker
+# punctuation (class shares "BRK.B", indices "^GSPC", pairs "EURUSD=X")
+_SYMBOL_RE = re.compile(r"^[A-Z0-9.\-^=]{1,10}$")
+_SYMBOL_FORMAT_ERROR = "Invalid symbol format. Symbol must be 1-10 letters, digits or . - ^ = characters."
+
+
+@lru_cache(maxsize=4096)
+def _normalize_symbol(raw: str) -> str:
+    """
+    Normalize and validate a raw symbol.
+    
+    Results are memoized, so the strip/upper/regex work runs once per
+    distinct raw input (invalid inputs raise and are not cached).
+    
+    Args:
+        raw: Symbol as received from the client
+        
+    Returns:
+        str: Stripped, uppercased symbol
+        
+    Raises:
+        ValueError: If the symbol does not match the expected format
+    """
+    symbol = raw.strip().upper()
+    if not _SYMBOL_RE.match(symbol):
+        raise ValueError(f"Invalid symbol '{raw}'")
+    return symbol
+
+
+def _require_symbol(raw: str) -> str:
+    """
+    Normalize a path symbol, rejecting invalid ones with a 400.
+    
+    Args:
+        raw: Symbol as received from the client
+        
+    Returns:
+        str: Stripped, uppercased symbol
+        
+    Raises:
+        HTTPException: If the symbol does not match the expected format
+    """
+    try:
+        return _normalize_symbol(raw)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=_SYMBOL_FORMAT_ERROR)
+
+
+# Single-symbol endpoints use the streaming signal path (which reuses
+# per-symbol indicator state across polls) behind an in-process TTL cache
+# keyed by (symbol, period), so repeated requests for hot symbols skip
+# recomputation entirely
+SIGNAL_CACHE_MAXSIZE = 512
+SIGNAL_CACHE_TTL = 30.0
+
+_cached_signal_bundle = async_ttl_cache(
+    maxsize=SIGNAL_CACHE_MAXSIZE,
+    ttl_seconds=SIGNAL_CACHE_TTL,
+    key=lambda symbol, period="1mo": (symbol.upper(), period)
+)(compute_signal_bundle_incremental)
+
+# Static /strength/levels payload, serialized once with its validator
+_STRENGTH_LEVELS_PAYLOAD = {
+    "levels": {
+        1: {"name": "Very Weak", "description": "Minimal signal strength"},
+        2: {"name": "Weak", "description": "Low signal strength"},
+        3: {"name": "Moderate", "description": "Medium signal strength"},
+        4: {"name": "Strong", "description": "High signal strength"},
+        5: {"name": "Very Strong", "description": "Maximum signal strength"}
+    },
+    "trend_directions": {
+        "bullish": "Upward price trend",
+        "bearish": "Downward price trend",
+        "sideways": "Horizontal price movement"
+    },
+    "risk_levels": {
+        "low": "Low risk trade",
+        "medium": "Medium risk trade",
+        "high": "High risk trade"
+    }
+}
+_STRENGTH_LEVELS_BODY = orjson.dumps(_STRENGTH_LEVELS_PAYLOAD, option=orjson.OPT_NON_STR_KEYS)
+_STRENGTH_LEVELS_ETAG = '"{}"'.format(hashlib.md5(_STRENGTH_LEVELS_BODY).hexdigest())
+_STRENGTH_LEVELS_HEADERS = {
+    "ETag": _STRENGTH_LEVELS_ETAG,
+    "Cache-Control": "public, max-age=86400"
+}
 
 
 class IndicatorData(BaseModel):
@@ -102,12 +197,7 @@ class MultipleSignalsRequest(BaseModel):
     @validator('symbols')
     def validate_symbols(cls, v):
         """Validate symbol format."""
-        for symbol in v:
-            if not symbol or len(symbol.strip()) == 0:
-                raise ValueError("Symbol cannot be empty")
-            if len(symbol) > 10:
-                raise ValueError("Symbol too long")
-        return [s.upper().strip() for s in v]
+        return [_normalize_symbol(symbol) for symbol in v]
 
 
 class MultipleSignalsResponse(BaseModel):
@@ -139,19 +229,144 @@ class SignalHistoryRequest(BaseModel):
     days: int = Field(30, ge=1, le=365, description="Number of days of history")
 
 
+class SignalHistoryColumns(BaseModel):
+    """Column-oriented signal history (one list per field)."""
+    dates: List[str] = []
+    signal: List[str] = []
+    confidence: List[float] = []
+    rsi: List[Optional[float]] = []
+    price: List[Optional[float]] = []
+    reasoning: List[str] = []
+
+
 class SignalHistoryResponse(BaseModel):
     """Response model for signal history."""
     symbol: str
     period_days: int
     signals: List[Dict[str, Any]]
+    signal_columns: Optional[SignalHistoryColumns] = None
+
+
+def _model_fields(model: type, data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Select a model's fields from a dict, with None for missing ones.
+    
+    Args:
+        model: Response model whose fields are selected
+        data: Computed values (None or empty when unavailable)
+        
+    Returns:
+        Dict: Every field of the model, in declaration order
+    """
+    data = data or {}
+    return {field: data.get(field) for field in model.__fields__}
+
+
+def _signal_payload(result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Shape a computed signal bundle as a SignalResponse payload.
+    
+    The bundle is produced by the analysis service and already has the
+    response value types, so it is returned without model validation.
+    Missing MACD, Bollinger Bands or Stochastic data become objects whose
+    fields are all None.
+    
+    Args:
+        result: Signal bundle from the analysis service
+        
+    Returns:
+        Dict: Response payload (SignalResponse schema)
+    """
+    return {
+        "symbol": result["symbol"],
+        "current_price": result["current_price"],
+        "timestamp": result["timestamp"],
+        "period": result["period"],
+        "signal": result["signal"],
+        "signal_strength": result["signal_strength"],
+        "confidence": result["confidence"],
+        "trend_direction": result["trend_direction"],
+        "risk_level": result["risk_level"],
+        "reasoning": result["reasoning"],
+        "indicators": _model_fields(IndicatorData, result["indicators"]),
+        "macd": _model_fields(MACDData, result["macd"]),
+        "bollinger_bands": _model_fields(BollingerBandsData, result["bollinger_bands"]),
+        "stochastic": _model_fields(StochasticData, result["stochastic"]),
+        "individual_signals": result["individual_signals"]
+    }
+
+
+def _signal_etag(result: Dict[str, Any]) -> str:
+    """
+    Build the weak ETag of a signal analysis.
+    
+    The ETag hashes the bundle content except its computation timestamp,
+    which differs between workers (and recomputations) for identical
+    signals, so equal analyses get equal ETags on every worker.
+    
+    Args:
+        result: Signal bundle
+        
+    Returns:
+        str: Weak ETag, stable across worker processes
+    """
+    content = {key: value for key, value in result.items() if key != "timestamp"}
+    digest = hashlib.md5(orjson.dumps(content, option=orjson.OPT_SORT_KEYS)).hexdigest()
+    return f'W/"{digest}"'
+
+
+# Field order of signal history row tuples, as row keys and as column names
+_HISTORY_ROW_FIELDS = ("date", "signal", "confidence", "rsi", "price", "reasoning")
+_HISTORY_COLUMN_FIELDS = ("dates", "signal", "confidence", "rsi", "price", "reasoning")
+
+
+def _stream_json_document(
+    head: Dict[str, Any],
+    field: str,
+    opener: bytes,
+    chunks: Iterable[bytes],
+    closer: bytes,
+    tail: Dict[str, Any]
+) -> StreamingResponse:
+    """
+    Stream a JSON object whose largest field is emitted one entry at a time.
+    
+    The document is ``{**head, field: <opener chunk, chunk, ... closer>,
+    **tail}``, byte-identical in content to serializing it in one go, but
+    only one entry is serialized and buffered at a time.
+    
+    Args:
+        head: Fields serialized before the streamed field (non-empty)
+        field: Name of the streamed field
+        opener: Opening bracket of the streamed field (b"[" or b"{")
+        chunks: Pre-serialized entries (array items or ``"key":value`` pairs)
+        closer: Closing bracket matching opener
+        tail: Fields serialized after the streamed field
+        
+    Returns:
+        StreamingResponse: Chunked application/json response
+    """
+    async def body():
+        yield orjson.dumps(head)[:-1] + b',' + orjson.dumps(field) + b':' + opener
+        for index, chunk in enumerate(chunks):
+            yield chunk if index == 0 else b',' + chunk
+        yield closer + (b',' + orjson.dumps(tail)[1:] if tail else b'}')
+    
+    return StreamingResponse(body(), media_type="application/json")
 
 
-@router.get("/{symbol}", response_model=SignalResponse, summary="Get Trading Signal Analysis")
+@router.get(
+    "/{symbol}",
+    response_model=None,
+    responses={200: {"model": SignalResponse}},
+    summary="Get Trading Signal Analysis"
+)
 async def get_signal(
+    request: Request,
     symbol: str = Path(..., description="Asset symbol (e.g., AAPL, BTC, EURUSD)"),
     period: str = Query("1mo", description="Analysis period (1d, 1wk, 1mo, 3mo, 6mo, 1y)"),
     user=Depends(get_current_user)
-) -> SignalResponse:
+) -> Response:
     """
     Get comprehensive technical analysis signal for a single symbol.
     
@@ -164,13 +379,19 @@ async def get_signal(
     - All technical indicators (RSI, MACD, Bollinger Bands, etc.)
     - Individual signal reasoning
     
+    Responses carry an ETag identifying the computed analysis; clients
+    polling with a matching If-None-Match get an empty 304 response until
+    a new bar or quote produces a new analysis.
+    
     Args:
+        request: Incoming request (for If-None-Match)
         symbol: Asset symbol (stocks, crypto, forex)
         period: Analysis period for technical indicators
         user: Authenticated user
         
     Returns:
-        SignalResponse: Complete signal analysis
+        Response: Complete signal analysis (SignalResponse schema), or an
+        empty 304 when the client's ETag matches
         
     Raises:
         HTTPException: If symbol not found or analysis fails
@@ -179,43 +400,23 @@ async def get_signal(
         logger.info(f"Computing signal analysis for {symbol} (period: {period})")
         
         # Validate symbol format
-        symbol_upper = symbol.upper().strip()
-        if not symbol_upper or len(symbol_upper) > 10:
-            raise HTTPException(
-                status_code=400,
-                detail="Invalid symbol format. Symbol must be 1-10 characters."
-            )
+        symbol_upper = _require_symbol(symbol)
         
         # Compute signal analysis
-        result = await compute_signal_bundle(symbol_upper, period)
+        result = await _cached_signal_bundle(symbol_upper, period)
         if result is None:
             raise HTTPException(
                 status_code=404,
                 detail=f"Unable to compute signal analysis for '{symbol}'"
             )
         
-        
-        # Convert to response model
-        response = SignalResponse(
-            symbol=result["symbol"],
-            current_price=result["current_price"],
-            timestamp=result["timestamp"],
-            period=result["period"],
-            signal=result["signal"],
-            signal_strength=result["signal_strength"],
-            confidence=result["confidence"],
-            trend_direction=result["trend_direction"],
-            risk_level=result["risk_level"],
-            reasoning=result["reasoning"],
-            indicators=IndicatorData(**result["indicators"]),
-            macd=MACDData(**result["macd"]) if result["macd"] else MACDData(),
-            bollinger_bands=BollingerBandsData(**result["bollinger_bands"]) if result["bollinger_bands"] else BollingerBandsData(),
-            stochastic=StochasticData(**result["stochastic"]) if result["stochastic"] else StochasticData(),
-            individual_signals=result["individual_signals"]
-        )
+        # Clients polling unchanged signals get an empty 304
+        etag = _signal_etag(result)
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
         
         logger.info(f"Successfully computed {result['signal']} signal for {symbol} with {result['confidence']:.1f}% confidence")
-        return response
+        return ORJSONResponse(_signal_payload(result), headers={"ETag": etag})
         
     except HTTPException:
         raise
@@ -230,6 +431,7 @@ async def get_signal(
 @router.post("/batch", response_model=MultipleSignalsResponse, summary="Get Multiple Symbol Signals")
 async def get_multiple_signals(
     request: MultipleSignalsRequest,
+    stream: bool = Query(False, description="Stream the response body one symbol at a time"),
     user=Depends(get_current_user)
 ) -> MultipleSignalsResponse:
     """
@@ -238,8 +440,12 @@ async def get_multiple_signals(
     This endpoint efficiently analyzes up to 20 symbols concurrently,
     providing comprehensive signal analysis for each symbol.
     
+    With ``stream=true`` the same JSON document is sent chunked, with each
+    symbol's signal serialized only as it is written.
+    
     Args:
         request: List of symbols and analysis parameters
+        stream: Stream the response body
         user: Authenticated user
         
     Returns:
@@ -251,8 +457,8 @@ async def get_multiple_signals(
     try:
         logger.info(f"Computing signals for {len(request.symbols)} symbols")
         
-        # Get market overview (which handles multiple symbols)
-        overview = await get_market_overview(request.symbols)
+        # Get market overview (which analyzes each symbol exactly once)
+        overview = await get_market_overview(request.symbols, request.period)
         
         if "error" in overview:
             raise HTTPException(
@@ -260,52 +466,46 @@ async def get_multiple_signals(
                 detail=f"Error analyzing symbols: {overview['error']}"
             )
         
-        # Process individual signals
+        # Build individual signals from the overview's full per-symbol bundles
         signals = {}
         errors = {}
+        symbols_full = overview["symbols_full"]
         
         for symbol in request.symbols:
+            signal_result = symbols_full.get(symbol)
+            if signal_result is None:
+                signals[symbol] = None
+                errors[symbol] = overview["symbols"].get(symbol, {}).get("error", "Analysis failed")
+                continue
             try:
-                signal_result = await compute_signal_bundle(symbol, request.period)
-                if signal_result:
-                    signals[symbol] = SignalResponse(
-                        symbol=signal_result["symbol"],
-                        current_price=signal_result["current_price"],
-                        timestamp=signal_result["timestamp"],
-                        period=signal_result["period"],
-                        signal=signal_result["signal"],
-                        signal_strength=signal_result["signal_strength"],
-                        confidence=signal_result["confidence"],
-                        trend_direction=signal_result["trend_direction"],
-                        risk_level=signal_result["risk_level"],
-                        reasoning=signal_result["reasoning"],
-                        indicators=IndicatorData(**signal_result["indicators"]),
-                        macd=MACDData(**signal_result["macd"]) if signal_result["macd"] else MACDData(),
-                        bollinger_bands=BollingerBandsData(**signal_result["bollinger_bands"]) if signal_result["bollinger_bands"] else BollingerBandsData(),
-                        stochastic=StochasticData(**signal_result["stochastic"]) if signal_result["stochastic"] else StochasticData(),
-                        individual_signals=signal_result["individual_signals"]
-                    )
-                else:
-                    signals[symbol] = None
-                    errors[symbol] = "Analysis failed"
+                signals[symbol] = _signal_payload(signal_result)
             except Exception as e:
                 signals[symbol] = None
                 errors[symbol] = str(e)
         
-        response = MultipleSignalsResponse(
-            timestamp=datetime.utcnow().isoformat(),
-            period=request.period,
-            total_symbols=len(request.symbols),
-            successful_analyses=overview["successful_analyses"],
-            failed_analyses=len(request.symbols) - overview["successful_analyses"],
-            signals_summary=overview["signals_summary"],
-            strong_signals=overview["strong_signals"],
-            signals=signals,
-            errors=errors
-        )
+        header = {
+            "timestamp": utc_iso_now(),
+            "period": request.period,
+            "total_symbols": len(request.symbols),
+            "successful_analyses": overview["successful_analyses"],
+            "failed_analyses": len(request.symbols) - overview["successful_analyses"],
+            "signals_summary": overview["signals_summary"],
+            "strong_signals": overview["strong_signals"]
+        }
         
         logger.info(f"Successfully computed signals for {overview['successful_analyses']}/{len(request.symbols)} symbols")
-        return response
+        
+        if stream:
+            return _stream_json_document(
+                header, "signals", b"{",
+                (
+                    orjson.dumps(symbol) + b":" + orjson.dumps(signal)
+                    for symbol, signal in signals.items()
+                ),
+                b"}", {"errors": errors}
+            )
+        
+        return MultipleSignalsResponse(signals=signals, errors=errors, **header)
         
     except HTTPException:
         raise
@@ -317,11 +517,16 @@ async def get_multiple_signals(
         )
 
 
-@router.get("/market/overview", response_model=MarketOverviewResponse, summary="Get Market Signal Overview")
+@router.get(
+    "/market/overview",
+    response_model=None,
+    responses={200: {"model": MarketOverviewResponse}},
+    summary="Get Market Signal Overview"
+)
 async def get_market_signal_overview(
     symbols: List[str] = Query(default=["AAPL", "GOOGL", "MSFT", "TSLA", "BTC", "ETH"], description="Symbols to analyze"),
     user=Depends(get_current_user)
-) -> MarketOverviewResponse:
+) -> ORJSONResponse:
     """
     Get market-wide signal overview for multiple symbols.
     
@@ -336,7 +541,7 @@ async def get_market_signal_overview(
         user: Authenticated user
         
     Returns:
-        MarketOverviewResponse: Market signal overview
+        ORJSONResponse: Market signal overview (MarketOverviewResponse schema)
         
     Raises:
         HTTPException: If market analysis fails
@@ -347,9 +552,10 @@ async def get_market_signal_overview(
         # Validate symbols
         validated_symbols = []
         for symbol in symbols:
-            symbol_upper = symbol.upper().strip()
-            if symbol_upper and len(symbol_upper) <= 10:
-                validated_symbols.append(symbol_upper)
+            try:
+                validated_symbols.append(_normalize_symbol(symbol))
+            except ValueError:
+                continue
         
         if not validated_symbols:
             raise HTTPException(
@@ -366,14 +572,14 @@ async def get_market_signal_overview(
                 detail=f"Error generating market overview: {overview['error']}"
             )
         
-        response = MarketOverviewResponse(
-            timestamp=overview["timestamp"],
-            total_symbols=overview["total_symbols"],
-            successful_analyses=overview["successful_analyses"],
-            signals_summary=overview["signals_summary"],
-            strong_signals=overview["strong_signals"],
-            symbols=overview["symbols"]
-        )
+        response = ORJSONResponse({
+            "timestamp": overview["timestamp"],
+            "total_symbols": overview["total_symbols"],
+            "successful_analyses": overview["successful_analyses"],
+            "signals_summary": overview["signals_summary"],
+            "strong_signals": overview["strong_signals"],
+            "symbols": overview["symbols"]
+        })
         
         logger.info(f"Successfully generated market overview for {overview['successful_analyses']} symbols")
         return response
@@ -392,6 +598,8 @@ async def get_market_signal_overview(
 async def get_signal_history(
     symbol: str = Path(..., description="Symbol to analyze"),
     days: int = Query(30, ge=1, le=365, description="Number of days of history"),
+    columnar: bool = Query(False, description="Return history as columns instead of rows"),
+    stream: bool = Query(False, description="Stream the response body one signal at a time"),
     user=Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ) -> SignalHistoryResponse:
@@ -401,9 +609,16 @@ async def get_signal_history(
     This endpoint provides historical signal data to track how signals
     have changed over time for backtesting and analysis purposes.
     
+    With ``columnar=true`` the history is returned in ``signal_columns``
+    as parallel lists rather than one object per signal, and ``signals``
+    is empty. With ``stream=true`` the row-oriented document is sent
+    chunked, with each signal serialized only as it is written.
+    
     Args:
         symbol: Asset symbol to analyze
         days: Number of days of historical data
+        columnar: Return history in column-oriented form
+        stream: Stream the row-oriented response body
         user: Authenticated user
         db: Database session
         
@@ -414,7 +629,7 @@ async def get_signal_history(
         HTTPException: If historical analysis fails
     """
     try:
-        symbol_upper = symbol.upper().strip()
+        symbol_upper = _require_symbol(symbol)
         
         logger.info(f"Fetching signal history for {symbol_upper} ({days} days)")
         
@@ -431,52 +646,71 @@ async def get_signal_history(
         # Query historical signals from database
         cutoff_date = datetime.utcnow() - timedelta(days=days)
         
+        # Fetch only the columns the response needs, as plain row tuples
+        # rather than full ORM entities
         signals_result = await db.execute(
-            select(Signal).where(
+            select(Signal.as_of, Signal.decision, Signal.rsi).where(
                 Signal.asset_id == asset.id,
                 Signal.as_of >= cutoff_date
             ).order_by(Signal.as_of.desc())
         )
-        db_signals = signals_result.scalars().all()
-        
-        # Convert database signals to response format
-        signals = []
-        for sig in db_signals:
-            signal_data = {
-                "date": sig.as_of.strftime("%Y-%m-%d"),
-                "signal": sig.decision,
-                "confidence": 50.0,  # Signal model doesn't store confidence, use default
-                "rsi": float(sig.rsi) if sig.rsi is not None else None,
-                "price": None,  # Signal model doesn't store price
-                "reasoning": f"Signal generated on {sig.as_of.strftime('%Y-%m-%d')}"
-            }
-            signals.append(signal_data)
+        
+        # Convert database rows to row tuples in a single pass, formatting each
+        # date once. Signal model doesn't store confidence (use default) or price.
+        history_rows = [
+            (date, decision, 50.0, float(rsi) if rsi is not None else None, None, f"Signal generated on {date}")
+            for date, decision, rsi in (
+                (as_of.strftime("%Y-%m-%d"), decision, rsi)
+                for as_of, decision, rsi in signals_result.all()
+            )
+        ]
         
         # If we have fewer signals than requested, we can fill with recent computations
         # but for now, just return what we have
-        if len(signals) == 0:
+        if not history_rows:
             logger.info(f"No historical signals found for {symbol_upper}, generating recent signal")
             # Generate a current signal to show recent data
-            current_result = await compute_signal_bundle(symbol_upper)
+            current_result = await _cached_signal_bundle(symbol_upper)
             if current_result:
-                signals.append({
-                    "date": datetime.utcnow().strftime("%Y-%m-%d"),
-                    "signal": current_result.get("signal", "HOLD"),
-                    "confidence": current_result.get("confidence", 50.0),
-                    "rsi": current_result.get("indicators", {}).get("rsi"),
-                    "price": current_result.get("current_price"),
-                    "reasoning": "Current signal analysis"
-                })
+                history_rows.append((
+                    datetime.utcnow().strftime("%Y-%m-%d"),
+                    current_result.get("signal", "HOLD"),
+                    current_result.get("confidence", 50.0),
+                    current_result.get("indicators", {}).get("rsi"),
+                    current_result.get("current_price"),
+                    "Current signal analysis"
+                ))
+        
+        logger.info(f"Successfully retrieved {len(history_rows)} historical signals for {symbol_upper}")
+        
+        if stream and not columnar:
+            return _stream_json_document(
+                {"symbol": symbol_upper, "period_days": days}, "signals", b"[",
+                (orjson.dumps(dict(zip(_HISTORY_ROW_FIELDS, row))) for row in history_rows),
+                b"]", {"signal_columns": None}
+            )
+        
+        if columnar:
+            signals = []
+            columns = zip(*history_rows) if history_rows else ([] for _ in _HISTORY_COLUMN_FIELDS)
+            signal_columns = SignalHistoryColumns.construct(
+                **dict(zip(_HISTORY_COLUMN_FIELDS, map(list, columns)))
+            )
+        else:
+            signals = [dict(zip(_HISTORY_ROW_FIELDS, row)) for row in history_rows]
+            signal_columns = None
         
         response = SignalHistoryResponse(
             symbol=symbol_upper,
             period_days=days,
-            signals=signals
+            signals=signals,
+            signal_columns=signal_columns
         )
         
-        logger.info(f"Successfully retrieved {len(signals)} historical signals for {symbol_upper}")
         return response
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error generating signal history for {symbol}: {e}")
         raise HTTPException(
@@ -509,12 +743,12 @@ async def get_individual_indicators(
         HTTPException: If indicator calculation fails
     """
     try:
-        symbol_upper = symbol.upper().strip()
+        symbol_upper = _require_symbol(symbol)
         
         logger.info(f"Computing individual indicators for {symbol_upper}")
         
         # Get signal analysis (which includes all indicators)
-        result = await compute_signal_bundle(symbol_upper, period)
+        result = await _cached_signal_bundle(symbol_upper, period)
         if result is None:
             raise HTTPException(
                 status_code=404,
@@ -547,31 +781,22 @@ async def get_individual_indicators(
 
 
 @router.get("/strength/levels", summary="Get Signal Strength Levels")
-async def get_signal_strength_levels(user=Depends(get_current_user)) -> Dict[str, Any]:
+async def get_signal_strength_levels(request: Request, user=Depends(get_current_user)) -> Response:
     """
     Get information about signal strength levels.
     
+    The payload is static, so it is serialized once at import time and
+    served with an ETag; clients sending a matching If-None-Match get an
+    empty 304 response.
+    
     Returns:
-        Dict: Signal strength level definitions
+        Response: Signal strength level definitions
     """
-    return {
-        "levels": {
-            1: {"name": "Very Weak", "description": "Minimal signal strength"},
-            2: {"name": "Weak", "description": "Low signal strength"},
-            3: {"name": "Moderate", "description": "Medium signal strength"},
-            4: {"name": "Strong", "description": "High signal strength"},
-            5: {"name": "Very Strong", "description": "Maximum signal strength"}
-        },
-        "trend_directions": {
-            "bullish": "Upward price trend",
-            "bearish": "Downward price trend",
-            "sideways": "Horizontal price movement"
-        },
-        "risk_levels": {
-            "low": "Low risk trade",
-            "medium": "Medium risk trade",
-            "high": "High risk trade"
-        }
-    }
-
-
+    if request.headers.get("if-none-match") == _STRENGTH_LEVELS_ETAG:
+        return Response(status_code=304, headers=_STRENGTH_LEVELS_HEADERS)
+    
+    return Response(
+        content=_STRENGTH_LEVELS_BODY,
+        media_type="application/json",
+        headers=_STRENGTH_LEVELS_HEADERS
+    )
@@ -17,15 +17,26 @@ Features:
 """
 
 import asyncio
-import json
+import heapq
 import re
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List, Union
+from operator import itemgetter
+from typing import Optional, Dict, Any, List, Tuple, Union
+from urllib.parse import urlencode
 import httpx
+import orjson
 from bs4 import BeautifulSoup
 
 from app.config import settings
-from app.core.cache import get_cached_price_data, cache_price_data, get_cache
+from app.core.cache import (
+    get_cached_price_data,
+    cache_price_data,
+    get_cached_price_data_batch,
+    cache_price_data_batch,
+    get_provider_failures,
+    cache_provider_failures,
+    get_cache
+)
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -33,11 +44,88 @@ logger = get_logger(__name__)
 # API Configuration
 ALPHA_VANTAGE_BASE_URL = "https://www.alphavantage.co/query"
 YAHOO_FINANCE_BASE_URL = "https://query1.finance.yahoo.com/v8/finance/chart"
+YAHOO_QUOTE_URL = "https://query1.finance.yahoo.com/v7/finance/quote"
 COINGECKO_BASE_URL = "https://api.coingecko.com/api/v3"
 
-# Rate limiting
-RATE_LIMIT_DELAY = 1.0  # seconds between requests
-_last_request_time = 0
+# Static request parameters, built once. The Yahoo Finance chart query is
+# pre-encoded and appended to the URL, so no params are merged per request.
+YAHOO_CHART_QUERY = urlencode({"range": "1d", "interval": "1m", "includePrePost": "true"})
+COINGECKO_PRICE_PARAMS = {
+    "vs_currencies": "usd",
+    "include_24hr_change": "true",
+    "include_24hr_vol": "true",
+    "include_last_updated_at": "true"
+}
+
+# Alpha Vantage history function per period
+AV_HISTORY_FUNCTIONS = {
+    "1d": "TIME_SERIES_INTRADAY",
+    "1wk": "TIME_SERIES_WEEKLY",
+    "1mo": "TIME_SERIES_MONTHLY",
+    "3mo": "TIME_SERIES_MONTHLY",
+    "6mo": "TIME_SERIES_MONTHLY",
+    "1y": "TIME_SERIES_MONTHLY"
+}
+
+# Response key holding the time series for each Alpha Vantage function
+AV_TIME_SERIES_KEYS = {
+    "TIME_SERIES_INTRADAY": "Time Series (5min)",
+    "TIME_SERIES_WEEKLY": "Weekly Time Series",
+    "TIME_SERIES_MONTHLY": "Monthly Time Series"
+}
+
+# Number of most recent points returned by history fetches
+HISTORY_POINTS = 30
+
+# Maximum symbols per Yahoo Finance quote request
+YAHOO_BATCH_SIZE = 50
+
+# Common crypto symbols mapped to CoinGecko IDs
+CRYPTO_ID_MAP = {
+    "BTC": "bitcoin",
+    "ETH": "ethereum",
+    "ADA": "cardano",
+    "DOT": "polkadot",
+    "LINK": "chainlink",
+    "UNI": "uniswap",
+    "AAVE": "aave",
+    "SOL": "solana",
+    "MATIC": "matic-network",
+    "AVAX": "avalanche-2"
+}
+
+# Asset type detection: symbols containing a crypto ticker are crypto, and
+# 6-character symbols containing a currency code are forex pairs
+CRYPTO_PATTERNS = ('BTC', 'ETH', 'ADA', 'DOT', 'LINK', 'UNI', 'AAVE', 'SOL', 'MATIC', 'AVAX')
+FOREX_PATTERNS = ('USD', 'EUR', 'GBP', 'JPY', 'AUD', 'CAD', 'CHF', 'NZD')
+_CRYPTO_RE = re.compile('|'.join(map(re.escape, CRYPTO_PATTERNS)))
+_FOREX_RE = re.compile('|'.join(map(re.escape, FOREX_PATTERNS)))
+
+# Shared HTTP client: one connection pool (keep-alive, reused TLS sessions)
+# for every provider, created on first use and closed on application shutdown
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+_client: Optional[httpx.AsyncClient] = None
+_client_lock = asyncio.Lock()
+
+# Seconds a provider is skipped for a symbol after returning no data
+FAILURE_TTL = 60
+
+# In-flight single-symbol fetches, keyed by (symbol, period)
+_inflight: Dict[Tuple[str, str], "asyncio.Future[Optional[Dict[str, Any]]]"] = {}
+
+# Maximum per-symbol price fetches in flight across all callers
+PRICE_FETCH_CONCURRENCY = 8
+_fetch_semaphore = asyncio.Semaphore(PRICE_FETCH_CONCURRENCY)
+
+# Rate limiting: one token bucket per provider, as (tokens per second,
+# burst capacity), so providers with independent quotas never wait on
+# each other
+RATE_LIMITS: Dict[str, Tuple[float, float]] = {
+    "alphavantage": (5 / 60, 5),   # 5 requests per minute
+    "coingecko": (30 / 60, 10),    # 30 requests per minute
+    "yahoo": (2.0, 2)              # 2 requests per second
+}
+_buckets: Dict[str, Tuple[float, float]] = {}  # provider -> (tokens, last refill)
 
 
 class MarketDataError(Exception):
@@ -50,16 +138,50 @@ class RateLimitError(MarketDataError):
     pass
 
 
-async def _rate_limit():
-    """Implement rate limiting between requests."""
-    global _last_request_time
-    current_time = asyncio.get_event_loop().time()
-    time_since_last = current_time - _last_request_time
+async def acquire_rate_limit(provider: str):
+    """
+    Take one request token from a provider's bucket, waiting if it is empty.
+    
+    The token is reserved before sleeping (the bucket may go negative), so
+    concurrent callers queue up one refill interval apart instead of all
+    waking at once. The bucket is read and updated with no await in
+    between, so the update is atomic on the event loop and needs no lock.
     
-    if time_since_last < RATE_LIMIT_DELAY:
-        await asyncio.sleep(RATE_LIMIT_DELAY - time_since_last)
+    Args:
+        provider: Key into RATE_LIMITS
+    """
+    rate, capacity = RATE_LIMITS[provider]
+    now = asyncio.get_running_loop().time()
+    tokens, last_refill = _buckets.get(provider, (capacity, now))
+    tokens = min(capacity, tokens + (now - last_refill) * rate) - 1
+    _buckets[provider] = (tokens, now)
+    
+    if tokens < 0:
+        await asyncio.sleep(-tokens / rate)
+
+
+async def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared HTTP client, creating it on first use.
     
-    _last_request_time = asyncio.get_event_loop().time()
+    Returns:
+        httpx.AsyncClient: Pooled client for all market data requests
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        async with _client_lock:
+            if _client is None or _client.is_closed:
+                _client = httpx.AsyncClient(timeout=15, limits=HTTP_LIMITS)
+    return _client
+
+
+async def close_http_client():
+    """Close the shared HTTP client and its pooled connections."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+        logger.info("Market data HTTP client closed")
 
 
 def _detect_asset_type(symbol: str) -> str:
@@ -74,32 +196,31 @@ def _detect_asset_type(symbol: str) -> str:
     """
     symbol_upper = symbol.upper()
     
-    # Crypto patterns
-    crypto_patterns = ['BTC', 'ETH', 'ADA', 'DOT', 'LINK', 'UNI', 'AAVE', 'SOL', 'MATIC', 'AVAX']
-    if any(pattern in symbol_upper for pattern in crypto_patterns):
+    # Crypto patterns (exact tickers first, then substrings such as BTCUSD)
+    if symbol_upper in CRYPTO_ID_MAP or _CRYPTO_RE.search(symbol_upper):
         return 'crypto'
     
     # Forex patterns (currency pairs)
-    forex_patterns = ['USD', 'EUR', 'GBP', 'JPY', 'AUD', 'CAD', 'CHF', 'NZD']
-    if len(symbol_upper) == 6 and any(pattern in symbol_upper for pattern in forex_patterns):
+    if len(symbol_upper) == 6 and _FOREX_RE.search(symbol_upper):
         return 'forex'
     
     # Default to stock
     return 'stock'
 
 
-async def _fetch_alpha_vantage_price(symbol: str) -> Optional[Dict[str, Any]]:
+async def _fetch_alpha_vantage_price(symbol: str, now_iso: Optional[str] = None) -> Optional[Dict[str, Any]]:
     """
     Fetch current price from Alpha Vantage API.
     
     Args:
         symbol: Asset symbol
+        now_iso: Timestamp to stamp the result with (defaults to now)
         
     Returns:
         Optional[Dict]: Price data or None if failed
     """
     try:
-        await _rate_limit()
+        await acquire_rate_limit("alphavantage")
         
         params = {
             "function": "GLOBAL_QUOTE",
@@ -107,50 +228,50 @@ async def _fetch_alpha_vantage_price(symbol: str) -> Optional[Dict[str, Any]]:
             "apikey": settings.ALPHA_VANTAGE_API_KEY
         }
         
-        async with httpx.AsyncClient(timeout=15) as client:
-            response = await client.get(ALPHA_VANTAGE_BASE_URL, params=params)
-            
-            if response.status_code != 200:
-                logger.warning(f"Alpha Vantage API error: {response.status_code}")
-                return None
-            
-            data = response.json()
-            
-            # Check for API errors
-            if "Error Message" in data:
-                logger.warning(f"Alpha Vantage error: {data['Error Message']}")
-                return None
-            
-            if "Note" in data:
-                logger.warning(f"Alpha Vantage rate limit: {data['Note']}")
-                return None
-            
-            global_quote = data.get("Global Quote", {})
-            if not global_quote or "05. price" not in global_quote:
-                logger.warning(f"No price data for symbol: {symbol}")
-                return None
-            
-            # Extract price data
-            price = float(global_quote["05. price"])
-            change = float(global_quote.get("09. change", 0))
-            change_percent = float(global_quote.get("10. change percent", "0%").rstrip("%"))
-            
-            return {
-                "symbol": symbol.upper(),
-                "current_price": price,
-                "change": change,
-                "change_percent": change_percent,
-                "volume": int(global_quote.get("06. volume", 0)),
-                "high": float(global_quote.get("03. high", price)),
-                "low": float(global_quote.get("04. low", price)),
-                "open": float(global_quote.get("02. open", price)),
-                "previous_close": float(global_quote.get("08. previous close", price)),
-                "source": "alpha_vantage",
-                "timestamp": datetime.utcnow().isoformat()
-            }
-            
+        client = await get_http_client()
+        response = await client.get(ALPHA_VANTAGE_BASE_URL, params=params, timeout=15)
+        
+        if response.status_code != 200:
+            logger.warning("Alpha Vantage API error: %s", response.status_code)
+            return None
+        
+        data = orjson.loads(response.content)
+        
+        # Check for API errors
+        if "Error Message" in data:
+            logger.warning("Alpha Vantage error: %s", data['Error Message'])
+            return None
+        
+        if "Note" in data:
+            logger.warning("Alpha Vantage rate limit: %s", data['Note'])
+            return None
+        
+        global_quote = data.get("Global Quote", {})
+        if not global_quote or "05. price" not in global_quote:
+            logger.warning("No price data for symbol: %s", symbol)
+            return None
+        
+        # Extract price data
+        price = float(global_quote["05. price"])
+        change = float(global_quote.get("09. change", 0))
+        change_percent = float(global_quote.get("10. change percent", "0%").rstrip("%"))
+        
+        return {
+            "symbol": symbol.upper(),
+            "current_price": price,
+            "change": change,
+            "change_percent": change_percent,
+            "volume": int(global_quote.get("06. volume", 0)),
+            "high": float(global_quote.get("03. high", price)),
+            "low": float(global_quote.get("04. low", price)),
+            "open": float(global_quote.get("02. open", price)),
+            "previous_close": float(global_quote.get("08. previous close", price)),
+            "source": "alpha_vantage",
+            "timestamp": now_iso or datetime.utcnow().isoformat()
+        }
+        
     except Exception as e:
-        logger.error(f"Alpha Vantage fetch error for {symbol}: {e}")
+        logger.error("Alpha Vantage fetch error for %s: %s", symbol, e)
         return None
 
 
@@ -166,19 +287,10 @@ async def _fetch_alpha_vantage_history(symbol: str, period: str = "1mo") -> Opti
         Optional[List]: Historical data or None if failed
     """
     try:
-        await _rate_limit()
+        await acquire_rate_limit("alphavantage")
         
         # Map period to Alpha Vantage function
-        function_map = {
-            "1d": "TIME_SERIES_INTRADAY",
-            "1wk": "TIME_SERIES_WEEKLY",
-            "1mo": "TIME_SERIES_MONTHLY",
-            "3mo": "TIME_SERIES_MONTHLY",
-            "6mo": "TIME_SERIES_MONTHLY",
-            "1y": "TIME_SERIES_MONTHLY"
-        }
-        
-        function = function_map.get(period, "TIME_SERIES_MONTHLY")
+        function = AV_HISTORY_FUNCTIONS.get(period, "TIME_SERIES_MONTHLY")
         params = {
             "function": function,
             "symbol": symbol,
@@ -188,168 +300,210 @@ async def _fetch_alpha_vantage_history(symbol: str, period: str = "1mo") -> Opti
         if function == "TIME_SERIES_INTRADAY":
             params["interval"] = "5min"
         
-        async with httpx.AsyncClient(timeout=15) as client:
-            response = await client.get(ALPHA_VANTAGE_BASE_URL, params=params)
-            
-            if response.status_code != 200:
-                return None
-            
-            data = response.json()
-            
-            if "Error Message" in data or "Note" in data:
-                return None
-            
-            # Extract time series data
-            time_series_key = None
-            for key in data.keys():
-                if "Time Series" in key:
-                    time_series_key = key
-                    break
-            
-            if not time_series_key:
-                return None
-            
-            time_series = data[time_series_key]
-            history = []
-            
-            for date_str, values in time_series.items():
-                history.append({
-                    "date": date_str,
-                    "open": float(values["1. open"]),
-                    "high": float(values["2. high"]),
-                    "low": float(values["3. low"]),
-                    "close": float(values["4. close"]),
-                    "volume": int(values["5. volume"])
-                })
-            
-            # Sort by date and limit results
-            history.sort(key=lambda x: x["date"])
-            return history[-30:]  # Last 30 data points
-            
+        client = await get_http_client()
+        response = await client.get(ALPHA_VANTAGE_BASE_URL, params=params, timeout=15)
+        
+        if response.status_code != 200:
+            return None
+        
+        data = orjson.loads(response.content)
+        
+        if "Error Message" in data or "Note" in data:
+            return None
+        
+        # Extract time series data
+        time_series = data.get(AV_TIME_SERIES_KEYS[function])
+        if not time_series:
+            return None
+        
+        # Select the most recent HISTORY_POINTS dates with a bounded heap
+        # (ISO dates order lexicographically) instead of sorting the whole
+        # series, so only the returned entries have their values parsed
+        open_key, high_key, low_key, close_key, volume_key = (
+            "1. open", "2. high", "3. low", "4. close", "5. volume"
+        )
+        return [
+            {
+                "date": date_str,
+                "open": float(values[open_key]),
+                "high": float(values[high_key]),
+                "low": float(values[low_key]),
+                "close": float(values[close_key]),
+                "volume": int(values[volume_key])
+            }
+            for date_str, values in (
+                (date_str, time_series[date_str])
+                for date_str in reversed(heapq.nlargest(HISTORY_POINTS, time_series))
+            )
+        ]
+        
     except Exception as e:
-        logger.error(f"Alpha Vantage history fetch error for {symbol}: {e}")
+        logger.error("Alpha Vantage history fetch error for %s: %s", symbol, e)
         return None
 
 
-async def _fetch_yahoo_finance_price(symbol: str) -> Optional[Dict[str, Any]]:
+async def _fetch_yahoo_finance_price(symbol: str, now_iso: Optional[str] = None) -> Optional[Dict[str, Any]]:
     """
     Fetch current price from Yahoo Finance API.
     
     Args:
         symbol: Asset symbol
+        now_iso: Timestamp to stamp the result with (defaults to now)
         
     Returns:
         Optional[Dict]: Price data or None if failed
     """
     try:
-        await _rate_limit()
+        await acquire_rate_limit("yahoo")
         
-        url = f"{YAHOO_FINANCE_BASE_URL}/{symbol}"
-        params = {
-            "range": "1d",
-            "interval": "1m",
-            "includePrePost": "true"
+        url = f"{YAHOO_FINANCE_BASE_URL}/{symbol}?{YAHOO_CHART_QUERY}"
+        
+        client = await get_http_client()
+        response = await client.get(url, timeout=10)
+        
+        if response.status_code != 200:
+            return None
+        
+        data = orjson.loads(response.content)
+        
+        if "chart" not in data or not data["chart"]["result"]:
+            return None
+        
+        meta_get = data["chart"]["result"][0]["meta"].get
+        
+        price = meta_get("regularMarketPrice")
+        if not price:
+            return None
+        
+        previous_close = meta_get("previousClose", price)
+        change = price - previous_close
+        change_percent = (change / previous_close) * 100 if previous_close else 0
+        
+        return {
+            "symbol": symbol.upper(),
+            "current_price": price,
+            "change": change,
+            "change_percent": change_percent,
+            "volume": meta_get("regularMarketVolume", 0),
+            "high": meta_get("regularMarketDayHigh", price),
+            "low": meta_get("regularMarketDayLow", price),
+            "open": meta_get("regularMarketOpen", price),
+            "previous_close": previous_close,
+            "source": "yahoo_finance",
+            "timestamp": now_iso or datetime.utcnow().isoformat()
         }
         
-        async with httpx.AsyncClient(timeout=10) as client:
-            response = await client.get(url, params=params)
-            
-            if response.status_code != 200:
-                return None
-            
-            data = response.json()
-            
-            if "chart" not in data or not data["chart"]["result"]:
-                return None
-            
-            result = data["chart"]["result"][0]
-            meta = result["meta"]
-            
-            if not meta.get("regularMarketPrice"):
-                return None
+    except Exception as e:
+        logger.error("Yahoo Finance fetch error for %s: %s", symbol, e)
+        return None
+
+
+async def _fetch_yahoo_quotes_batch(symbols: List[str], now_iso: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Fetch current prices for several symbols from the Yahoo Finance quote API.
+    
+    Symbols are sent YAHOO_BATCH_SIZE at a time, one request per chunk.
+    
+    Args:
+        symbols: Asset symbols
+        now_iso: Timestamp to stamp the results with (defaults to now)
+        
+    Returns:
+        Dict: Symbol to price data for the symbols that returned a price
+    """
+    quotes = {}
+    for offset in range(0, len(symbols), YAHOO_BATCH_SIZE):
+        chunk = [symbol.upper() for symbol in symbols[offset:offset + YAHOO_BATCH_SIZE]]
+        try:
+            await acquire_rate_limit("yahoo")
             
-            price = meta["regularMarketPrice"]
-            previous_close = meta.get("previousClose", price)
-            change = price - previous_close
-            change_percent = (change / previous_close) * 100 if previous_close else 0
+            client = await get_http_client()
+            response = await client.get(YAHOO_QUOTE_URL, params={"symbols": ",".join(chunk)}, timeout=10)
             
-            return {
-                "symbol": symbol.upper(),
-                "current_price": price,
-                "change": change,
-                "change_percent": change_percent,
-                "volume": meta.get("regularMarketVolume", 0),
-                "high": meta.get("regularMarketDayHigh", price),
-                "low": meta.get("regularMarketDayLow", price),
-                "open": meta.get("regularMarketOpen", price),
-                "previous_close": previous_close,
-                "source": "yahoo_finance",
-                "timestamp": datetime.utcnow().isoformat()
-            }
+            if response.status_code != 200:
+                logger.warning("Yahoo Finance quote API error: %s", response.status_code)
+                continue
             
-    except Exception as e:
-        logger.error(f"Yahoo Finance fetch error for {symbol}: {e}")
-        return None
+            data = orjson.loads(response.content)
+            timestamp = now_iso or datetime.utcnow().isoformat()
+            
+            for quote in (data.get("quoteResponse") or {}).get("result") or []:
+                symbol = quote.get("symbol", "").upper()
+                price = quote.get("regularMarketPrice")
+                if symbol not in chunk or not price:
+                    continue
+                
+                previous_close = quote.get("regularMarketPreviousClose", price)
+                change = price - previous_close
+                change_percent = (change / previous_close) * 100 if previous_close else 0
+                
+                quotes[symbol] = {
+                    "symbol": symbol,
+                    "current_price": price,
+                    "change": change,
+                    "change_percent": change_percent,
+                    "volume": quote.get("regularMarketVolume", 0),
+                    "high": quote.get("regularMarketDayHigh", price),
+                    "low": quote.get("regularMarketDayLow", price),
+                    "open": quote.get("regularMarketOpen", price),
+                    "previous_close": previous_close,
+                    "source": "yahoo_finance",
+                    "timestamp": timestamp
+                }
+                
+        except Exception as e:
+            logger.error("Yahoo Finance batch fetch error for %s symbols: %s", len(chunk), e)
+    
+    return quotes
 
 
-async def _fetch_coingecko_price(symbol: str) -> Optional[Dict[str, Any]]:
+async def _fetch_coingecko_prices_batch(symbols: List[str], now_iso: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
     """
-    Fetch cryptocurrency price from CoinGecko API.
+    Fetch cryptocurrency prices for several symbols in one CoinGecko request.
     
     Args:
-        symbol: Cryptocurrency symbol
+        symbols: Cryptocurrency symbols
+        now_iso: Timestamp to stamp the results with (defaults to now)
         
     Returns:
-        Optional[Dict]: Price data or None if failed
+        Dict: Symbol to price data for the symbols that returned a price
     """
+    ids = {}
+    for symbol in symbols:
+        crypto_id = CRYPTO_ID_MAP.get(symbol.upper())
+        if crypto_id:
+            ids[crypto_id] = symbol.upper()
+    
+    if not ids:
+        return {}
+    
     try:
-        await _rate_limit()
-        
-        # Map common crypto symbols to CoinGecko IDs
-        crypto_id_map = {
-            "BTC": "bitcoin",
-            "ETH": "ethereum",
-            "ADA": "cardano",
-            "DOT": "polkadot",
-            "LINK": "chainlink",
-            "UNI": "uniswap",
-            "AAVE": "aave",
-            "SOL": "solana",
-            "MATIC": "matic-network",
-            "AVAX": "avalanche-2"
-        }
-        
-        crypto_id = crypto_id_map.get(symbol.upper())
-        if not crypto_id:
-            return None
+        await acquire_rate_limit("coingecko")
         
         url = f"{COINGECKO_BASE_URL}/simple/price"
-        params = {
-            "ids": crypto_id,
-            "vs_currencies": "usd",
-            "include_24hr_change": "true",
-            "include_24hr_vol": "true",
-            "include_last_updated_at": "true"
-        }
+        params = {"ids": ",".join(ids), **COINGECKO_PRICE_PARAMS}
         
-        async with httpx.AsyncClient(timeout=10) as client:
-            response = await client.get(url, params=params)
-            
-            if response.status_code != 200:
-                return None
-            
-            data = response.json()
-            
+        client = await get_http_client()
+        response = await client.get(url, params=params, timeout=10)
+        
+        if response.status_code != 200:
+            return {}
+        
+        data = orjson.loads(response.content)
+        timestamp = now_iso or datetime.utcnow().isoformat()
+        
+        prices = {}
+        for crypto_id, symbol in ids.items():
             if crypto_id not in data:
-                return None
+                continue
             
             crypto_data = data[crypto_id]
             price = crypto_data["usd"]
             change_percent = crypto_data.get("usd_24h_change", 0)
             change = price * (change_percent / 100)
             
-            return {
-                "symbol": symbol.upper(),
+            prices[symbol] = {
+                "symbol": symbol,
                 "current_price": price,
                 "change": change,
                 "change_percent": change_percent,
@@ -359,12 +513,165 @@ async def _fetch_coingecko_price(symbol: str) -> Optional[Dict[str, Any]]:
                 "open": price - change,  # Approximate open
                 "previous_close": price - change,
                 "source": "coingecko",
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": timestamp
             }
-            
+        
+        return prices
+        
     except Exception as e:
-        logger.error(f"CoinGecko fetch error for {symbol}: {e}")
-        return None
+        logger.error("CoinGecko fetch error for %s: %s", ', '.join(ids.values()), e)
+        return {}
+
+
+async def _fetch_coingecko_price(symbol: str, now_iso: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    Fetch cryptocurrency price from CoinGecko API.
+    
+    Args:
+        symbol: Cryptocurrency symbol
+        now_iso: Timestamp to stamp the result with (defaults to now)
+        
+    Returns:
+        Optional[Dict]: Price data or None if failed
+    """
+    prices = await _fetch_coingecko_prices_batch([symbol], now_iso)
+    return prices.get(symbol.upper())
+
+
+async def _skip_failed(provider: str, symbols: List[str]) -> List[str]:
+    """
+    Drop symbols for which a provider recently returned no data.
+    
+    Args:
+        provider: Provider name
+        symbols: Candidate symbols
+        
+    Returns:
+        List[str]: Symbols without a live failure marker (all of them when
+        the cache is unavailable)
+    """
+    try:
+        failed = await get_provider_failures(provider, symbols)
+    except Exception:
+        return symbols
+    
+    skipped = [symbol for symbol, is_failed in zip(symbols, failed) if is_failed]
+    if skipped:
+        logger.debug("Skipping %s for recently failed symbols: %s", provider, ', '.join(skipped))
+        return [symbol for symbol, is_failed in zip(symbols, failed) if not is_failed]
+    return symbols
+
+
+async def _record_failures(provider: str, symbols: List[str]):
+    """
+    Mark symbols for which a provider returned no data.
+    
+    Args:
+        provider: Provider name
+        symbols: Symbols the provider failed for
+    """
+    if not symbols:
+        return
+    try:
+        await cache_provider_failures(provider, symbols, ttl=FAILURE_TTL)
+    except Exception as e:
+        logger.debug("Could not record %s failures: %s", provider, e)
+
+
+async def _fetch_price_data(symbols: List[str], period: str = "1mo") -> Dict[str, Optional[Dict[str, Any]]]:
+    """
+    Fetch fresh price data for symbols, falling back between sources.
+    
+    Sources are tried in order: CoinGecko for crypto, Alpha Vantage (with
+    history) when a real API key is configured, then Yahoo Finance. The
+    CoinGecko and Yahoo Finance steps fetch every remaining symbol in one
+    batched request; a single symbol, or one missing from the Yahoo Finance
+    quote response, uses the Yahoo Finance chart endpoint. A source that
+    returned nothing for a symbol is skipped for that symbol until its
+    failure marker expires (FAILURE_TTL).
+    
+    Args:
+        symbols: Uppercase asset symbols
+        period: Historical period (1d, 1wk, 1mo, 3mo, 6mo, 1y)
+        
+    Returns:
+        Dict: Symbol to complete price data with history, None when no
+        source had data
+    """
+    asset_types = {symbol: _detect_asset_type(symbol) for symbol in symbols}
+    now_iso = datetime.utcnow().isoformat()  # one timestamp for the whole batch
+    price_data: Dict[str, Dict[str, Any]] = {}
+    history_data: Dict[str, Optional[List[Dict[str, Any]]]] = {}
+    
+    crypto_symbols = [symbol for symbol in symbols if asset_types[symbol] == "crypto"]
+    if crypto_symbols and settings.COINGECKO_ENABLED:
+        # Try CoinGecko first for crypto
+        crypto_symbols = await _skip_failed("coingecko", crypto_symbols)
+        if crypto_symbols:
+            price_data.update(await _fetch_coingecko_prices_batch(crypto_symbols, now_iso))
+        for symbol in crypto_symbols:
+            if symbol in price_data:
+                logger.info("Got crypto data from CoinGecko for %s", symbol)
+        await _record_failures("coingecko", [symbol for symbol in crypto_symbols if symbol not in price_data])
+    
+    remaining = [symbol for symbol in symbols if symbol not in price_data]
+    if remaining and settings.ALPHA_VANTAGE_API_KEY != "demo":
+        candidates = await _skip_failed("alphavantage", remaining)
+        
+        # Try Alpha Vantage (no batch quote endpoint); results are recorded
+        # as each symbol completes
+        async def fetch_alpha_vantage(symbol: str):
+            async with _fetch_semaphore:
+                quote = await _fetch_alpha_vantage_price(symbol, now_iso)
+                if quote:
+                    logger.info("Got data from Alpha Vantage for %s", symbol)
+                    price_data[symbol] = quote
+                    history_data[symbol] = await _fetch_alpha_vantage_history(symbol, period)
+        
+        await asyncio.gather(*(fetch_alpha_vantage(symbol) for symbol in candidates))
+        await _record_failures("alphavantage", [symbol for symbol in candidates if symbol not in price_data])
+        remaining = [symbol for symbol in remaining if symbol not in price_data]
+    
+    if remaining and settings.YAHOO_FINANCE_ENABLED:
+        # Try Yahoo Finance as fallback: the quote API for several symbols,
+        # then the chart endpoint for a single symbol or for any symbol the
+        # quote API did not return. Each endpoint keeps its own failure markers.
+        if len(remaining) > 1:
+            candidates = await _skip_failed("yahoo_quote", remaining)
+            if candidates:
+                price_data.update(await _fetch_yahoo_quotes_batch(candidates, now_iso))
+            await _record_failures("yahoo_quote", [symbol for symbol in candidates if symbol not in price_data])
+        
+        candidates = await _skip_failed("yahoo_chart", [symbol for symbol in remaining if symbol not in price_data])
+        
+        async def fetch_yahoo_chart(symbol: str):
+            async with _fetch_semaphore:
+                quote = await _fetch_yahoo_finance_price(symbol, now_iso)
+                if quote:
+                    price_data[symbol] = quote
+        
+        await asyncio.gather(*(fetch_yahoo_chart(symbol) for symbol in candidates))
+        await _record_failures("yahoo_chart", [symbol for symbol in candidates if symbol not in price_data])
+        for symbol in remaining:
+            if symbol in price_data:
+                logger.info("Got data from Yahoo Finance for %s", symbol)
+    
+    results: Dict[str, Optional[Dict[str, Any]]] = {}
+    for symbol in symbols:
+        if symbol not in price_data:
+            logger.warning("No price data available for %s", symbol)
+            results[symbol] = None
+            continue
+        
+        # Combine price and history data
+        results[symbol] = {
+            **price_data[symbol],
+            "history": history_data.get(symbol) or [],
+            "asset_type": asset_types[symbol],
+            "period": period
+        }
+    
+    return results
 
 
 async def get_price_with_history(symbol: str, period: str = "1mo") -> Optional[Dict[str, Any]]:
@@ -384,51 +691,39 @@ async def get_price_with_history(symbol: str, period: str = "1mo") -> Optional[D
     # Check cache first
     cached_data = await get_cached_price_data(cache_key)
     if cached_data:
-        logger.debug(f"Returning cached data for {symbol_upper}")
+        logger.debug("Returning cached data for %s", symbol_upper)
         return cached_data
     
-    logger.info(f"Fetching fresh data for {symbol_upper}")
+    # Concurrent misses for the same symbol and period share one fetch
+    inflight_key = (symbol_upper, period)
+    fetch = _inflight.get(inflight_key)
+    if fetch is None:
+        fetch = asyncio.ensure_future(_fetch_and_cache(symbol_upper, period))
+        _inflight[inflight_key] = fetch
+        fetch.add_done_callback(lambda _: _inflight.pop(inflight_key, None))
     
-    # Determine asset type
-    asset_type = _detect_asset_type(symbol_upper)
+    return await asyncio.shield(fetch)
+
+
+async def _fetch_and_cache(symbol_upper: str, period: str) -> Optional[Dict[str, Any]]:
+    """
+    Fetch fresh price data for one symbol and cache it.
     
-    # Try different data sources based on asset type
-    price_data = None
-    history_data = None
+    Args:
+        symbol_upper: Uppercase asset symbol
+        period: Historical period
+        
+    Returns:
+        Optional[Dict]: Complete price data with history
+    """
+    logger.info("Fetching fresh data for %s", symbol_upper)
     
-    if asset_type == "crypto" and settings.COINGECKO_ENABLED:
-        # Try CoinGecko first for crypto
-        price_data = await _fetch_coingecko_price(symbol_upper)
-        if price_data:
-            logger.info(f"Got crypto data from CoinGecko for {symbol_upper}")
-    
-    if not price_data and settings.ALPHA_VANTAGE_API_KEY != "demo":
-        # Try Alpha Vantage
-        price_data = await _fetch_alpha_vantage_price(symbol_upper)
-        if price_data:
-            logger.info(f"Got data from Alpha Vantage for {symbol_upper}")
-            history_data = await _fetch_alpha_vantage_history(symbol_upper, period)
-    
-    if not price_data and settings.YAHOO_FINANCE_ENABLED:
-        # Try Yahoo Finance as fallback
-        price_data = await _fetch_yahoo_finance_price(symbol_upper)
-        if price_data:
-            logger.info(f"Got data from Yahoo Finance for {symbol_upper}")
-    
-    if not price_data:
-        logger.warning(f"No price data available for {symbol_upper}")
+    result = (await _fetch_price_data([symbol_upper], period))[symbol_upper]
+    if not result:
         return None
     
-    # Combine price and history data
-    result = {
-        **price_data,
-        "history": history_data or [],
-        "asset_type": asset_type,
-        "period": period
-    }
-    
     # Cache the result
-    await cache_price_data(cache_key, result, ttl=300)  # 5 minutes
+    await cache_price_data(f"{symbol_upper}_{period}", result, ttl=300)  # 5 minutes
     
     return result
 
@@ -437,19 +732,73 @@ async def get_multiple_prices(symbols: List[str]) -> Dict[str, Optional[Dict[str
     """
     Get prices for multiple symbols concurrently.
     
+    Cached symbols are served from the cache; the rest are fetched together,
+    with one CoinGecko request for all crypto symbols and batched Yahoo
+    Finance quote requests instead of one request per symbol.
+    
     Args:
         symbols: List of asset symbols
         
     Returns:
         Dict: Symbol to price data mapping
     """
-    tasks = [get_price_with_history(symbol) for symbol in symbols]
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+    period = "1mo"
     
-    return {
-        symbol: result if not isinstance(result, Exception) else None
-        for symbol, result in zip(symbols, results)
-    }
+    # Check cache first, for all symbols in one round trip
+    try:
+        cached = await get_cached_price_data_batch([f"{symbol.upper()}_{period}" for symbol in symbols])
+    except Exception as e:
+        logger.warning("Price cache unavailable for batch lookup: %s", e)
+        cached = [None] * len(symbols)
+    
+    results: Dict[str, Optional[Dict[str, Any]]] = {}
+    misses = []
+    for symbol, cached_data in zip(symbols, cached):
+        if cached_data:
+            results[symbol] = cached_data
+        else:
+            misses.append(symbol)
+    
+    if misses:
+        logger.info("Fetching fresh data for %s symbols", len(misses))
+        try:
+            fetched = await _fetch_price_data(list(dict.fromkeys(symbol.upper() for symbol in misses)), period)
+        except Exception as e:
+            logger.error("Batch price fetch error: %s", e)
+            fetched = {}
+        
+        fresh = {}
+        for symbol in misses:
+            results[symbol] = fetched.get(symbol.upper())
+            if results[symbol]:
+                fresh[symbol.upper()] = results[symbol]
+        
+        # Cache the results
+        try:
+            await cache_price_data_batch(
+                {f"{symbol}_{period}": data for symbol, data in fresh.items()}, ttl=300
+            )
+        except Exception as e:
+            logger.warning("Price cache unavailable for batch store: %s", e)
+    
+    return {symbol: results[symbol] for symbol in symbols}
+
+
+COMMON_SYMBOLS: List[Dict[str, str]] = [
+    {"symbol": "AAPL", "name": "Apple Inc.", "type": "stock"},
+    {"symbol": "GOOGL", "name": "Alphabet Inc.", "type": "stock"},
+    {"symbol": "MSFT", "name": "Microsoft Corporation", "type": "stock"},
+    {"symbol": "TSLA", "name": "Tesla Inc.", "type": "stock"},
+    {"symbol": "AMZN", "name": "Amazon.com Inc.", "type": "stock"},
+    {"symbol": "BTC", "name": "Bitcoin", "type": "crypto"},
+    {"symbol": "ETH", "name": "Ethereum", "type": "crypto"},
+    {"symbol": "ADA", "name": "Cardano", "type": "crypto"},
+]
+
+# (symbol, uppercased name, entry) per searchable symbol, built once
+_SYMBOL_INDEX: List[Tuple[str, str, Dict[str, str]]] = [
+    (entry["symbol"], entry["name"].upper(), entry) for entry in COMMON_SYMBOLS
+]
 
 
 async def search_symbols(query: str, limit: int = 10) -> List[Dict[str, Any]]:
@@ -465,25 +814,18 @@ async def search_symbols(query: str, limit: int = 10) -> List[Dict[str, Any]]:
     """
     # This is a simplified implementation
     # In production, you'd integrate with symbol search APIs
-    
-    common_symbols = [
-        {"symbol": "AAPL", "name": "Apple Inc.", "type": "stock"},
-        {"symbol": "GOOGL", "name": "Alphabet Inc.", "type": "stock"},
-        {"symbol": "MSFT", "name": "Microsoft Corporation", "type": "stock"},
-        {"symbol": "TSLA", "name": "Tesla Inc.", "type": "stock"},
-        {"symbol": "AMZN", "name": "Amazon.com Inc.", "type": "stock"},
-        {"symbol": "BTC", "name": "Bitcoin", "type": "crypto"},
-        {"symbol": "ETH", "name": "Ethereum", "type": "crypto"},
-        {"symbol": "ADA", "name": "Cardano", "type": "crypto"},
-    ]
+    if limit <= 0:
+        return []
     
     query_upper = query.upper()
-    matches = [
-        symbol for symbol in common_symbols
-        if query_upper in symbol["symbol"] or query_upper in symbol["name"].upper()
-    ]
+    matches = []
+    for symbol, name_upper, entry in _SYMBOL_INDEX:
+        if query_upper in symbol or query_upper in name_upper:
+            matches.append(entry)
+            if len(matches) == limit:
+                break
     
-    return matches[:limit]
+    return matches
 
 
 async def get_market_summary() -> Dict[str, Any]:
@@ -510,58 +852,43 @@ async def get_market_summary() -> Dict[str, Any]:
         # Get prices for market universe
         universe_prices = await get_multiple_prices(market_universe)
         
-        # Calculate top gainers, losers, and most active
-        top_gainers = []
-        top_losers = []
-        most_active = []
+        # Calculate top gainers, losers, and most active: one pass over the
+        # universe as (symbol, data, change_percent, volume) rows, selecting
+        # the top 10 of each list with a heap and building dicts only for them
+        rows = [
+            (symbol, data, data.get("change_percent", 0.0), data.get("volume", 0))
+            for symbol, data in universe_prices.items()
+            if data
+        ]
         
-        for symbol, data in universe_prices.items():
-            if not data:
-                continue
-            
-            change_percent = data.get("change_percent", 0.0)
-            volume = data.get("volume", 0)
-            
-            # Top gainers
-            if change_percent > 0:
-                top_gainers.append({
-                    "symbol": symbol,
-                    "price": data["current_price"],
-                    "change": data.get("change", 0.0),
-                    "change_percent": change_percent,
-                    "volume": volume
-                })
-            
-            # Top losers
-            if change_percent < 0:
-                top_losers.append({
-                    "symbol": symbol,
-                    "price": data["current_price"],
-                    "change": data.get("change", 0.0),
-                    "change_percent": change_percent,
-                    "volume": volume
-                })
-            
-            # Most active (by volume)
-            most_active.append({
+        def mover(row: tuple) -> Dict[str, Any]:
+            symbol, data, change_percent, volume = row
+            return {
                 "symbol": symbol,
                 "price": data["current_price"],
-                "volume": volume,
-                "change_percent": change_percent
-            })
+                "change": data.get("change", 0.0),
+                "change_percent": change_percent,
+                "volume": volume
+            }
         
-        # Sort and limit results
-        top_gainers.sort(key=lambda x: x["change_percent"], reverse=True)
-        top_losers.sort(key=lambda x: x["change_percent"])
-        most_active.sort(key=lambda x: x["volume"], reverse=True)
+        top_gainers = [
+            mover(row) for row in heapq.nlargest(10, (row for row in rows if row[2] > 0), key=itemgetter(2))
+        ]
+        top_losers = [
+            mover(row) for row in heapq.nsmallest(10, (row for row in rows if row[2] < 0), key=itemgetter(2))
+        ]
+        most_active = [
+            {"symbol": symbol, "price": data["current_price"], "volume": volume, "change_percent": change_percent}
+            for symbol, data, change_percent, volume in heapq.nlargest(10, rows, key=itemgetter(3))
+        ]
         
         summary = {
             "timestamp": datetime.utcnow().isoformat(),
             "indices": {},
             "market_status": "open",  # Simplified - would need real market hours logic
-            "top_gainers": top_gainers[:10],  # Top 10
-            "top_losers": top_losers[:10],    # Bottom 10
-            "most_active": most_active[:10]   # Top 10 by volume
+            "top_gainers": top_gainers,  # Top 10
+            "top_losers": top_losers,    # Bottom 10
+            "most_active": most_active   # Top 10 by volume
         }
         
         for symbol, data in index_data.items():
@@ -575,7 +902,7 @@ async def get_market_summary() -> Dict[str, Any]:
         return summary
         
     except Exception as e:
-        logger.error(f"Market summary error: {e}")
+        logger.error("Market summary error: %s", e)
         return {"error": "Failed to fetch market summary"}
 
 
@@ -21,18 +21,72 @@ Features:
 - Integration with market data services
 """
 
+import asyncio
+import hashlib
 import math
-import statistics
+import os
 from datetime import datetime, timedelta
 from typing import List, Optional, Dict, Any, Tuple
 from enum import Enum
 
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy.signal import lfilter
+
 from app.services.alphavantage_service import get_price_with_history
-from app.core.cache import get_cached_indicator, cache_technical_indicator
+from app.services import indicator_kernels as kernels
+from app.services import signal_disk_cache
+from app.services import streaming_state
+from app.core.cache import (
+    get_cached_indicator,
+    cache_technical_indicator,
+    get_cached_indicators_batch,
+    cache_technical_indicators_batch
+)
 from app.core.logging import get_logger
+from app.core.utils import utc_iso_now
 
 logger = get_logger(__name__)
 
+# Maximum concurrent price fetches for signal batches, shared by all
+# concurrent market overviews, to bound load on the upstream market data
+# providers
+OVERVIEW_CONCURRENCY = 8
+
+# Number of most recent closes used for signal analysis
+SIGNAL_LOOKBACK = 50
+
+# Minimum closes needed for a signal (26 for MACD's slow EMA)
+MIN_SIGNAL_HISTORY = 26
+
+# Minimum batch size whose indicator work is moved off the event loop;
+# smaller batches finish faster than a thread handoff
+THREAD_OFFLOAD_MIN = 16
+
+# Seconds a batch waits for one symbol's price data; a fetch that overruns
+# keeps running in the background and fills the price cache for next time
+OVERVIEW_FETCH_TIMEOUT = 20.0
+
+# Lifetime of content-keyed signal cache entries (1 day); entries never go
+# stale, so this only bounds memory
+SIGNAL_CACHE_TTL = 86400
+
+# Significant digits kept for indicator values in signal bundles. Rounding
+# is relative, so sub-cent prices and small MACD values keep their digits,
+# and it happens after signals are generated from full-precision values
+RESPONSE_SIGNIFICANT_DIGITS = 8
+
+_fetch_semaphore = asyncio.Semaphore(OVERVIEW_CONCURRENCY)
+_compute_semaphore = asyncio.Semaphore(os.cpu_count() or 1)
+
+# (indicators, macd, bollinger_bands, stochastic) for one symbol
+IndicatorSet = Tuple[
+    Dict[str, Optional[float]],
+    Optional[Dict[str, float]],
+    Optional[Dict[str, float]],
+    Optional[Dict[str, float]]
+]
+
 
 class SignalStrength(Enum):
     """Signal strength enumeration."""
@@ -86,13 +140,31 @@ def exponential_moving_average(values: List[float], period: int) -> Optional[flo
     if len(values) < period or period <= 0:
         return None
     
-    multiplier = 2 / (period + 1)
-    ema = values[0]  # Start with first value
+    if kernels.NUMBA_AVAILABLE:
+        return kernels.latest_ema(values, period)
+    
+    return float(_ema_series(values, period)[-1])
+
+
+def _ema_series(values: List[float], period: int) -> np.ndarray:
+    """
+    Calculate the full EMA series, seeded with the first value.
     
-    for price in values[1:]:
-        ema = (price * multiplier) + (ema * (1 - multiplier))
+    The recursion runs as a single first-order IIR filter, so the whole
+    series costs one C-level pass instead of a Python loop.
     
-    return ema
+    Args:
+        values: Non-empty list or array of price values (most recent last)
+        period: Number of periods for calculation (positive)
+        
+    Returns:
+        np.ndarray: EMA after each value
+    """
+    prices = np.asarray(values, dtype=np.float64)
+    multiplier = 2 / (period + 1)
+    decay = 1 - multiplier
+    series, _ = lfilter([multiplier], [1.0, -decay], prices, zi=[decay * prices[0]])
+    return series
 
 
 def relative_strength_index(values: List[float], period: int = 14) -> Optional[float]:
@@ -112,6 +184,10 @@ def relative_strength_index(values: List[float], period: int = 14) -> Optional[f
     if len(values) < period + 1 or period <= 0:
         return None
     
+    if kernels.NUMBA_AVAILABLE:
+        # Same arithmetic as below, compiled
+        return kernels.latest_rsi(values, period)
+    
     # Calculate price changes
     changes = []
     for i in range(1, len(values)):
@@ -158,30 +234,28 @@ def macd(values: List[float], fast_period: int = 12, slow_period: int = 26, sign
     """
     if len(values) < slow_period + signal_period:
         return None
-    
-    # Calculate EMAs
-    ema_fast = exponential_moving_average(values, fast_period)
-    ema_slow = exponential_moving_average(values, slow_period)
-    
-    if ema_fast is None or ema_slow is None:
+    if fast_period <= 0 or slow_period <= 0 or signal_period <= 0 or len(values) < fast_period:
         return None
     
-    # Calculate MACD line
-    macd_line = ema_fast - ema_slow
-    
-    # Calculate MACD line values for signal line
-    macd_values = []
-    for i in range(slow_period, len(values)):
-        fast_ema = exponential_moving_average(values[:i+1], fast_period)
-        slow_ema = exponential_moving_average(values[:i+1], slow_period)
-        if fast_ema is not None and slow_ema is not None:
-            macd_values.append(fast_ema - slow_ema)
+    if kernels.NUMBA_AVAILABLE and fast_period <= slow_period:
+        # One compiled pass keeping both EMAs and the signal line running
+        macd_line, signal_line, histogram = kernels.latest_macd(values, fast_period, slow_period, signal_period)
+        return {
+            "macd": macd_line,
+            "signal": signal_line,
+            "histogram": histogram
+        }
     
-    # Calculate signal line
-    signal_line = exponential_moving_average(macd_values, signal_period)
+    # Calculate MACD line after every value; each EMA of a prefix equals
+    # the running EMA at that point
+    macd_series = _ema_series(values, fast_period) - _ema_series(values, slow_period)
+    macd_line = float(macd_series[-1])
     
-    if signal_line is None:
+    # Calculate signal line from the MACD values once both EMAs are formed
+    macd_values = macd_series[max(slow_period, fast_period - 1):]
+    if len(macd_values) < signal_period:
         return None
+    signal_line = float(_ema_series(macd_values, signal_period)[-1])
     
     # Calculate histogram
     histogram = macd_line - signal_line
@@ -213,13 +287,11 @@ def bollinger_bands(values: List[float], period: int = 20, num_std: float = 2.0)
         return None
     
     # Calculate SMA
-    sma = simple_moving_average(values, period)
-    if sma is None:
-        return None
+    window = values[-period:]
+    sma = sum(window) / period
     
     # Calculate standard deviation
-    window = values[-period:]
-    variance = sum((price - sma) ** 2 for price in window) / period
+    variance = sum([(price - sma) * (price - sma) for price in window]) / period
     std_dev = math.sqrt(variance)
     
     # Calculate bands
@@ -253,22 +325,24 @@ def stochastic_oscillator(values: List[float], period: int = 14, k_period: int =
     if len(values) < period or period <= 0:
         return None
     
-    # Calculate %K values
-    k_values = []
-    for i in range(period - 1, len(values)):
-        window = values[i - period + 1:i + 1]
-        highest_high = max(window)
-        lowest_low = min(window)
-        
-        if highest_high == lowest_low:
-            k_values.append(50)  # Neutral when no range
-        else:
-            k_percent = ((values[i] - lowest_low) / (highest_high - lowest_low)) * 100
-            k_values.append(k_percent)
-    
-    if len(k_values) < k_period:
+    if len(values) - period + 1 < k_period:
         return None
     
+    # Calculate %K only for the windows that feed %K and %D, with every
+    # window's high and low taken in one pass
+    window_count = max(k_period, 1)
+    recent = np.asarray(values[-(period + window_count - 1):], dtype=np.float64)
+    windows = sliding_window_view(recent, period)
+    highest_highs = windows.max(axis=1)
+    lowest_lows = windows.min(axis=1)
+    ranges = highest_highs - lowest_lows
+    
+    # Neutral 50 when no range
+    k_array = np.full(window_count, 50.0)
+    np.divide(windows[:, -1] - lowest_lows, ranges, out=k_array, where=ranges != 0)
+    np.multiply(k_array, 100, out=k_array, where=ranges != 0)
+    k_values = k_array.tolist()
+    
     # Calculate %D (SMA of %K)
     d_percent = simple_moving_average(k_values, k_period)
     
@@ -323,6 +397,11 @@ def average_true_range(values: List[float], period: int = 14) -> Optional[float]
     if len(values) < period + 1 or period <= 0:
         return None
     
+    if kernels.NUMBA_AVAILABLE:
+        # Close-only true ranges reduce to |close - previous close|; same
+        # arithmetic as below, compiled
+        return kernels.latest_atr(values, period)
+    
     # For simplicity, using price as high/low/close
     # In real implementation, you'd have separate high/low/close arrays
     true_ranges = []
@@ -525,10 +604,401 @@ def generate_trading_signals(
     return signals
 
 
+def generate_trading_signals_batch(
+    current_prices: np.ndarray,
+    columns: Dict[str, np.ndarray]
+) -> List[Dict[str, Any]]:
+    """
+    Generate trading signals for many symbols at once.
+    
+    Same rules and output as generate_trading_signals, with the buy/sell
+    scoring, primary signal, confidence and risk level computed as mask
+    arithmetic over all symbols; only the reasoning strings are built per
+    symbol.
+    
+    Args:
+        current_prices: float64 array of shape (N_symbols,)
+        columns: Indicator columns of shape (N_symbols,) as returned by
+            indicator_kernels.compute_indicator_batch, NaN where missing
+        
+    Returns:
+        List[Dict]: Signal analysis per symbol, in input order
+    """
+    count = len(current_prices)
+    rsi = columns["rsi"]
+    macd_line = columns["macd"]
+    macd_signal = columns["macd_signal"]
+    macd_histogram = columns["macd_histogram"]
+    bb_upper = columns["bb_upper"]
+    bb_middle = columns["bb_middle"]
+    bb_lower = columns["bb_lower"]
+    stoch_k = columns["stoch_k"]
+    wr = columns["williams_r"]
+    ema_20 = columns["ema_20"]
+    ema_50 = columns["ema_50"]
+    ema_bullish = (ema_20 > ema_50) & (current_prices > ema_20)
+    ema_bearish = (ema_20 < ema_50) & (current_prices < ema_20)
+    
+    # Per indicator: (present mask, label conditions in priority order,
+    # their labels, buy weights, sell weights)
+    rules = [
+        (
+            "rsi", ~np.isnan(rsi),
+            [rsi < 30, rsi < 40, rsi > 70, rsi > 60],
+            ["STRONG_BUY", "BUY", "STRONG_SELL", "SELL"],
+            [1.0, 0.5, 0.0, 0.0], [0.0, 0.0, 1.0, 0.5]
+        ),
+        (
+            "macd", ~np.isnan(macd_line) & ~np.isnan(macd_signal),
+            [(macd_line > macd_signal) & (macd_histogram > 0), (macd_line < macd_signal) & (macd_histogram < 0)],
+            ["BUY", "SELL"],
+            [1.0, 0.0], [0.0, 1.0]
+        ),
+        (
+            "bollinger", ~np.isnan(bb_upper),
+            [current_prices <= bb_lower, current_prices >= bb_upper, current_prices < bb_middle, current_prices > bb_middle],
+            ["STRONG_BUY", "STRONG_SELL", "BUY", "SELL"],
+            [1.0, 0.0, 0.5, 0.0], [0.0, 1.0, 0.0, 0.5]
+        ),
+        (
+            "stochastic", ~np.isnan(stoch_k),
+            [stoch_k < 20, stoch_k > 80],
+            ["BUY", "SELL"],
+            [0.5, 0.0], [0.0, 0.5]
+        ),
+        (
+            "williams_r", ~np.isnan(wr),
+            [wr < -80, wr > -20],
+            ["BUY", "SELL"],
+            [0.5, 0.0], [0.0, 0.5]
+        ),
+        (
+            "ema_trend", ~np.isnan(ema_20) & ~np.isnan(ema_50),
+            [ema_bullish, ema_bearish],
+            ["BUY", "SELL"],
+            [1.0, 0.0], [0.0, 1.0]
+        ),
+    ]
+    
+    buy_signals = np.zeros(count)
+    sell_signals = np.zeros(count)
+    total_signals = np.zeros(count)
+    individual_labels = []
+    for name, present, conditions, labels, buy_weights, sell_weights in rules:
+        buy_signals += np.where(present, np.select(conditions, buy_weights, 0.0), 0.0)
+        sell_signals += np.where(present, np.select(conditions, sell_weights, 0.0), 0.0)
+        total_signals += present
+        individual_labels.append((name, present.tolist(), np.select(conditions, labels, "NEUTRAL").tolist()))
+    
+    # Determine primary signal, strength, confidence and risk level
+    has_signals = total_signals > 0
+    divisor = np.where(has_signals, total_signals, 1.0)
+    buy_ratio = buy_signals / divisor
+    sell_ratio = sell_signals / divisor
+    is_buy = has_signals & (buy_ratio > 0.6)
+    is_sell = has_signals & ~is_buy & (sell_ratio > 0.6)
+    
+    primary = np.select([is_buy, is_sell], ["BUY", "SELL"], "HOLD").tolist()
+    strength = np.select(
+        [is_buy & (buy_ratio > 0.8), is_buy, is_sell & (sell_ratio > 0.8), is_sell],
+        [SignalStrength.STRONG.value, SignalStrength.MODERATE.value, SignalStrength.STRONG.value, SignalStrength.MODERATE.value],
+        SignalStrength.WEAK.value
+    ).tolist()
+    confidence = np.where(has_signals, np.maximum(buy_ratio, sell_ratio) * 100, 0.0)
+    risk = np.select(
+        [~has_signals, confidence > 80, confidence > 60], ["medium", "low", "medium"], "high"
+    ).tolist()
+    trend = np.select(
+        [ema_bullish, ema_bearish], [TrendDirection.BULLISH.value, TrendDirection.BEARISH.value],
+        TrendDirection.SIDEWAYS.value
+    ).tolist()
+    confidence = confidence.tolist()
+    
+    # Reasoning strings depend on the indicator values, so build them per symbol
+    rsi_values, bb_percent_b, stoch_values, wr_values = (
+        rsi.tolist(), columns["bb_percent_b"].tolist(), stoch_k.tolist(), wr.tolist()
+    )
+    reasoning_formats = {
+        "rsi": {
+            "STRONG_BUY": "RSI oversold at {:.1f}", "BUY": "RSI approaching oversold at {:.1f}",
+            "STRONG_SELL": "RSI overbought at {:.1f}", "SELL": "RSI approaching overbought at {:.1f}"
+        },
+        "macd": {"BUY": "MACD bullish crossover", "SELL": "MACD bearish crossover"},
+        "bollinger": {
+            "STRONG_BUY": "Price at lower Bollinger Band ({:.1f}%)",
+            "STRONG_SELL": "Price at upper Bollinger Band ({:.1f}%)"
+        },
+        "stochastic": {"BUY": "Stochastic oversold at {:.1f}%", "SELL": "Stochastic overbought at {:.1f}%"},
+        "williams_r": {"BUY": "Williams %R oversold at {:.1f}", "SELL": "Williams %R overbought at {:.1f}"},
+        "ema_trend": {
+            "BUY": "Price above rising EMAs (bullish trend)", "SELL": "Price below falling EMAs (bearish trend)"
+        },
+    }
+    reasoning_values = {
+        "rsi": rsi_values, "macd": None, "bollinger": bb_percent_b,
+        "stochastic": stoch_values, "williams_r": wr_values, "ema_trend": None
+    }
+    
+    results = []
+    for i in range(count):
+        individual_signals = {}
+        reasoning = []
+        for name, present, labels in individual_labels:
+            if not present[i]:
+                continue
+            label = labels[i]
+            individual_signals[name] = label
+            template = reasoning_formats[name].get(label)
+            if template is not None:
+                values = reasoning_values[name]
+                reasoning.append(template.format(values[i]) if values is not None else template)
+        
+        results.append({
+            "primary_signal": primary[i],
+            "signal_strength": strength[i],
+            "confidence": confidence[i],
+            "trend_direction": trend[i],
+            "individual_signals": individual_signals,
+            "risk_level": risk[i],
+            "reasoning": reasoning
+        })
+    
+    return results
+
+
+def _price_series(symbol: str, price_data: Dict[str, Any]) -> np.ndarray:
+    """
+    Extract the closes used for signal analysis from price data.
+    
+    The closes are read out of the history records once, straight into a
+    float64 array that every later stage (cache key, kernel matrix) uses.
+    
+    Args:
+        symbol: Asset symbol (for logging)
+        price_data: Price data with current price and optional history
+        
+    Returns:
+        np.ndarray: Up to SIGNAL_LOOKBACK most recent closes, or a synthetic
+        series around the current price when no history is available
+    """
+    history = price_data.get("history", [])
+    if history:
+        recent = history[-SIGNAL_LOOKBACK:]
+        return np.fromiter((h["close"] for h in recent), dtype=np.float64, count=len(recent))
+    
+    # Generate synthetic data for demo if no history available
+    logger.warning(f"No history data for {symbol}, generating synthetic data")
+    base_price = price_data["current_price"]
+    return base_price * (1 + (np.arange(SIGNAL_LOOKBACK) - 25) * 0.01)
+
+
+def _round_significant(values: Optional[Dict[str, Optional[float]]]) -> Optional[Dict[str, Optional[float]]]:
+    """
+    Round indicator values to RESPONSE_SIGNIFICANT_DIGITS significant digits.
+    
+    Args:
+        values: Indicator values by name (None entries are kept)
+        
+    Returns:
+        Optional[Dict]: Rounded copy, or None if values is None
+    """
+    if values is None:
+        return None
+    return {
+        name: value if value is None else float(f"{value:.{RESPONSE_SIGNIFICANT_DIGITS}g}")
+        for name, value in values.items()
+    }
+
+
+def _assemble_signal_bundle(
+    symbol: str,
+    period: str,
+    current_price: float,
+    indicators: Dict[str, Optional[float]],
+    macd_data: Optional[Dict[str, float]],
+    bb_data: Optional[Dict[str, float]],
+    stoch_data: Optional[Dict[str, float]],
+    signals: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Generate trading signals from indicator values and build the bundle.
+    
+    Signals are generated from the values as given; the values in the
+    bundle are then rounded to RESPONSE_SIGNIFICANT_DIGITS, the single
+    precision policy for every signal path.
+    
+    Args:
+        symbol: Asset symbol
+        period: Historical period used for analysis
+        current_price: Current asset price
+        indicators: RSI, EMA 20/50, SMA 20, ATR and Williams %R values
+        macd_data: MACD indicator data
+        bb_data: Bollinger Bands data
+        stoch_data: Stochastic Oscillator data
+        signals: Signals already generated for these values (skips
+            generate_trading_signals)
+        
+    Returns:
+        Dict: Complete signal analysis in the compute_signal_bundle shape
+    """
+    if signals is None:
+        signals = generate_trading_signals(
+            current_price, indicators["rsi"], macd_data, bb_data, stoch_data,
+            indicators["williams_r"], indicators["ema_20"], indicators["ema_50"]
+        )
+    
+    return {
+        "symbol": symbol.upper(),
+        "current_price": current_price,
+        "timestamp": datetime.utcnow().isoformat(),
+        "period": period,
+        "signal": signals["primary_signal"],
+        "signal_strength": signals["signal_strength"],
+        "confidence": signals["confidence"],
+        "trend_direction": signals["trend_direction"],
+        "risk_level": signals["risk_level"],
+        "reasoning": signals["reasoning"],
+        "indicators": _round_significant(indicators),
+        "macd": _round_significant(macd_data),
+        "bollinger_bands": _round_significant(bb_data),
+        "stochastic": _round_significant(stoch_data),
+        "individual_signals": signals["individual_signals"]
+    }
+
+
+def _indicator_columns(series: List[np.ndarray]) -> Dict[str, np.ndarray]:
+    """
+    Compute every signal indicator for several close series in one batch.
+    
+    Args:
+        series: Close series (most recent last), each at most SIGNAL_LOOKBACK long
+        
+    Returns:
+        Dict[str, np.ndarray]: Per indicator, one value per series (NaN
+        where a series has insufficient data)
+    """
+    # Stack histories right-aligned so the most recent close is the last column
+    matrix = np.full((len(series), SIGNAL_LOOKBACK), np.nan)
+    starts = np.empty(len(series), dtype=np.int64)
+    for row, prices in enumerate(series):
+        start = SIGNAL_LOOKBACK - len(prices)
+        matrix[row, start:] = prices
+        starts[row] = start
+    
+    return kernels.compute_indicator_batch(matrix, starts)
+
+
+def _indicator_sets(series: List[np.ndarray]) -> List[IndicatorSet]:
+    """
+    Compute every signal indicator for several close series in one batch.
+    
+    Args:
+        series: Close series (most recent last), each at most SIGNAL_LOOKBACK long
+        
+    Returns:
+        List[IndicatorSet]: Per series, the (indicators, macd, bollinger_bands,
+        stochastic) values in the shape _assemble_signal_bundle expects
+    """
+    return _indicator_sets_from_columns(_indicator_columns(series), len(series))
+
+
+def _indicator_sets_from_columns(indicator_columns: Dict[str, np.ndarray], count: int) -> List[IndicatorSet]:
+    """
+    Split batch indicator columns into per-series indicator sets.
+    
+    Args:
+        indicator_columns: Output of _indicator_columns
+        count: Number of series
+        
+    Returns:
+        List[IndicatorSet]: Per series, the (indicators, macd, bollinger_bands,
+        stochastic) values in the shape _assemble_signal_bundle expects
+    """
+    columns = {name: values.tolist() for name, values in indicator_columns.items()}
+    
+    def column(name: str, row: int) -> Optional[float]:
+        value = columns[name][row]
+        return None if math.isnan(value) else value
+    
+    indicator_sets = []
+    for row in range(count):
+        macd_line = column("macd", row)
+        bb_upper = column("bb_upper", row)
+        stoch_k = column("stoch_k", row)
+        
+        indicator_sets.append((
+            {
+                "rsi": column("rsi", row),
+                "ema_20": column("ema_20", row),
+                "ema_50": column("ema_50", row),
+                "sma_20": column("sma_20", row),
+                "atr": column("atr", row),
+                "williams_r": column("williams_r", row)
+            },
+            {
+                "macd": macd_line,
+                "signal": column("macd_signal", row),
+                "histogram": column("macd_histogram", row)
+            } if macd_line is not None else None,
+            {
+                "upper": bb_upper,
+                "middle": column("bb_middle", row),
+                "lower": column("bb_lower", row),
+                "width": column("bb_width", row),
+                "percent_b": column("bb_percent_b", row)
+            } if bb_upper is not None else None,
+            {
+                "k_percent": stoch_k,
+                "d_percent": column("stoch_d", row)
+            } if stoch_k is not None else None
+        ))
+    
+    return indicator_sets
+
+
+def _score_batch(
+    series: List[np.ndarray],
+    current_prices: List[float]
+) -> Tuple[List[IndicatorSet], List[Dict[str, Any]]]:
+    """
+    Compute indicators and trading signals for a batch of series.
+    
+    Args:
+        series: Close series (most recent last), each at most SIGNAL_LOOKBACK long
+        current_prices: Current price per series
+        
+    Returns:
+        Tuple: (indicator sets, signals) per series, in input order
+    """
+    columns = _indicator_columns(series)
+    signal_sets = generate_trading_signals_batch(np.array(current_prices, dtype=np.float64), columns)
+    return _indicator_sets_from_columns(columns, len(series)), signal_sets
+
+
+def _series_cache_key(period: str, prices: np.ndarray, current_price: float) -> str:
+    """
+    Build a signal cache key from the data the signals depend on.
+    
+    Args:
+        period: Historical period for analysis
+        prices: Closes used for analysis
+        current_price: Current asset price
+        
+    Returns:
+        str: Key of the form "{period}_{digest}"
+    """
+    data = np.append(prices, current_price).tobytes()
+    return f"{period}_{hashlib.blake2b(data, digest_size=8).hexdigest()}"
+
+
 async def compute_signal_bundle(symbol: str, period: str = "1mo") -> Optional[Dict[str, Any]]:
     """
     Compute comprehensive technical analysis signals for a symbol.
     
+    Results are cached under a digest of the closes and quote they were
+    computed from, so a changed series never returns stale signals and an
+    unchanged one stays a hit for as long as SIGNAL_CACHE_TTL.
+    
     Args:
         symbol: Asset symbol
         period: Historical period for analysis
@@ -539,14 +1009,62 @@ async def compute_signal_bundle(symbol: str, period: str = "1mo") -> Optional[Di
     try:
         logger.info(f"Computing signals for {symbol}")
         
-        # Check cache first
-        cache_key = f"{symbol}_{period}"
+        # Get price data
+        price_data = await get_price_with_history(symbol, period)
+        if not price_data:
+            logger.warning(f"No price data available for {symbol}")
+            return None
+        
+        current_price = price_data["current_price"]
+        prices = _price_series(symbol, price_data)
+        
+        if len(prices) < MIN_SIGNAL_HISTORY:  # Need at least 26 for MACD
+            logger.warning(f"Insufficient data for {symbol}: {len(prices)} points")
+            return None
+        
+        # Check cache for signals computed from this exact data
+        cache_key = _series_cache_key(period, prices, current_price)
         cached_signals = await get_cached_indicator(symbol, cache_key)
         if cached_signals:
             logger.debug(f"Returning cached signals for {symbol}")
             return cached_signals
         
-        # Get price data
+        # Calculate all indicators in one compiled pass over the series
+        result = _assemble_signal_bundle(symbol, period, current_price, *_indicator_sets([prices])[0])
+        
+        # Cache the result
+        await cache_technical_indicator(symbol, cache_key, result, ttl=SIGNAL_CACHE_TTL)
+        
+        logger.info(f"Generated {result['signal']} signal for {symbol} with {result['confidence']:.1f}% confidence")
+        
+        return result
+        
+    except Exception as e:
+        logger.error(f"Error computing signals for {symbol}: {e}")
+        return None
+
+
+async def compute_signal_bundle_incremental(symbol: str, period: str = "1mo") -> Optional[Dict[str, Any]]:
+    """
+    Compute signals for a symbol, reusing streaming state from earlier polls.
+    
+    Repeat polls only do the work their new data requires: nothing when
+    the analyzed closes and the quote are unchanged, and only the signal
+    logic when just the quote moved. The closes are taken from the fetched
+    history on every poll, exactly as compute_signal_bundle takes them, so
+    results always equal a full recompute. Bundles are shared with the
+    other signal paths through the same content-keyed indicator cache, and
+    indicator values for a given window are also kept in the signal disk
+    cache, so they are computed once across restarts and worker processes.
+    
+    Args:
+        symbol: Asset symbol
+        period: Historical period for analysis
+        
+    Returns:
+        Optional[Dict]: Complete signal analysis or None if failed
+    """
+    try:
         price_data = await get_price_with_history(symbol, period)
         if not price_data:
             logger.warning(f"No price data available for {symbol}")
@@ -554,138 +1072,238 @@ async def compute_signal_bundle(symbol: str, period: str = "1mo") -> Optional[Di
         
         current_price = price_data["current_price"]
         history = price_data.get("history", [])
+        prices = _price_series(symbol, price_data)
         
-        # Extract price series from history
-        if history:
-            prices = [float(h["close"]) for h in history[-50:]]  # Last 50 data points
-        else:
-            # Generate synthetic data for demo if no history available
-            logger.warning(f"No history data for {symbol}, generating synthetic data")
-            base_price = current_price
-            prices = [base_price * (1 + (i - 25) * 0.01) for i in range(50)]
+        if not history:
+            # Synthetic series depend only on the quote; nothing to stream
+            return _assemble_signal_bundle(symbol, period, current_price, *_indicator_sets([prices])[0])
         
-        if len(prices) < 26:  # Need at least 26 for MACD
+        if len(prices) < MIN_SIGNAL_HISTORY:
             logger.warning(f"Insufficient data for {symbol}: {len(prices)} points")
             return None
         
-        # Calculate all indicators
-        rsi = relative_strength_index(prices, 14)
-        macd_data = macd(prices, 12, 26, 9)
-        bb_data = bollinger_bands(prices, 20, 2.0)
-        stoch_data = stochastic_oscillator(prices, 14, 3)
-        williams_r = williams_r(prices, 14)
-        ema_20 = exponential_moving_average(prices, 20)
-        ema_50 = exponential_moving_average(prices, 50)
-        sma_20 = simple_moving_average(prices, 20)
-        atr = average_true_range(prices, 14)
-        
-        # Generate trading signals
-        signals = generate_trading_signals(
-            current_price, rsi, macd_data, bb_data, stoch_data,
-            williams_r, ema_20, ema_50
-        )
+        state = streaming_state.get_state(symbol, period)
+        if state.is_current(prices, current_price):
+            logger.debug(f"Returning streamed signals for {symbol}")
+            return state.bundle
         
-        # Compile comprehensive result
-        result = {
-            "symbol": symbol.upper(),
-            "current_price": current_price,
-            "timestamp": datetime.utcnow().isoformat(),
-            "period": period,
-            "signal": signals["primary_signal"],
-            "signal_strength": signals["signal_strength"],
-            "confidence": signals["confidence"],
-            "trend_direction": signals["trend_direction"],
-            "risk_level": signals["risk_level"],
-            "reasoning": signals["reasoning"],
-            "indicators": {
-                "rsi": rsi,
-                "ema_20": ema_20,
-                "ema_50": ema_50,
-                "sma_20": sma_20,
-                "atr": atr,
-                "williams_r": williams_r
-            },
-            "macd": macd_data,
-            "bollinger_bands": bb_data,
-            "stochastic": stoch_data,
-            "individual_signals": signals["individual_signals"]
-        }
+        # Bundles computed from this exact data by any path or worker are
+        # shared through the content-keyed indicator cache
+        cache_key = _series_cache_key(period, prices, current_price)
+        try:
+            cached_signals = await get_cached_indicator(symbol, cache_key)
+        except Exception as e:
+            logger.warning(f"Indicator cache unavailable for {symbol}: {e}")
+            cached_signals = None
         
-        # Cache the result
-        await cache_technical_indicator(symbol, cache_key, result, ttl=600)  # 10 minutes
+        state.update(prices)
+        state.current_price = current_price
+        if cached_signals:
+            state.bundle = cached_signals
+            return cached_signals
         
-        logger.info(f"Generated {signals['primary_signal']} signal for {symbol} with {signals['confidence']:.1f}% confidence")
+        if state.indicator_set is None:
+            # Indicators depend only on the closes, which key the disk cache
+            cached_set = await asyncio.to_thread(signal_disk_cache.get_entry, symbol, period, prices)
+            if cached_set is not None:
+                state.indicator_set = tuple(cached_set)
+            else:
+                state.indicator_set = _indicator_sets([prices])[0]
+                await asyncio.to_thread(
+                    signal_disk_cache.set_entry, symbol, period, prices, state.indicator_set
+                )
         
-        return result
+        state.bundle = _assemble_signal_bundle(symbol, period, current_price, *state.indicator_set)
+        
+        try:
+            await cache_technical_indicator(symbol, cache_key, state.bundle, ttl=SIGNAL_CACHE_TTL)
+        except Exception as e:
+            logger.warning(f"Indicator cache unavailable for {symbol}: {e}")
+        
+        return state.bundle
         
     except Exception as e:
-        logger.error(f"Error computing signals for {symbol}: {e}")
+        logger.error(f"Error computing incremental signals for {symbol}: {e}")
         return None
 
 
-async def get_market_overview(symbols: List[str]) -> Dict[str, Any]:
+async def compute_signal_bundle_batch(symbols: List[str], period: str = "1mo") -> List[Any]:
+    """
+    Compute signal bundles for many symbols with one kernel pass per indicator.
+    
+    Price histories are fetched concurrently (at most OVERVIEW_CONCURRENCY
+    in flight across all batches). Bundles already computed from the same
+    closes and quote, by any signal path, are served from the content-keyed
+    indicator cache with one MGET. The remaining series are stacked into a
+    (N_symbols x SIGNAL_LOOKBACK) matrix left-padded with NaN, so every
+    indicator is computed for all of them in a single call instead of once
+    per symbol, in a worker thread for batches of THREAD_OFFLOAD_MIN or
+    more (at most one per CPU at a time). New bundles are cached in one
+    pipelined round trip.
+    
+    Args:
+        symbols: List of asset symbols
+        period: Historical period for analysis
+        
+    Returns:
+        List: One entry per symbol, in order: the signal bundle, None when no
+        usable price data is available, or the exception raised while fetching
+    """
+    results: List[Any] = [None] * len(symbols)
+    
+    # Fetch price data, bounded across all batches; a symbol whose fetch
+    # fails or overruns its deadline records the error in place without
+    # holding up the rest
+    async def bounded_fetch(index: int) -> Optional[Dict[str, Any]]:
+        symbol = symbols[index]
+        try:
+            async with _fetch_semaphore:
+                return await asyncio.wait_for(get_price_with_history(symbol, period), OVERVIEW_FETCH_TIMEOUT)
+        except asyncio.TimeoutError:
+            error: Exception = TimeoutError(f"Price data timed out after {OVERVIEW_FETCH_TIMEOUT:g}s")
+        except Exception as e:
+            error = e
+        logger.warning(f"Failed to fetch price data for {symbol}: {error}")
+        results[index] = error
+        return None
+    
+    fetched = await asyncio.gather(*(bounded_fetch(index) for index in range(len(symbols))))
+    
+    rows: List[Tuple[int, float, str]] = []
+    series: List[np.ndarray] = []
+    for index, price_data in enumerate(fetched):
+        symbol = symbols[index]
+        if results[index] is not None:
+            continue
+        if not price_data:
+            logger.warning(f"No price data available for {symbol}")
+            continue
+        prices = _price_series(symbol, price_data)
+        if len(prices) < MIN_SIGNAL_HISTORY:
+            logger.warning(f"Insufficient data for {symbol}: {len(prices)} points")
+            continue
+        current_price = price_data["current_price"]
+        rows.append((index, current_price, _series_cache_key(period, prices, current_price)))
+        series.append(prices)
+    
+    if not rows:
+        return results
+    
+    # Serve bundles computed from this exact data, for all symbols in one round trip
+    try:
+        cached = await get_cached_indicators_batch([(symbols[index], cache_key) for index, _, cache_key in rows])
+    except Exception as e:
+        logger.warning(f"Indicator cache unavailable for batch lookup: {e}")
+        cached = [None] * len(rows)
+    
+    misses: List[Tuple[int, float, str]] = []
+    miss_series: List[np.ndarray] = []
+    for row, prices, hit in zip(rows, series, cached):
+        if hit:
+            results[row[0]] = hit
+        else:
+            misses.append(row)
+            miss_series.append(prices)
+    
+    if not misses:
+        return results
+    
+    # Indicators and signals for every symbol as column operations; large
+    # batches run in a worker thread so the event loop keeps serving requests
+    current_prices = [current_price for _, current_price, _ in misses]
+    if len(miss_series) >= THREAD_OFFLOAD_MIN:
+        async with _compute_semaphore:
+            indicator_sets, signal_sets = await asyncio.to_thread(_score_batch, miss_series, current_prices)
+    else:
+        indicator_sets, signal_sets = _score_batch(miss_series, current_prices)
+    
+    computed = []
+    for (index, current_price, cache_key), indicator_set, signals in zip(misses, indicator_sets, signal_sets):
+        result = _assemble_signal_bundle(symbols[index], period, current_price, *indicator_set, signals=signals)
+        results[index] = result
+        computed.append((symbols[index], cache_key, result))
+    
+    # Cache the results in one round trip
+    try:
+        await cache_technical_indicators_batch(computed, ttl=SIGNAL_CACHE_TTL)
+    except Exception as e:
+        logger.warning(f"Indicator cache unavailable for batch store: {e}")
+    
+    logger.info(f"Computed signals for {len(computed)}/{len(symbols)} symbols in one batch")
+    return results
+
+
+async def get_market_overview(symbols: List[str], period: str = "1mo") -> Dict[str, Any]:
     """
     Get technical analysis overview for multiple symbols.
     
     Args:
         symbols: List of asset symbols
+        period: Historical period for analysis
         
     Returns:
-        Dict: Market overview with signals for all symbols
+        Dict: Market overview with signals for all symbols. The complete
+        per-symbol signal bundles are included under "symbols_full" so
+        callers needing full detail do not have to recompute them.
     """
     try:
         logger.info(f"Generating market overview for {len(symbols)} symbols")
         
-        # Compute signals for all symbols
-        tasks = [compute_signal_bundle(symbol) for symbol in symbols]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Compute signals for all symbols in one batch
+        results = await compute_signal_bundle_batch(symbols, period)
         
-        overview = {
-            "timestamp": datetime.utcnow().isoformat(),
-            "total_symbols": len(symbols),
-            "successful_analyses": 0,
-            "signals_summary": {
-                "BUY": 0,
-                "SELL": 0,
-                "HOLD": 0
-            },
-            "strong_signals": [],
-            "symbols": {}
-        }
+        symbol_summaries: Dict[str, Dict[str, Any]] = {}
+        symbols_full: Dict[str, Dict[str, Any]] = {}
         
         for symbol, result in zip(symbols, results):
             if isinstance(result, Exception):
                 logger.warning(f"Failed to analyze {symbol}: {result}")
-                overview["symbols"][symbol] = {"error": str(result)}
+                symbol_summaries[symbol] = {"error": str(result)}
             elif result:
-                overview["successful_analyses"] += 1
-                overview["signals_summary"][result["signal"]] += 1
-                
-                if result["signal_strength"] >= SignalStrength.STRONG.value:
-                    overview["strong_signals"].append({
-                        "symbol": symbol,
-                        "signal": result["signal"],
-                        "confidence": result["confidence"]
-                    })
-                
-                overview["symbols"][symbol] = {
+                symbol_summaries[symbol] = {
                     "signal": result["signal"],
                     "confidence": result["confidence"],
                     "trend": result["trend_direction"],
                     "risk": result["risk_level"],
                     "price": result["current_price"]
                 }
+                symbols_full[symbol] = result
             else:
-                overview["symbols"][symbol] = {"error": "No data available"}
+                symbol_summaries[symbol] = {"error": "No data available"}
+        
+        # Aggregate over the successful analyses as arrays: one counting pass
+        # for the summary and one mask for strong signals
+        analyzed = list(symbols_full.items())
+        signal_labels = np.array([result["signal"] for _, result in analyzed], dtype=str)
+        strengths = np.fromiter(
+            (result["signal_strength"] for _, result in analyzed), dtype=np.int8, count=len(analyzed)
+        )
+        
+        signals_summary = {"BUY": 0, "SELL": 0, "HOLD": 0}
+        labels, counts = np.unique(signal_labels, return_counts=True)
+        signals_summary.update(zip(labels.tolist(), counts.tolist()))
+        
+        strong_signals = [
+            {
+                "symbol": analyzed[i][0],
+                "signal": analyzed[i][1]["signal"],
+                "confidence": analyzed[i][1]["confidence"]
+            }
+            for i in np.flatnonzero(strengths >= SignalStrength.STRONG.value).tolist()
+        ]
+        
+        overview = {
+            "timestamp": utc_iso_now(),
+            "total_symbols": len(symbols),
+            "successful_analyses": len(analyzed),
+            "signals_summary": signals_summary,
+            "strong_signals": strong_signals,
+            "symbols": symbol_summaries,
+            "symbols_full": symbols_full
+        }
         
         return overview
         
     except Exception as e:
         logger.error(f"Error generating market overview: {e}")
         return {"error": str(e)}
-
-
-# Import asyncio for the market overview function
-import asyncio
-
-
@@ -16,9 +16,11 @@ Features:
 - Fallback mechanisms for missing data
 """
 
-import httpx
-from typing import Optional, Dict, Any, List
+import asyncio
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime, timedelta
+
+import orjson
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
@@ -26,6 +28,7 @@ from app.config import settings
 from app.core.cache import get_cache
 from app.core.logging import get_logger
 from app.models.asset import Asset
+from app.services.alphavantage_service import acquire_rate_limit, get_http_client
 
 logger = get_logger(__name__)
 
@@ -34,11 +37,50 @@ ALPHA_VANTAGE_BASE_URL = "https://www.alphavantage.co/query"
 ALPHA_VANTAGE_COMPANY_OVERVIEW = "OVERVIEW"
 ALPHA_VANTAGE_EARNINGS = "EARNINGS"
 
+# Maximum concurrent metadata lookups, shared by all batch callers, to
+# stay within the Alpha Vantage request quota
+METADATA_CONCURRENCY = 5
+
+_metadata_semaphore = asyncio.Semaphore(METADATA_CONCURRENCY)
+
+# In-flight Alpha Vantage overview fetches, keyed by symbol
+_inflight: Dict[str, "asyncio.Future[Optional[Dict[str, Any]]]"] = {}
+
+# Default metadata for well-known symbols
+_SYMBOL_DEFAULTS = {
+    "AAPL": {"name": "Apple Inc.", "sector": "Technology", "industry": "Consumer Electronics", "exchange": "NASDAQ"},
+    "GOOGL": {"name": "Alphabet Inc.", "sector": "Technology", "industry": "Internet Services", "exchange": "NASDAQ"},
+    "MSFT": {"name": "Microsoft Corporation", "sector": "Technology", "industry": "Software", "exchange": "NASDAQ"},
+    "AMZN": {"name": "Amazon.com Inc.", "sector": "Consumer", "industry": "E-commerce", "exchange": "NASDAQ"},
+    "TSLA": {"name": "Tesla Inc.", "sector": "Consumer", "industry": "Automotive", "exchange": "NASDAQ"},
+    "NVDA": {"name": "NVIDIA Corporation", "sector": "Technology", "industry": "Semiconductors", "exchange": "NASDAQ"},
+    "META": {"name": "Meta Platforms Inc.", "sector": "Technology", "industry": "Social Media", "exchange": "NASDAQ"},
+    "JPM": {"name": "JPMorgan Chase & Co.", "sector": "Financial", "industry": "Banking", "exchange": "NYSE"},
+    "BAC": {"name": "Bank of America Corp.", "sector": "Financial", "industry": "Banking", "exchange": "NYSE"},
+    "WFC": {"name": "Wells Fargo & Company", "sector": "Financial", "industry": "Banking", "exchange": "NYSE"},
+    "JNJ": {"name": "Johnson & Johnson", "sector": "Healthcare", "industry": "Pharmaceuticals", "exchange": "NYSE"},
+    "PFE": {"name": "Pfizer Inc.", "sector": "Healthcare", "industry": "Pharmaceuticals", "exchange": "NYSE"},
+    "KO": {"name": "The Coca-Cola Company", "sector": "Consumer", "industry": "Beverages", "exchange": "NYSE"},
+    "PEP": {"name": "PepsiCo Inc.", "sector": "Consumer", "industry": "Beverages", "exchange": "NASDAQ"},
+    "BTC": {"name": "Bitcoin", "type": "crypto", "sector": "Cryptocurrency", "industry": "Digital Currency", "exchange": "Crypto"},
+    "ETH": {"name": "Ethereum", "type": "crypto", "sector": "Cryptocurrency", "industry": "Digital Currency", "exchange": "Crypto"},
+    "ADA": {"name": "Cardano", "type": "crypto", "sector": "Cryptocurrency", "industry": "Digital Currency", "exchange": "Crypto"}
+}
+
+# (sector, industry) lookup derived once from the defaults
+_SYMBOL_META = {
+    symbol: (meta.get("sector", "Other"), meta.get("industry", "General"))
+    for symbol, meta in _SYMBOL_DEFAULTS.items()
+}
+
 
 async def get_asset_metadata(symbol: str, db: Optional[AsyncSession] = None) -> Dict[str, Any]:
     """
     Get comprehensive asset metadata.
     
+    Concurrent cache misses for the same symbol share a single Alpha
+    Vantage request, so a burst costs one call against the rate limit.
+    
     Args:
         symbol: Asset symbol
         db: Optional database session for storing metadata
@@ -73,9 +115,15 @@ async def get_asset_metadata(symbol: str, db: Optional[AsyncSession] = None) ->
                 "industry": getattr(asset, 'industry', None)
             }
     
-    # If not in database, try external API
+    # If not in database, try external API; concurrent misses for the
+    # same symbol share one request
     if not metadata:
-        metadata = await _fetch_alpha_vantage_metadata(symbol_upper)
+        fetch = _inflight.get(symbol_upper)
+        if fetch is None:
+            fetch = asyncio.ensure_future(_fetch_alpha_vantage_metadata(symbol_upper))
+            _inflight[symbol_upper] = fetch
+            fetch.add_done_callback(lambda _: _inflight.pop(symbol_upper, None))
+        metadata = await asyncio.shield(fetch)
         
         # Store in database if session provided
         if db and metadata:
@@ -111,51 +159,54 @@ async def _fetch_alpha_vantage_metadata(symbol: str) -> Optional[Dict[str, Any]]
             "apikey": settings.ALPHA_VANTAGE_API_KEY
         }
         
-        async with httpx.AsyncClient(timeout=15) as client:
-            response = await client.get(ALPHA_VANTAGE_BASE_URL, params=params)
-            
-            if response.status_code != 200:
-                logger.warning(f"Alpha Vantage API error: {response.status_code}")
-                return None
-            
-            data = response.json()
-            
-            # Check for API errors
-            if "Error Message" in data:
-                logger.warning(f"Alpha Vantage error for {symbol}: {data['Error Message']}")
-                return None
-            
-            if "Note" in data:
-                logger.warning(f"Alpha Vantage rate limit for {symbol}")
-                return None
-            
-            # Extract metadata
-            if not data or "Symbol" not in data:
-                return None
-            
-            metadata = {
-                "symbol": data.get("Symbol", symbol),
-                "name": data.get("Name", f"{symbol} Corporation"),
-                "type": "stock",  # Alpha Vantage primarily covers stocks
-                "exchange": data.get("Exchange", "NASDAQ"),
-                "currency": data.get("Currency", "USD"),
-                "sector": data.get("Sector"),
-                "industry": data.get("Industry"),
-                "pe_ratio": _parse_float(data.get("PERatio")),
-                "pb_ratio": _parse_float(data.get("PriceToBookRatio")),
-                "dividend_yield": _parse_float(data.get("DividendYield")),
-                "market_cap": _parse_float(data.get("MarketCapitalization")),
-                "beta": _parse_float(data.get("Beta")),
-                "52_week_high": _parse_float(data.get("52WeekHigh")),
-                "52_week_low": _parse_float(data.get("52WeekLow")),
-                "eps": _parse_float(data.get("EPS")),
-                "revenue": _parse_float(data.get("RevenueTTM")),
-                "profit_margin": _parse_float(data.get("ProfitMargin"))
-            }
-            
-            logger.info(f"Fetched metadata from Alpha Vantage for {symbol}")
-            return metadata
-            
+        # Overview requests share the Alpha Vantage quota with price fetches
+        await acquire_rate_limit("alphavantage")
+        
+        client = await get_http_client()
+        response = await client.get(ALPHA_VANTAGE_BASE_URL, params=params)
+        
+        if response.status_code != 200:
+            logger.warning(f"Alpha Vantage API error: {response.status_code}")
+            return None
+        
+        data = orjson.loads(response.content)
+        
+        # Check for API errors
+        if "Error Message" in data:
+            logger.warning(f"Alpha Vantage error for {symbol}: {data['Error Message']}")
+            return None
+        
+        if "Note" in data:
+            logger.warning(f"Alpha Vantage rate limit for {symbol}")
+            return None
+        
+        # Extract metadata
+        if not data or "Symbol" not in data:
+            return None
+        
+        metadata = {
+            "symbol": data.get("Symbol", symbol),
+            "name": data.get("Name", f"{symbol} Corporation"),
+            "type": "stock",  # Alpha Vantage primarily covers stocks
+            "exchange": data.get("Exchange", "NASDAQ"),
+            "currency": data.get("Currency", "USD"),
+            "sector": data.get("Sector"),
+            "industry": data.get("Industry"),
+            "pe_ratio": _parse_float(data.get("PERatio")),
+            "pb_ratio": _parse_float(data.get("PriceToBookRatio")),
+            "dividend_yield": _parse_float(data.get("DividendYield")),
+            "market_cap": _parse_float(data.get("MarketCapitalization")),
+            "beta": _parse_float(data.get("Beta")),
+            "52_week_high": _parse_float(data.get("52WeekHigh")),
+            "52_week_low": _parse_float(data.get("52WeekLow")),
+            "eps": _parse_float(data.get("EPS")),
+            "revenue": _parse_float(data.get("RevenueTTM")),
+            "profit_margin": _parse_float(data.get("ProfitMargin"))
+        }
+        
+        logger.info(f"Fetched metadata from Alpha Vantage for {symbol}")
+        return metadata
+        
     except Exception as e:
         logger.error(f"Error fetching Alpha Vantage metadata for {symbol}: {e}")
         return None
@@ -211,27 +262,20 @@ def _apply_defaults(metadata: Optional[Dict[str, Any]], symbol: str) -> Dict[str
 
 def _get_symbol_defaults(symbol: str) -> Dict[str, str]:
     """Get default metadata for well-known symbols."""
-    defaults = {
-        "AAPL": {"name": "Apple Inc.", "sector": "Technology", "industry": "Consumer Electronics", "exchange": "NASDAQ"},
-        "GOOGL": {"name": "Alphabet Inc.", "sector": "Technology", "industry": "Internet Services", "exchange": "NASDAQ"},
-        "MSFT": {"name": "Microsoft Corporation", "sector": "Technology", "industry": "Software", "exchange": "NASDAQ"},
-        "AMZN": {"name": "Amazon.com Inc.", "sector": "Consumer", "industry": "E-commerce", "exchange": "NASDAQ"},
-        "TSLA": {"name": "Tesla Inc.", "sector": "Consumer", "industry": "Automotive", "exchange": "NASDAQ"},
-        "NVDA": {"name": "NVIDIA Corporation", "sector": "Technology", "industry": "Semiconductors", "exchange": "NASDAQ"},
-        "META": {"name": "Meta Platforms Inc.", "sector": "Technology", "industry": "Social Media", "exchange": "NASDAQ"},
-        "JPM": {"name": "JPMorgan Chase & Co.", "sector": "Financial", "industry": "Banking", "exchange": "NYSE"},
-        "BAC": {"name": "Bank of America Corp.", "sector": "Financial", "industry": "Banking", "exchange": "NYSE"},
-        "WFC": {"name": "Wells Fargo & Company", "sector": "Financial", "industry": "Banking", "exchange": "NYSE"},
-        "JNJ": {"name": "Johnson & Johnson", "sector": "Healthcare", "industry": "Pharmaceuticals", "exchange": "NYSE"},
-        "PFE": {"name": "Pfizer Inc.", "sector": "Healthcare", "industry": "Pharmaceuticals", "exchange": "NYSE"},
-        "KO": {"name": "The Coca-Cola Company", "sector": "Consumer", "industry": "Beverages", "exchange": "NYSE"},
-        "PEP": {"name": "PepsiCo Inc.", "sector": "Consumer", "industry": "Beverages", "exchange": "NASDAQ"},
-        "BTC": {"name": "Bitcoin", "type": "crypto", "sector": "Cryptocurrency", "industry": "Digital Currency", "exchange": "Crypto"},
-        "ETH": {"name": "Ethereum", "type": "crypto", "sector": "Cryptocurrency", "industry": "Digital Currency", "exchange": "Crypto"},
-        "ADA": {"name": "Cardano", "type": "crypto", "sector": "Cryptocurrency", "industry": "Digital Currency", "exchange": "Crypto"}
-    }
+    return _SYMBOL_DEFAULTS.get(symbol, {})
+
+
+def get_default_classification(symbol: str) -> Tuple[str, str]:
+    """
+    Get the known (sector, industry) pair for a symbol without any I/O.
     
-    return defaults.get(symbol, {})
+    Args:
+        symbol: Asset symbol
+        
+    Returns:
+        Tuple[str, str]: Sector and industry, ("Other", "General") if unknown
+    """
+    return _SYMBOL_META.get(symbol, ("Other", "General"))
 
 
 async def _store_asset_metadata(symbol: str, metadata: Dict[str, Any], db: AsyncSession) -> None:
@@ -312,22 +356,29 @@ async def batch_get_metadata(symbols: List[str]) -> Dict[str, Dict[str, Any]]:
     """
     Get metadata for multiple symbols efficiently.
     
+    Lookups run concurrently, with at most METADATA_CONCURRENCY in flight
+    across all callers. A symbol whose lookup fails gets default metadata.
+    
     Args:
         symbols: List of asset symbols
         
     Returns:
         Dict: Mapping of symbol to metadata
     """
-    results = {}
+    async def bounded_lookup(symbol: str) -> Dict[str, Any]:
+        async with _metadata_semaphore:
+            return await get_asset_metadata(symbol)
     
-    # Process in batches to avoid overwhelming the API
-    batch_size = 5
-    for i in range(0, len(symbols), batch_size):
-        batch = symbols[i:i + batch_size]
-        
-        # Could parallelize this, but keeping it simple for rate limiting
-        for symbol in batch:
-            metadata = await get_asset_metadata(symbol)
-            results[symbol] = metadata
+    lookups = await asyncio.gather(
+        *(bounded_lookup(symbol) for symbol in symbols),
+        return_exceptions=True
+    )
+    
+    results = {}
+    for symbol, metadata in zip(symbols, lookups):
+        if isinstance(metadata, Exception):
+            logger.warning(f"Metadata lookup failed for {symbol}: {metadata}")
+            metadata = _apply_defaults(None, symbol.upper().strip())
+        results[symbol] = metadata
     
     return results
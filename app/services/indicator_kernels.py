@@ -0,0 +1,358 @@
+"""
+Indicator Kernels - Compiled Multi-Symbol Technical Indicators
+==============================================================
+
+This module provides batch technical indicator kernels for signal analysis:
+- One kernel per indicator (EMA, SMA, RSI, MACD, Bollinger Bands, ATR),
+  with Stochastic and Williams %R sharing one kernel and window scan
+- Inputs are a (N_symbols x T) price matrix, left-padded with NaN, plus
+  the index of each row's first valid price
+- Outputs are per-symbol arrays holding the latest indicator value, NaN
+  where a row has insufficient data
+- Serial compiled loops (numba's parallel thread pool can hang interpreter
+  shutdown when first used from a worker thread, as request handlers are)
+- Compiled kernels release the GIL, so batches computed in worker threads
+  run in parallel with each other and with the event loop
+
+Features:
+- Numba JIT compilation when numba is installed (optional dependency);
+  without numba the same loops run as plain Python
+- Identical arithmetic, summation order and insufficient-data rules to
+  the scalar indicator functions in the analysis service
+- Single dispatch per indicator for a whole batch of symbols
+- Single-series EMA, MACD, RSI and ATR helpers used by the scalar
+  indicator functions when numba is available
+"""
+
+import time
+from typing import Dict, Tuple
+
+import numpy as np
+
+from app.core.jit import NUMBA_AVAILABLE, njit
+
+
+@njit(cache=True, nogil=True)
+def _sma_batch(prices, starts, period):
+    """Simple moving average of the last `period` prices per row."""
+    rows, cols = prices.shape
+    out = np.full(rows, np.nan)
+    for i in range(rows):
+        if period <= 0 or cols - starts[i] < period:
+            continue
+        total = 0.0
+        for j in range(cols - period, cols):
+            total += prices[i, j]
+        out[i] = total / period
+    return out
+
+
+@njit(cache=True, nogil=True)
+def _ema_batch(prices, starts, period):
+    """Exponential moving average seeded with each row's first price."""
+    rows, cols = prices.shape
+    out = np.full(rows, np.nan)
+    multiplier = 2.0 / (period + 1)
+    for i in range(rows):
+        start = starts[i]
+        if period <= 0 or cols - start < period:
+            continue
+        ema = prices[i, start]
+        for j in range(start + 1, cols):
+            ema = (prices[i, j] * multiplier) + (ema * (1 - multiplier))
+        out[i] = ema
+    return out
+
+
+@njit(cache=True, nogil=True)
+def _rsi_batch(prices, starts, period):
+    """RSI from simple average gain/loss over the last `period` changes."""
+    rows, cols = prices.shape
+    out = np.full(rows, np.nan)
+    for i in range(rows):
+        if period <= 0 or cols - starts[i] < period + 1:
+            continue
+        gains = 0.0
+        losses = 0.0
+        for j in range(cols - period, cols):
+            change = prices[i, j] - prices[i, j - 1]
+            if change > 0:
+                gains += change
+            elif change < 0:
+                losses += -change
+        avg_gain = gains / period
+        avg_loss = losses / period
+        if avg_loss == 0:
+            out[i] = 100.0
+        else:
+            out[i] = 100 - (100 / (1 + avg_gain / avg_loss))
+    return out
+
+
+@njit(cache=True, nogil=True)
+def _macd_batch(prices, starts, fast_period, slow_period, signal_period):
+    """MACD line, signal line and histogram from running fast/slow EMAs."""
+    rows, cols = prices.shape
+    macd_out = np.full(rows, np.nan)
+    signal_out = np.full(rows, np.nan)
+    hist_out = np.full(rows, np.nan)
+    fast_mult = 2.0 / (fast_period + 1)
+    slow_mult = 2.0 / (slow_period + 1)
+    signal_mult = 2.0 / (signal_period + 1)
+    for i in range(rows):
+        start = starts[i]
+        if cols - start < slow_period + signal_period:
+            continue
+        ema_fast = prices[i, start]
+        ema_slow = prices[i, start]
+        signal_line = 0.0
+        count = 0
+        for j in range(start + 1, cols):
+            price = prices[i, j]
+            ema_fast = (price * fast_mult) + (ema_fast * (1 - fast_mult))
+            ema_slow = (price * slow_mult) + (ema_slow * (1 - slow_mult))
+            if j - start >= slow_period:
+                macd_value = ema_fast - ema_slow
+                if count == 0:
+                    signal_line = macd_value
+                else:
+                    signal_line = (macd_value * signal_mult) + (signal_line * (1 - signal_mult))
+                count += 1
+        macd_line = ema_fast - ema_slow
+        macd_out[i] = macd_line
+        signal_out[i] = signal_line
+        hist_out[i] = macd_line - signal_line
+    return macd_out, signal_out, hist_out
+
+
+@njit(cache=True, nogil=True)
+def _bollinger_batch(prices, starts, period, num_std):
+    """Bollinger upper/middle/lower bands, width and %B."""
+    rows, cols = prices.shape
+    upper_out = np.full(rows, np.nan)
+    middle_out = np.full(rows, np.nan)
+    lower_out = np.full(rows, np.nan)
+    width_out = np.full(rows, np.nan)
+    percent_b_out = np.full(rows, np.nan)
+    for i in range(rows):
+        if period <= 0 or cols - starts[i] < period:
+            continue
+        total = 0.0
+        for j in range(cols - period, cols):
+            total += prices[i, j]
+        sma = total / period
+        squares = 0.0
+        for j in range(cols - period, cols):
+            squares += (prices[i, j] - sma) ** 2
+        std_dev = np.sqrt(squares / period)
+        upper = sma + (num_std * std_dev)
+        lower = sma - (num_std * std_dev)
+        upper_out[i] = upper
+        middle_out[i] = sma
+        lower_out[i] = lower
+        width_out[i] = upper - lower
+        if upper != lower:
+            percent_b_out[i] = (prices[i, cols - 1] - lower) / (upper - lower) * 100
+        else:
+            percent_b_out[i] = 50.0
+    return upper_out, middle_out, lower_out, width_out, percent_b_out
+
+
+@njit(cache=True, nogil=True)
+def _stochastic_williams_batch(prices, starts, period, k_period):
+    """
+    Stochastic %K/%D and Williams %R over the same `period` windows.
+
+    Williams %R uses the latest window's high and low, which is also the
+    last window %K is computed from, so each window is scanned once.
+    """
+    rows, cols = prices.shape
+    k_out = np.full(rows, np.nan)
+    d_out = np.full(rows, np.nan)
+    williams_out = np.full(rows, np.nan)
+    for i in range(rows):
+        available = cols - starts[i]
+        if period <= 0 or available < period:
+            continue
+        close = prices[i, cols - 1]
+        highest_high = close
+        lowest_low = close
+        for j in range(cols - period, cols - 1):
+            price = prices[i, j]
+            if price > highest_high:
+                highest_high = price
+            if price < lowest_low:
+                lowest_low = price
+        if highest_high == lowest_low:
+            williams_out[i] = -50.0
+        else:
+            williams_out[i] = ((highest_high - close) / (highest_high - lowest_low)) * -100
+        if available - period + 1 < k_period:
+            continue
+        k_total = 0.0
+        k_percent = 50.0
+        for end in range(cols - k_period, cols):
+            if end == cols - 1:
+                window_high = highest_high
+                window_low = lowest_low
+            else:
+                window_high = prices[i, end]
+                window_low = prices[i, end]
+                for j in range(end - period + 1, end):
+                    price = prices[i, j]
+                    if price > window_high:
+                        window_high = price
+                    if price < window_low:
+                        window_low = price
+            if window_high == window_low:
+                k_percent = 50.0
+            else:
+                k_percent = ((prices[i, end] - window_low) / (window_high - window_low)) * 100
+            k_total += k_percent
+        k_out[i] = k_percent
+        d_out[i] = k_total / k_period
+    return k_out, d_out, williams_out
+
+
+@njit(cache=True, nogil=True)
+def _atr_batch(prices, starts, period):
+    """ATR from close-only true ranges (|close - previous close|)."""
+    rows, cols = prices.shape
+    out = np.full(rows, np.nan)
+    for i in range(rows):
+        if period <= 0 or cols - starts[i] < period + 1:
+            continue
+        total = 0.0
+        for j in range(cols - period, cols):
+            total += abs(prices[i, j] - prices[i, j - 1])
+        out[i] = total / period
+    return out
+
+
+def compute_indicator_batch(prices: np.ndarray, starts: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Compute every signal indicator for a batch of symbols.
+
+    Uses the same parameters as the single-symbol signal path: RSI(14),
+    EMA(20/50), SMA(20), ATR(14), Williams %R(14), MACD(12, 26, 9),
+    Bollinger Bands(20, 2.0) and Stochastic(14, 3).
+
+    Args:
+        prices: float64 array of shape (N_symbols, T), most recent close
+            last, left-padded with NaN for shorter histories
+        starts: int64 array of shape (N_symbols,) with the index of each
+            row's first valid price
+
+    Returns:
+        Dict[str, np.ndarray]: Per-symbol latest value for each indicator,
+        NaN where the row has insufficient data
+    """
+    macd_line, macd_signal, macd_histogram = _macd_batch(prices, starts, 12, 26, 9)
+    bb_upper, bb_middle, bb_lower, bb_width, bb_percent_b = _bollinger_batch(prices, starts, 20, 2.0)
+    stoch_k, stoch_d, williams_r = _stochastic_williams_batch(prices, starts, 14, 3)
+
+    return {
+        "rsi": _rsi_batch(prices, starts, 14),
+        "ema_20": _ema_batch(prices, starts, 20),
+        "ema_50": _ema_batch(prices, starts, 50),
+        "sma_20": _sma_batch(prices, starts, 20),
+        "atr": _atr_batch(prices, starts, 14),
+        "williams_r": williams_r,
+        "macd": macd_line,
+        "macd_signal": macd_signal,
+        "macd_histogram": macd_histogram,
+        "bb_upper": bb_upper,
+        "bb_middle": bb_middle,
+        "bb_lower": bb_lower,
+        "bb_width": bb_width,
+        "bb_percent_b": bb_percent_b,
+        "stoch_k": stoch_k,
+        "stoch_d": stoch_d,
+    }
+
+
+def _single_row(values) -> Tuple[np.ndarray, np.ndarray]:
+    """Shape one price series as a one-row batch starting at column 0."""
+    prices = np.ascontiguousarray(values, dtype=np.float64).reshape(1, -1)
+    return prices, np.zeros(1, dtype=np.int64)
+
+
+def latest_rsi(values, period: int) -> float:
+    """
+    RSI of a single price series via the batch kernel.
+
+    Args:
+        values: Price values (most recent last), at least period + 1 long
+        period: RSI period (positive)
+
+    Returns:
+        float: Latest RSI value
+    """
+    return float(_rsi_batch(*_single_row(values), period)[0])
+
+
+def latest_atr(values, period: int) -> float:
+    """
+    Close-only ATR of a single price series via the batch kernel.
+
+    Args:
+        values: Price values (most recent last), at least period + 1 long
+        period: ATR period (positive)
+
+    Returns:
+        float: Latest ATR value
+    """
+    return float(_atr_batch(*_single_row(values), period)[0])
+
+
+def latest_ema(values, period: int) -> float:
+    """
+    EMA of a single price series via the batch kernel.
+
+    Args:
+        values: Price values (most recent last), at least period long
+        period: EMA period (positive)
+
+    Returns:
+        float: Latest EMA value
+    """
+    return float(_ema_batch(*_single_row(values), period)[0])
+
+
+def latest_macd(values, fast_period: int, slow_period: int, signal_period: int) -> Tuple[float, float, float]:
+    """
+    MACD of a single price series via the batch kernel.
+
+    Args:
+        values: Price values (most recent last), at least
+            slow_period + signal_period long
+        fast_period: Fast EMA period (positive, at most slow_period)
+        slow_period: Slow EMA period (positive)
+        signal_period: Signal line EMA period (positive)
+
+    Returns:
+        Tuple[float, float, float]: Latest MACD line, signal line and histogram
+    """
+    macd_line, signal_line, histogram = _macd_batch(
+        *_single_row(values), fast_period, slow_period, signal_period
+    )
+    return float(macd_line[0]), float(signal_line[0]), float(histogram[0])
+
+
+def warmup() -> float:
+    """
+    Compile every indicator kernel by running it once on a small batch.
+    
+    With numba the first call of each kernel triggers compilation (or a
+    load from the on-disk cache); calling this at startup keeps that cost
+    off the first signal request.
+    
+    Returns:
+        float: Elapsed seconds
+    """
+    started = time.perf_counter()
+    prices = np.ones((2, 64), dtype=np.float64)
+    prices[1, :8] = np.nan
+    starts = np.array([0, 8], dtype=np.int64)
+    compute_indicator_batch(prices, starts)
+    return time.perf_counter() - started
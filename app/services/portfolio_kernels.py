@@ -0,0 +1,77 @@
+"""
+Portfolio Kernels - Compiled Portfolio Series Statistics
+========================================================
+
+This module provides a compiled statistics kernel for portfolio analytics:
+- Daily returns, their mean and sample variance (Welford) and the maximum
+  drawdown, all in a single scalar pass over the value series
+- No intermediate returns, peaks or drawdown arrays are allocated, so the
+  cost stays linear with a small constant on long (multi-year) histories
+
+Features:
+- Numba JIT compilation when numba is installed (optional dependency)
+- Same return and drawdown rules as the NumPy statistics in the portfolio
+  service (non-positive bases skipped, zero drawdown while the running
+  peak is not positive)
+- Callers fall back to NumPy when NUMBA_AVAILABLE is False
+"""
+
+import time
+from typing import Tuple
+
+import numpy as np
+
+from app.core.jit import NUMBA_AVAILABLE, njit
+
+
+@njit(cache=True)
+def _series_statistics(values):
+    """Return count, mean and sample variance of daily returns, and max drawdown."""
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    peak = values[0]
+    max_drawdown = 0.0
+    for i in range(values.shape[0]):
+        value = values[i]
+        if i > 0 and values[i - 1] > 0:
+            daily_return = (value - values[i - 1]) / values[i - 1]
+            count += 1
+            delta = daily_return - mean
+            mean += delta / count
+            m2 += delta * (daily_return - mean)
+        if value > peak:
+            peak = value
+        if peak > 0:
+            drawdown = (peak - value) / peak
+            if drawdown > max_drawdown:
+                max_drawdown = drawdown
+    variance = m2 / (count - 1) if count > 1 else 0.0
+    return count, mean, variance, max_drawdown
+
+
+def series_statistics(values: np.ndarray) -> Tuple[int, float, float, float]:
+    """
+    Compute daily return and drawdown statistics for a value series.
+
+    Args:
+        values: Portfolio values over time (float64, at least one value)
+
+    Returns:
+        Tuple[int, float, float, float]: Number of daily returns, their mean
+        and sample variance (0.0 for fewer than two returns), and the
+        maximum drawdown as a positive fraction
+    """
+    return _series_statistics(values)
+
+
+def warmup() -> float:
+    """
+    Compile the statistics kernel by running it once on a small series.
+
+    Returns:
+        float: Elapsed seconds
+    """
+    started = time.perf_counter()
+    series_statistics(np.linspace(1.0, 2.0, 64))
+    return time.perf_counter() - started
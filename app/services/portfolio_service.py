@@ -19,10 +19,12 @@ Features:
 """
 
 import math
-import statistics
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
 
+import numpy as np
+
+from app.services import portfolio_kernels
 from app.services.alphavantage_service import get_price_with_history, get_multiple_prices
 from app.core.logging import get_logger
 
@@ -63,31 +65,25 @@ async def calculate_portfolio_metrics(
         # Fallback to simple metrics if insufficient history
         return _calculate_simple_metrics(positions, current_prices, risk_free_rate)
     
-    # Calculate returns
-    returns = _calculate_returns_from_values(portfolio_values)
+    # Calculate return and risk statistics from the value series
+    stats = _calculate_series_statistics(portfolio_values)
     
-    if not returns:
+    if stats is None:
         return _calculate_simple_metrics(positions, current_prices, risk_free_rate)
     
     # Calculate metrics
-    volatility = _calculate_volatility(returns)
-    sharpe_ratio = _calculate_sharpe_ratio(returns, risk_free_rate, volatility)
+    sharpe_ratio = _calculate_sharpe_ratio(stats["annualized_return"], risk_free_rate, stats["volatility"])
     beta = await _calculate_portfolio_beta(positions, current_prices)
-    max_drawdown = _calculate_max_drawdown(portfolio_values)
     diversification_score = _calculate_diversification_score(positions)
     
-    # Calculate total and annualized returns
-    total_return = _calculate_total_return(portfolio_values)
-    annualized_return = _calculate_annualized_return(returns)
-    
     return {
         "sharpe_ratio": round(sharpe_ratio, 4),
         "beta": round(beta, 4),
-        "volatility": round(volatility, 4),
-        "max_drawdown": round(max_drawdown, 4),
+        "volatility": round(stats["volatility"], 4),
+        "max_drawdown": round(stats["max_drawdown"], 4),
         "diversification_score": round(diversification_score, 2),
-        "total_return": round(total_return, 4),
-        "annualized_return": round(annualized_return, 4),
+        "total_return": round(stats["total_return"], 4),
+        "annualized_return": round(stats["annualized_return"], 4),
         "risk_free_rate": risk_free_rate
     }
 
@@ -157,44 +153,63 @@ async def _calculate_portfolio_returns(
     return portfolio_values
 
 
-def _calculate_returns_from_values(values: List[float]) -> List[float]:
-    """Calculate returns from portfolio values."""
-    if len(values) < 2:
-        return []
-    
-    returns = []
-    for i in range(1, len(values)):
-        if values[i-1] > 0:
-            daily_return = (values[i] - values[i-1]) / values[i-1]
-            returns.append(daily_return)
-    
-    return returns
-
-
-def _calculate_volatility(returns: List[float]) -> float:
+def _calculate_series_statistics(values: np.ndarray) -> Optional[Dict[str, float]]:
     """
-    Calculate annualized volatility from daily returns.
+    Calculate return and risk statistics from portfolio values.
+    
+    Daily returns are derived once and shared by every statistic, and the
+    return mean feeds both the annualized return and the volatility. With
+    numba the whole computation is one compiled pass over the series.
     
     Args:
-        returns: List of daily returns
+        values: Portfolio values over time
         
     Returns:
-        float: Annualized volatility (standard deviation * sqrt(252))
+        Optional[Dict]: Annualized volatility and return, maximum drawdown
+        (as a negative fraction) and total return, or None when the series
+        yields no daily returns
     """
-    if not returns or len(returns) < 2:
-        return 0.0
+    values = np.asarray(values, dtype=np.float64)
+    if len(values) < 2:
+        return None
+    
+    if portfolio_kernels.NUMBA_AVAILABLE:
+        count, avg_daily_return, variance, max_drawdown = portfolio_kernels.series_statistics(values)
+        if count == 0:
+            return None
+        std_dev = math.sqrt(variance)
+    else:
+        # Daily returns, skipping non-positive bases
+        previous = values[:-1]
+        valid = previous > 0
+        if not valid.any():
+            return None
+        returns = (values[1:][valid] - previous[valid]) / previous[valid]
+        
+        # Mean and sample standard deviation
+        avg_daily_return = float(returns.mean())
+        deviations = returns - avg_daily_return
+        std_dev = math.sqrt(float(deviations @ deviations) / (len(returns) - 1)) if len(returns) > 1 else 0.0
+        
+        # Drawdown from the running peak; zero while the peak is not positive
+        peaks = np.maximum.accumulate(values)
+        drawdowns = np.divide(peaks - values, peaks, out=np.zeros_like(values), where=peaks > 0)
+        max_drawdown = float(drawdowns.max())
     
-    try:
-        std_dev = statistics.stdev(returns)
-        # Annualize: multiply by sqrt(252 trading days)
-        annualized_vol = std_dev * math.sqrt(252)
-        return annualized_vol
-    except:
-        return 0.0
+    initial_value = values[0]
+    total_return = float((values[-1] - initial_value) / initial_value) if initial_value != 0 else 0.0
+    
+    # Annualize over 252 trading days
+    return {
+        "volatility": std_dev * math.sqrt(252),
+        "annualized_return": avg_daily_return * 252,
+        "max_drawdown": -max_drawdown,
+        "total_return": total_return
+    }
 
 
 def _calculate_sharpe_ratio(
-    returns: List[float],
+    annualized_return: float,
     risk_free_rate: float,
     volatility: float
 ) -> float:
@@ -204,31 +219,14 @@ def _calculate_sharpe_ratio(
     Sharpe Ratio = (Portfolio Return - Risk-Free Rate) / Volatility
     
     Args:
-        returns: List of daily returns
+        annualized_return: Annualized portfolio return
         risk_free_rate: Annual risk-free rate
         volatility: Annualized volatility
         
     Returns:
         float: Sharpe ratio
     """
-    if not returns or volatility == 0:
-        return 0.0
-    
-    try:
-        # Calculate average daily return
-        avg_daily_return = statistics.mean(returns)
-        
-        # Annualize return (multiply by 252 trading days)
-        annualized_return = avg_daily_return * 252
-        
-        # Daily risk-free rate
-        daily_rf_rate = risk_free_rate / 252
-        
-        # Sharpe ratio
-        sharpe = (annualized_return - risk_free_rate) / volatility if volatility > 0 else 0.0
-        return sharpe
-    except:
-        return 0.0
+    return (annualized_return - risk_free_rate) / volatility if volatility > 0 else 0.0
 
 
 async def _calculate_portfolio_beta(
@@ -275,38 +273,6 @@ async def _calculate_portfolio_beta(
     return weighted_beta_sum / total_value
 
 
-def _calculate_max_drawdown(values: List[float]) -> float:
-    """
-    Calculate maximum drawdown from portfolio values.
-    
-    Max Drawdown = (Peak Value - Trough Value) / Peak Value
-    
-    Args:
-        values: List of portfolio values over time
-        
-    Returns:
-        float: Maximum drawdown as negative percentage
-    """
-    if not values or len(values) < 2:
-        return 0.0
-    
-    try:
-        peak = values[0]
-        max_dd = 0.0
-        
-        for value in values:
-            if value > peak:
-                peak = value
-            
-            drawdown = (peak - value) / peak if peak > 0 else 0.0
-            if drawdown > max_dd:
-                max_dd = drawdown
-        
-        return -max_dd  # Return as negative
-    except:
-        return 0.0
-
-
 def _calculate_diversification_score(positions: List[Dict[str, Any]]) -> float:
     """
     Calculate diversification score based on number of positions and concentration.
@@ -344,33 +310,6 @@ def _calculate_diversification_score(positions: List[Dict[str, Any]]) -> float:
     return diversification_score
 
 
-def _calculate_total_return(portfolio_values: List[float]) -> float:
-    """Calculate total return from portfolio values."""
-    if not portfolio_values or len(portfolio_values) < 2:
-        return 0.0
-    
-    initial_value = portfolio_values[0]
-    final_value = portfolio_values[-1]
-    
-    if initial_value == 0:
-        return 0.0
-    
-    return (final_value - initial_value) / initial_value
-
-
-def _calculate_annualized_return(returns: List[float]) -> float:
-    """Calculate annualized return from daily returns."""
-    if not returns:
-        return 0.0
-    
-    try:
-        avg_daily_return = statistics.mean(returns)
-        annualized = avg_daily_return * 252  # 252 trading days
-        return annualized
-    except:
-        return 0.0
-
-
 async def _calculate_simple_metrics(
     positions: List[Dict[str, Any]],
     current_prices: Dict[str, Dict[str, Any]],
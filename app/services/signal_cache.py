@@ -0,0 +1,96 @@
+"""
+Signal Cache - In-Process TTL Cache for Signal Computation
+==========================================================
+
+This module provides a small in-process cache layer for signal analysis:
+- Async TTL + LRU memoization decorator for coroutine functions
+- Per-key in-flight futures so concurrent misses for the same key are
+  coalesced into a single upstream computation (thundering-herd protection)
+- Bounded size with least-recently-used eviction
+
+Features:
+- O(1) lookups for repeated (symbol, period) requests within the TTL
+- Failed computations (None results or exceptions) are never cached; callers
+  that were waiting on one share its outcome
+- Sits in front of the Redis indicator cache, avoiding a network round
+  trip for hot symbols polled by dashboards
+"""
+
+import asyncio
+import functools
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+def async_ttl_cache(
+    maxsize: int = 512,
+    ttl_seconds: float = 30.0,
+    key: Optional[Callable[..., Hashable]] = None
+) -> Callable[[Callable[..., Awaitable[Any]]], Callable[..., Awaitable[Any]]]:
+    """
+    Memoize a coroutine function with a TTL and LRU eviction.
+
+    Args:
+        maxsize: Maximum number of cached entries
+        ttl_seconds: Time-to-live for each entry in seconds
+        key: Optional function mapping the call arguments to a cache key;
+            defaults to the positional and keyword arguments themselves
+
+    Returns:
+        Callable: Decorator producing the cached coroutine function. The
+        wrapper exposes cache_clear() to drop all entries.
+    """
+    def decorator(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        inflight: Dict[Hashable, "asyncio.Future[Any]"] = {}
+
+        def lookup(cache_key: Hashable) -> Tuple[bool, Any]:
+            entry = entries.get(cache_key)
+            if entry is None:
+                return False, None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del entries[cache_key]
+                return False, None
+            entries.move_to_end(cache_key)
+            return True, value
+
+        async def compute(cache_key: Hashable, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Any:
+            value = await func(*args, **kwargs)
+            if value is not None:
+                entries[cache_key] = (time.monotonic() + ttl_seconds, value)
+                entries.move_to_end(cache_key)
+                while len(entries) > maxsize:
+                    entries.popitem(last=False)
+            return value
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if key is not None:
+                cache_key = key(*args, **kwargs)
+            else:
+                cache_key = (args, tuple(sorted(kwargs.items())))
+
+            hit, value = lookup(cache_key)
+            if hit:
+                return value
+
+            # Concurrent misses for the same key share one computation
+            fetch = inflight.get(cache_key)
+            if fetch is None:
+                fetch = asyncio.ensure_future(compute(cache_key, args, kwargs))
+                inflight[cache_key] = fetch
+                fetch.add_done_callback(
+                    lambda done: inflight.pop(cache_key) if inflight.get(cache_key) is done else None
+                )
+            return await asyncio.shield(fetch)
+
+        def cache_clear() -> None:
+            entries.clear()
+            inflight.clear()
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
@@ -0,0 +1,207 @@
+"""
+Signal Disk Cache - Persistent Indicator Cache Keyed by Bar Time
+================================================================
+
+This module provides a second, disk-backed cache level for signal analysis:
+- Indicator values per (symbol, period, digest of the analyzed closes), so
+  new bars and revised closes naturally miss and no TTL is needed
+- Entries stored as orjson bytes, one file per key, written atomically
+- Shared by every worker process on the host and kept across restarts
+
+Features:
+- Survives the in-process TTL cache and streaming state being dropped on
+  restart, so a freshly started worker does not recompute indicators for
+  a window another worker (or a previous run) already analyzed
+- Bounded total size with oldest-first eviction, run in a background
+  thread so no request waits on a scan of the cache tree
+- Opt-in and best effort: the cache is off unless SIGNAL_DISK_CACHE_DIR is
+  set; a directory that cannot be used (permissions, not a directory)
+  disables it with a single warning, while other write errors (such as a
+  full disk) skip only the failed entry
+"""
+
+import errno
+import hashlib
+import os
+import tempfile
+import threading
+from typing import Any, Optional
+
+import numpy as np
+import orjson
+
+from app.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Number of writes between size-limit checks
+PRUNE_INTERVAL = 256
+
+# Write errors that mean the configured directory itself is unusable
+_CONFIG_ERRNOS = frozenset((errno.EACCES, errno.EPERM, errno.ENOTDIR, errno.EROFS))
+
+# Directory the cache was disabled for; setting a different directory
+# re-enables it
+_disabled_dir: Optional[str] = None
+_writes_since_prune = 0
+_prune_lock = threading.Lock()
+_prune_thread: Optional[threading.Thread] = None
+
+
+def _entry_path(symbol: str, period: str, closes: np.ndarray) -> str:
+    """Path of the cache file for a (symbol, period, closes) key."""
+    key = hashlib.sha1(f"{symbol.upper()}|{period}|".encode())
+    key.update(np.ascontiguousarray(closes, dtype=np.float64).tobytes())
+    digest = key.hexdigest()
+    return os.path.join(settings.SIGNAL_DISK_CACHE_DIR, digest[:2], f"{digest}.json")
+
+
+def _disable(reason: Any) -> None:
+    """Turn the disk cache off while the configured directory is unchanged."""
+    global _disabled_dir
+    if _disabled_dir != settings.SIGNAL_DISK_CACHE_DIR:
+        _disabled_dir = settings.SIGNAL_DISK_CACHE_DIR
+        logger.warning(f"Signal disk cache disabled ({_disabled_dir!r}): {reason}")
+
+
+def _enabled() -> bool:
+    """Check whether a cache directory is configured and usable."""
+    return bool(settings.SIGNAL_DISK_CACHE_DIR) and settings.SIGNAL_DISK_CACHE_DIR != _disabled_dir
+
+
+def get_entry(symbol: str, period: str, closes: np.ndarray) -> Optional[Any]:
+    """
+    Load a cached entry.
+
+    Args:
+        symbol: Asset symbol
+        period: Historical period for analysis
+        closes: Closes the entry was computed from
+
+    Returns:
+        Optional[Any]: Decoded entry, or None on a miss
+    """
+    if not _enabled():
+        return None
+
+    try:
+        with open(_entry_path(symbol, period, closes), "rb") as handle:
+            return orjson.loads(handle.read())
+    except FileNotFoundError:
+        return None
+    except (OSError, orjson.JSONDecodeError) as e:
+        logger.debug(f"Signal disk cache read error for {symbol}: {e}")
+        return None
+
+
+def set_entry(symbol: str, period: str, closes: np.ndarray, value: Any) -> bool:
+    """
+    Store an entry.
+
+    The file is written to a temporary name and renamed into place, so
+    concurrent readers in other workers never see a partial entry.
+
+    Args:
+        symbol: Asset symbol
+        period: Historical period for analysis
+        closes: Closes the entry was computed from
+        value: orjson-serializable value
+
+    Returns:
+        bool: True if the entry was written
+    """
+    global _writes_since_prune
+    if not _enabled():
+        return False
+
+    path = _entry_path(symbol, period, closes)
+    try:
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(orjson.dumps(value))
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+    except OSError as e:
+        if e.errno in _CONFIG_ERRNOS:
+            _disable(e)
+        else:
+            logger.warning(f"Signal disk cache write skipped for {symbol}: {e}")
+        return False
+
+    _writes_since_prune += 1
+    if _writes_since_prune >= PRUNE_INTERVAL:
+        _writes_since_prune = 0
+        _schedule_prune()
+    return True
+
+
+def _schedule_prune() -> None:
+    """Start a background prune unless one is already running."""
+    global _prune_thread
+    if not _prune_lock.acquire(blocking=False):
+        return
+    _prune_thread = threading.Thread(target=_prune_in_background, name="signal-disk-cache-prune", daemon=True)
+    _prune_thread.start()
+
+
+def _prune_in_background() -> None:
+    """Prune the cache, releasing the prune lock when done."""
+    try:
+        prune()
+    except Exception as e:
+        logger.warning(f"Signal disk cache prune failed: {e}")
+    finally:
+        _prune_lock.release()
+
+
+def prune(size_limit: Optional[int] = None) -> int:
+    """
+    Evict the oldest entries until the cache fits its size limit.
+
+    Args:
+        size_limit: Maximum total size in bytes (defaults to
+            settings.SIGNAL_DISK_CACHE_SIZE_LIMIT)
+
+    Returns:
+        int: Number of entries removed
+    """
+    root = settings.SIGNAL_DISK_CACHE_DIR
+    if not root or not os.path.isdir(root):
+        return 0
+    if size_limit is None:
+        size_limit = settings.SIGNAL_DISK_CACHE_SIZE_LIMIT
+
+    entries = []
+    total = 0
+    for shard in os.scandir(root):
+        if not shard.is_dir():
+            continue
+        for entry in os.scandir(shard.path):
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+            total += stat.st_size
+
+    removed = 0
+    entries.sort()
+    for _, size, path in entries:
+        if total <= size_limit:
+            break
+        try:
+            os.unlink(path)
+        except OSError:
+            continue
+        total -= size
+        removed += 1
+
+    if removed:
+        logger.info(f"Signal disk cache pruned {removed} entries")
+    return removed
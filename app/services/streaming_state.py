@@ -0,0 +1,106 @@
+"""
+Streaming Indicator State - Per-Symbol Incremental Signal State
+===============================================================
+
+This module keeps per-(symbol, period) state for repeat signal polls:
+- The closes the last analysis ran on (the latest SIGNAL_LOOKBACK bars
+  of the fetched history, rebuilt on every poll)
+- Last computed indicator values and signal bundle for reuse
+
+Features:
+- Unchanged closes and price: the stored bundle is returned with no compute
+- Unchanged closes, new quote: stored indicators are reused, only the
+  signal logic reruns against the new price
+- Any change to the closes (new bars, a revised close for the current
+  bar): indicators are recomputed, so streamed results always equal a
+  full recompute over the same history
+- Bounded, least-recently-used state store
+
+Indicators are not advanced bar by bar from stored EMA or RSI state: each
+one is seeded at the first close of the window, and the window slides
+with every new bar, so a carried-forward recurrence would diverge from
+the windowed values the other signal paths return.
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+# Maximum number of (symbol, period) states kept in memory
+STATE_MAXSIZE = 1024
+
+_states: "OrderedDict[Tuple[str, str], IndicatorState]" = OrderedDict()
+
+
+@dataclass
+class IndicatorState:
+    """Incremental indicator state for one (symbol, period)."""
+    closes: Optional[np.ndarray] = None
+    current_price: Optional[float] = None
+    indicator_set: Optional[Tuple[Any, ...]] = None
+    bundle: Optional[Dict[str, Any]] = None
+
+    def is_current(self, closes: np.ndarray, current_price: float) -> bool:
+        """
+        Check whether the stored bundle reflects the given closes and price.
+
+        Args:
+            closes: Closes the analysis runs on
+            current_price: Latest quote
+
+        Returns:
+            bool: True when the stored bundle can be served as is
+        """
+        return (
+            self.bundle is not None
+            and self.current_price == current_price
+            and self.closes is not None
+            and np.array_equal(self.closes, closes)
+        )
+
+    def update(self, closes: np.ndarray) -> bool:
+        """
+        Replace the analyzed closes, dropping derived values if they changed.
+
+        Args:
+            closes: Closes the analysis runs on
+
+        Returns:
+            bool: True when the closes differ from the stored ones
+        """
+        if self.closes is not None and np.array_equal(self.closes, closes):
+            return False
+        self.closes = closes
+        self.indicator_set = None
+        self.bundle = None
+        return True
+
+
+def get_state(symbol: str, period: str) -> IndicatorState:
+    """
+    Get (or create) the streaming state for a symbol and period.
+
+    Args:
+        symbol: Asset symbol
+        period: Historical period for analysis
+
+    Returns:
+        IndicatorState: State for the key, marked most recently used
+    """
+    key = (symbol.upper(), period)
+    state = _states.get(key)
+    if state is None:
+        state = IndicatorState()
+        _states[key] = state
+        while len(_states) > STATE_MAXSIZE:
+            _states.popitem(last=False)
+    else:
+        _states.move_to_end(key)
+    return state
+
+
+def clear_states() -> None:
+    """Drop all streaming state."""
+    _states.clear()
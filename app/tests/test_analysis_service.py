@@ -11,6 +11,8 @@ import asyncio
 from unittest.mock import patch, AsyncMock, MagicMock
 from datetime import datetime
 
+import numpy as np
+
 from app.services.analysis_service import (
     simple_moving_average,
     exponential_moving_average,
@@ -21,11 +23,15 @@ from app.services.analysis_service import (
     williams_r,
     average_true_range,
     generate_trading_signals,
+    generate_trading_signals_batch,
     compute_signal_bundle,
+    compute_signal_bundle_batch,
+    compute_signal_bundle_incremental,
     get_market_overview,
     SignalStrength,
     TrendDirection
 )
+from app.services import streaming_state
 
 
 class TestMovingAverages:
@@ -106,6 +112,22 @@ class TestMACD:
         # Test insufficient data
         macd_short = macd(prices[:20], 12, 26, 9)
         assert macd_short is None
+    
+    def test_macd_matches_prefix_definition(self):
+        """Test the single-pass MACD equals EMAs recomputed over every prefix."""
+        prices = [100 + (i % 9) * 1.7 - (i % 4) * 2.3 + i * 0.2 for i in range(60)]
+        
+        macd_values = [
+            exponential_moving_average(prices[:i + 1], 12) - exponential_moving_average(prices[:i + 1], 26)
+            for i in range(26, len(prices))
+        ]
+        expected_line = macd_values[-1]
+        expected_signal = exponential_moving_average(macd_values, 9)
+        
+        macd_data = macd(prices, 12, 26, 9)
+        assert macd_data["macd"] == pytest.approx(expected_line, abs=1e-12)
+        assert macd_data["signal"] == pytest.approx(expected_signal, abs=1e-12)
+        assert macd_data["histogram"] == pytest.approx(expected_line - expected_signal, abs=1e-12)
 
 
 class TestBollingerBands:
@@ -238,6 +260,52 @@ class TestSignalGeneration:
         assert signals["primary_signal"] == "HOLD"
         assert signals["signal_strength"] == SignalStrength.WEAK.value
         assert signals["confidence"] < 50
+    
+    def test_batch_signals_match_scalar(self):
+        """Test vectorized signal generation matches the per-symbol rules."""
+        nan = float("nan")
+        # Bullish, bearish, neutral, and no indicators at all
+        columns = {
+            "rsi": np.array([25.0, 75.0, 50.0, nan]),
+            "macd": np.array([1.0, 0.5, 0.5, nan]),
+            "macd_signal": np.array([0.5, 1.0, 0.5, nan]),
+            "macd_histogram": np.array([0.5, -0.5, 0.0, nan]),
+            "bb_upper": np.array([110.0, 110.0, 110.0, nan]),
+            "bb_middle": np.array([100.0, 100.0, 100.0, nan]),
+            "bb_lower": np.array([90.0, 90.0, 90.0, nan]),
+            "bb_percent_b": np.array([20.0, 80.0, 50.0, nan]),
+            "stoch_k": np.array([15.0, 85.0, 50.0, nan]),
+            "williams_r": np.array([-85.0, -15.0, -50.0, nan]),
+            "ema_20": np.array([102.0, 98.0, 100.0, nan]),
+            "ema_50": np.array([98.0, 102.0, 100.0, nan]),
+        }
+        current_prices = np.array([105.0, 95.0, 100.0, 100.0])
+        
+        batch = generate_trading_signals_batch(current_prices, columns)
+        
+        for row, signals in enumerate(batch):
+            def value(name):
+                v = columns[name][row]
+                return None if np.isnan(v) else float(v)
+            
+            expected = generate_trading_signals(
+                current_price=float(current_prices[row]),
+                rsi=value("rsi"),
+                macd_data={
+                    "macd": value("macd"), "signal": value("macd_signal"), "histogram": value("macd_histogram")
+                } if value("macd") is not None else None,
+                bb_data={
+                    "upper": value("bb_upper"), "middle": value("bb_middle"),
+                    "lower": value("bb_lower"), "percent_b": value("bb_percent_b")
+                } if value("bb_upper") is not None else None,
+                stoch_data={"k_percent": value("stoch_k")} if value("stoch_k") is not None else None,
+                williams_r=value("williams_r"),
+                ema_20=value("ema_20"),
+                ema_50=value("ema_50")
+            )
+            assert signals == expected
+        
+        assert [signals["primary_signal"] for signals in batch] == ["BUY", "SELL", "HOLD", "HOLD"]
 
 
 class TestSignalBundle:
@@ -296,12 +364,204 @@ class TestSignalBundle:
             "confidence": 75.0
         }
         
-        with patch('app.services.analysis_service.get_cached_indicator') as mock_cache:
+        mock_price_data = {
+            "current_price": 150.0,
+            "history": [
+                {"close": 140 + i} for i in range(50)
+            ]
+        }
+        
+        with patch('app.services.analysis_service.get_price_with_history') as mock_get_price, \
+             patch('app.services.analysis_service.get_cached_indicator') as mock_cache:
+            mock_get_price.return_value = mock_price_data
             mock_cache.return_value = cached_data
             
             result = await compute_signal_bundle("AAPL")
             
             assert result == cached_data
+            
+            # The cache key follows the data, not just the symbol and period
+            first_key = mock_cache.call_args[0][1]
+            mock_price_data["current_price"] = 151.0
+            await compute_signal_bundle("AAPL")
+            assert mock_cache.call_args[0][1] != first_key
+
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("history_length", [40, 0])
+    async def test_signal_paths_share_precision(self, history_length):
+        """Test single, streamed and batch paths return the same values for the same data."""
+        closes = [100 + (i % 7) * 1.3 - (i % 4) * 0.7 + i * 0.05 for i in range(history_length)]
+        mock_price_data = {
+            "current_price": 104.123456789,
+            "history": [{"date": f"2024-02-{i + 1:02d}", "close": c} for i, c in enumerate(closes)]
+        }
+        
+        streaming_state.clear_states()
+        with patch('app.services.analysis_service.get_price_with_history', return_value=mock_price_data), \
+             patch('app.services.analysis_service.get_cached_indicator', return_value=None), \
+             patch('app.services.analysis_service.cache_technical_indicator'), \
+             patch('app.services.analysis_service.get_cached_indicators_batch', return_value=[None]), \
+             patch('app.services.analysis_service.cache_technical_indicators_batch'), \
+             patch('app.services.analysis_service.signal_disk_cache.get_entry', return_value=None), \
+             patch('app.services.analysis_service.signal_disk_cache.set_entry'):
+            
+            bundles = [
+                await compute_signal_bundle("AAPL"),
+                await compute_signal_bundle_incremental("AAPL"),
+                (await compute_signal_bundle_batch(["AAPL"]))[0]
+            ]
+        streaming_state.clear_states()
+        
+        fields = ("indicators", "macd", "bollinger_bands", "stochastic", "signal", "confidence", "individual_signals")
+        first = {field: bundles[0][field] for field in fields}
+        for bundle in bundles[1:]:
+            assert {field: bundle[field] for field in fields} == first
+
+
+    @pytest.mark.asyncio
+    async def test_signal_paths_share_cache_key(self):
+        """Test single, streamed and batch paths read and write the same content key."""
+        mock_price_data = {
+            "current_price": 150.0,
+            "history": [{"date": f"2024-03-{i + 1:02d}", "close": 140 + (i % 5)} for i in range(30)]
+        }
+        
+        streaming_state.clear_states()
+        with patch('app.services.analysis_service.get_price_with_history', return_value=mock_price_data), \
+             patch('app.services.analysis_service.get_cached_indicator', return_value=None) as mock_get, \
+             patch('app.services.analysis_service.cache_technical_indicator') as mock_set, \
+             patch('app.services.analysis_service.get_cached_indicators_batch', return_value=[None]) as mock_get_batch, \
+             patch('app.services.analysis_service.cache_technical_indicators_batch') as mock_set_batch, \
+             patch('app.services.analysis_service.signal_disk_cache.get_entry', return_value=None), \
+             patch('app.services.analysis_service.signal_disk_cache.set_entry'):
+            
+            await compute_signal_bundle("AAPL")
+            single_key = mock_set.call_args[0][1]
+            await compute_signal_bundle_incremental("AAPL")
+            await compute_signal_bundle_batch(["AAPL"])
+        streaming_state.clear_states()
+        
+        assert [call[0][1] for call in mock_get.call_args_list] == [single_key, single_key]
+        assert [call[0][1] for call in mock_set.call_args_list] == [single_key, single_key]
+        assert mock_get_batch.call_args[0][0] == [("AAPL", single_key)]
+        assert mock_set_batch.call_args[0][0][0][:2] == ("AAPL", single_key)
+        assert mock_set_batch.call_args[1]["ttl"] == mock_set.call_args[1]["ttl"]
+
+
+class TestIncrementalSignalBundle:
+    """Test streamed signals against a full recompute."""
+    
+    @staticmethod
+    def _without_timestamp(bundle):
+        return {key: value for key, value in bundle.items() if key != "timestamp"}
+    
+    @pytest.mark.asyncio
+    async def test_streamed_signals_match_full_recompute(self):
+        """Test appended bars and a same-date close revision track a full recompute."""
+        closes = [100 + (i % 7) * 1.3 - (i % 4) * 0.7 + i * 0.05 for i in range(40)]
+        bars = [{"date": f"2024-01-{i + 1:02d}", "close": close} for i, close in enumerate(closes)]
+        feed = {"bars": bars[:30]}
+        
+        async def fake_price(symbol, period):
+            # The provider returns a fixed-length window of the latest bars
+            history = feed["bars"][-30:]
+            return {"current_price": history[-1]["close"], "history": history}
+        
+        streaming_state.clear_states()
+        with patch('app.services.analysis_service.get_price_with_history', side_effect=fake_price), \
+             patch('app.services.analysis_service.get_cached_indicator', return_value=None), \
+             patch('app.services.analysis_service.cache_technical_indicator'), \
+             patch('app.services.analysis_service.signal_disk_cache.get_entry', return_value=None), \
+             patch('app.services.analysis_service.signal_disk_cache.set_entry'):
+            
+            steps = [bars[:30 + count] for count in range(6)]
+            revised = [dict(bar) for bar in bars[:35]]
+            revised[-1]["close"] += 2.5
+            steps.append(revised)
+            
+            for step in steps:
+                feed["bars"] = step
+                streamed = await compute_signal_bundle_incremental("AAPL")
+                recomputed = await compute_signal_bundle("AAPL")
+                assert self._without_timestamp(streamed) == self._without_timestamp(recomputed)
+            
+            # Unchanged data is served from the stored state
+            assert await compute_signal_bundle_incremental("AAPL") is streamed
+        streaming_state.clear_states()
+
+
+class TestSignalBundleBatch:
+    """Test batched multi-symbol signal computation."""
+    
+    @pytest.mark.asyncio
+    async def test_batch_matches_scalar_indicators(self):
+        """Test batch indicators equal the single-symbol indicator functions."""
+        histories = {
+            "AAPL": [140 + (i % 7) * 1.5 - (i % 3) for i in range(50)],
+            "MSFT": [300 - (i % 5) * 2.0 + i * 0.3 for i in range(30)],
+        }
+        
+        async def fake_price(symbol, period):
+            if symbol == "INVALID":
+                return None
+            closes = histories[symbol]
+            return {"current_price": closes[-1], "history": [{"close": c} for c in closes]}
+        
+        with patch('app.services.analysis_service.get_price_with_history', side_effect=fake_price), \
+             patch('app.services.analysis_service.get_cached_indicators_batch', return_value=[None, None, None]), \
+             patch('app.services.analysis_service.cache_technical_indicators_batch') as mock_cache_set:
+            
+            results = await compute_signal_bundle_batch(["AAPL", "INVALID", "MSFT"])
+            
+            assert results[1] is None
+            mock_cache_set.assert_called_once()
+            assert len(mock_cache_set.call_args[0][0]) == 2
+            
+            for result, symbol in ((results[0], "AAPL"), (results[2], "MSFT")):
+                prices = histories[symbol]
+                assert result["symbol"] == symbol
+                assert result["indicators"]["rsi"] == pytest.approx(relative_strength_index(prices, 14), abs=5e-3)
+                assert result["indicators"]["ema_20"] == pytest.approx(exponential_moving_average(prices, 20), abs=5e-5)
+                assert result["indicators"]["ema_50"] == pytest.approx(exponential_moving_average(prices, 50), abs=5e-5)
+                assert result["indicators"]["williams_r"] == pytest.approx(williams_r(prices, 14), abs=5e-3)
+                assert result["indicators"]["atr"] == pytest.approx(average_true_range(prices, 14), abs=5e-5)
+                assert result["bollinger_bands"] == pytest.approx(bollinger_bands(prices, 20, 2.0), abs=5e-3)
+                assert result["stochastic"] == pytest.approx(stochastic_oscillator(prices, 14, 3), abs=5e-3)
+                expected_macd = macd(prices, 12, 26, 9)
+                if expected_macd is None:
+                    assert result["macd"] is None
+                else:
+                    assert result["macd"] == pytest.approx(expected_macd, abs=5e-5)
+
+
+    @pytest.mark.asyncio
+    async def test_batch_keeps_sub_cent_precision(self):
+        """Test sub-cent indicators keep their digits and signals match the scalar path."""
+        closes = [0.00001 * (1 + 0.02 * ((i % 9) - 4) + 0.001 * i) for i in range(50)]
+        
+        async def fake_price(symbol, period):
+            return {"current_price": closes[-1], "history": [{"close": c} for c in closes]}
+        
+        with patch('app.services.analysis_service.get_price_with_history', side_effect=fake_price), \
+             patch('app.services.analysis_service.get_cached_indicators_batch', return_value=[None]), \
+             patch('app.services.analysis_service.cache_technical_indicators_batch'):
+            
+            result = (await compute_signal_bundle_batch(["SHIB"]))[0]
+        
+        expected_macd = macd(closes, 12, 26, 9)
+        assert result["indicators"]["ema_20"] == pytest.approx(exponential_moving_average(closes, 20), rel=1e-6)
+        assert result["macd"]["histogram"] == pytest.approx(expected_macd["histogram"], rel=1e-6)
+        assert result["macd"]["histogram"] != 0
+        
+        expected = generate_trading_signals(
+            closes[-1], relative_strength_index(closes, 14), expected_macd,
+            bollinger_bands(closes, 20, 2.0), stochastic_oscillator(closes, 14, 3),
+            williams_r(closes, 14), exponential_moving_average(closes, 20),
+            exponential_moving_average(closes, 50)
+        )
+        assert result["signal"] == expected["primary_signal"]
+        assert result["individual_signals"] == expected["individual_signals"]
 
 
 class TestMarketOverview:
@@ -342,8 +602,8 @@ class TestMarketOverview:
             }
         ]
         
-        with patch('app.services.analysis_service.compute_signal_bundle') as mock_compute:
-            mock_compute.side_effect = mock_results
+        with patch('app.services.analysis_service.compute_signal_bundle_batch') as mock_compute:
+            mock_compute.return_value = mock_results
             
             result = await get_market_overview(symbols)
             
@@ -386,8 +646,8 @@ class TestMarketOverview:
             }
         ]
         
-        with patch('app.services.analysis_service.compute_signal_bundle') as mock_compute:
-            mock_compute.side_effect = mock_results
+        with patch('app.services.analysis_service.compute_signal_bundle_batch') as mock_compute:
+            mock_compute.return_value = mock_results
             
             result = await get_market_overview(symbols)
             
@@ -0,0 +1,48 @@
+"""
+Asset Service Tests
+===================
+
+This module contains tests for asset metadata lookups against the Alpha
+Vantage company overview endpoint.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+import orjson
+
+from app.services.asset_service import _fetch_alpha_vantage_metadata
+
+
+class TestAlphaVantageMetadata:
+    """Test Alpha Vantage company overview lookups."""
+    
+    @pytest.mark.asyncio
+    async def test_overview_uses_rate_limit(self):
+        """Test overview requests take an Alpha Vantage rate limit token."""
+        overview = {"Symbol": "AAPL", "Name": "Apple Inc.", "Sector": "TECHNOLOGY", "PERatio": "28.5", "Beta": "None"}
+        
+        with patch('app.services.asset_service.settings') as mock_settings, \
+             patch('app.services.asset_service.acquire_rate_limit') as mock_acquire, \
+             patch('app.services.asset_service.get_http_client') as mock_client:
+            mock_settings.ALPHA_VANTAGE_API_KEY = "test-key"
+            mock_response = MagicMock()
+            mock_response.status_code = 200
+            mock_response.content = orjson.dumps(overview)
+            mock_client.return_value.get = AsyncMock(return_value=mock_response)
+            
+            result = await _fetch_alpha_vantage_metadata("AAPL")
+            
+            mock_acquire.assert_awaited_once_with("alphavantage")
+            assert result["name"] == "Apple Inc."
+            assert result["pe_ratio"] == 28.5
+            assert result["beta"] is None
+    
+    @pytest.mark.asyncio
+    async def test_demo_key_skips_request(self):
+        """Test the demo key never spends a rate limit token."""
+        with patch('app.services.asset_service.settings') as mock_settings, \
+             patch('app.services.asset_service.acquire_rate_limit') as mock_acquire:
+            mock_settings.ALPHA_VANTAGE_API_KEY = "demo"
+            
+            assert await _fetch_alpha_vantage_metadata("AAPL") is None
+            mock_acquire.assert_not_called()
@@ -0,0 +1,273 @@
+"""
+Cache Layer Tests
+=================
+
+This module contains tests for the caching layers in front of signal
+computation: the Redis cache manager's batched (MGET / pipelined SETEX)
+operations and the in-process TTL cache.
+"""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from app.core.cache import (
+    CacheManager,
+    get_cached_indicators_batch,
+    cache_technical_indicators_batch
+)
+from app.services.signal_cache import async_ttl_cache
+
+
+class FakeRedis:
+    """In-memory stand-in for the async Redis client, counting round trips."""
+
+    def __init__(self):
+        self.store = {}
+        self.round_trips = 0
+
+    async def get(self, key):
+        self.round_trips += 1
+        return self.store.get(key)
+
+    async def mget(self, keys):
+        self.round_trips += 1
+        return [self.store.get(key) for key in keys]
+
+    async def setex(self, key, ttl, value):
+        self.round_trips += 1
+        self.store[key] = value
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    """Queues SETEX commands and applies them in one round trip."""
+
+    def __init__(self, redis_client):
+        self.redis = redis_client
+        self.commands = []
+
+    def setex(self, key, ttl, value):
+        self.commands.append((key, value))
+
+    async def execute(self):
+        self.redis.round_trips += 1
+        for key, value in self.commands:
+            self.redis.store[key] = value
+        return [True] * len(self.commands)
+
+
+class BrokenRedis(FakeRedis):
+    """Redis client whose every command fails."""
+
+    async def mget(self, keys):
+        raise ConnectionError("redis down")
+
+    def pipeline(self, transaction=True):
+        raise ConnectionError("redis down")
+
+
+class TestCacheManagerBatch:
+    """Test batched cache reads and writes."""
+
+    @pytest.mark.asyncio
+    async def test_set_many_then_get_many(self):
+        """Test one pipelined write and one MGET serve every key."""
+        redis_client = FakeRedis()
+        cache = CacheManager(redis_client)
+
+        assert await cache.set_many({"a": {"value": 1}, "b": [1, 2]}, ttl=60, namespace="technical")
+        assert redis_client.round_trips == 1
+
+        assert await cache.get_many(["a", "b"], "technical") == [{"value": 1}, [1, 2]]
+        assert redis_client.round_trips == 2
+
+    @pytest.mark.asyncio
+    async def test_get_many_partial_hit(self):
+        """Test misses come back as None, aligned with the requested keys."""
+        cache = CacheManager(FakeRedis())
+        await cache.set_many({"b": "cached"}, ttl=60)
+
+        assert await cache.get_many(["a", "b", "c"]) == [None, "cached", None]
+
+    @pytest.mark.asyncio
+    async def test_empty_batches_skip_redis(self):
+        """Test empty batches never reach Redis."""
+        redis_client = FakeRedis()
+        cache = CacheManager(redis_client)
+
+        assert await cache.get_many([]) == []
+        assert await cache.set_many({})
+        assert redis_client.round_trips == 0
+
+    @pytest.mark.asyncio
+    async def test_redis_errors_degrade_to_misses(self):
+        """Test a failing Redis reads as all misses and reports failed writes."""
+        cache = CacheManager(BrokenRedis())
+
+        assert await cache.get_many(["a", "b"]) == [None, None]
+        assert not await cache.set_many({"a": 1})
+
+    @pytest.mark.asyncio
+    async def test_indicator_batch_helpers(self):
+        """Test indicator batch helpers share keys with each other."""
+        cache = CacheManager(FakeRedis())
+        with patch("app.core.cache.get_cache", return_value=cache):
+            await cache_technical_indicators_batch([("AAPL", "1mo_abc", {"signal": "BUY"})], ttl=60)
+
+            hits = await get_cached_indicators_batch([("AAPL", "1mo_abc"), ("MSFT", "1mo_abc")])
+
+        assert hits == [{"signal": "BUY"}, None]
+
+
+class TestAsyncTTLCache:
+    """Test the in-process TTL cache for coroutine functions."""
+
+    @pytest.mark.asyncio
+    async def test_hit_and_miss(self):
+        """Test repeated arguments hit and new arguments miss."""
+        calls = []
+
+        @async_ttl_cache(maxsize=8, ttl_seconds=60)
+        async def compute(symbol):
+            calls.append(symbol)
+            return {"symbol": symbol}
+
+        assert await compute("AAPL") == {"symbol": "AAPL"}
+        assert await compute("AAPL") == {"symbol": "AAPL"}
+        assert await compute("MSFT") == {"symbol": "MSFT"}
+        assert calls == ["AAPL", "MSFT"]
+
+    @pytest.mark.asyncio
+    async def test_expiry(self):
+        """Test entries are recomputed once their TTL has passed."""
+        calls = []
+        now = [1000.0]
+
+        @async_ttl_cache(maxsize=8, ttl_seconds=30)
+        async def compute(symbol):
+            calls.append(symbol)
+            return symbol
+
+        with patch("app.services.signal_cache.time.monotonic", side_effect=lambda: now[0]):
+            await compute("AAPL")
+            now[0] += 29
+            await compute("AAPL")
+            now[0] += 2
+            await compute("AAPL")
+
+        assert calls == ["AAPL", "AAPL"]
+
+    @pytest.mark.asyncio
+    async def test_failures_not_cached(self):
+        """Test None results and exceptions are never cached."""
+        outcomes = [None, ValueError("upstream"), "ok"]
+
+        @async_ttl_cache(maxsize=8, ttl_seconds=60)
+        async def compute(symbol):
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        assert await compute("AAPL") is None
+        with pytest.raises(ValueError):
+            await compute("AAPL")
+        assert await compute("AAPL") == "ok"
+        assert await compute("AAPL") == "ok"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_coalesce(self):
+        """Test concurrent misses for one key share a single computation."""
+        calls = []
+
+        @async_ttl_cache(maxsize=8, ttl_seconds=60)
+        async def compute(symbol):
+            calls.append(symbol)
+            await asyncio.sleep(0.01)
+            return symbol
+
+        results = await asyncio.gather(*(compute("AAPL") for _ in range(10)))
+
+        assert results == ["AAPL"] * 10
+        assert calls == ["AAPL"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_uncached_misses_coalesce(self):
+        """Test concurrent misses share one call even when the result is not cached."""
+        calls = []
+
+        @async_ttl_cache(maxsize=8, ttl_seconds=60)
+        async def compute(symbol):
+            calls.append(symbol)
+            await asyncio.sleep(0.01)
+            return None
+
+        results = await asyncio.gather(*(compute("AAPL") for _ in range(10)))
+
+        assert results == [None] * 10
+        assert calls == ["AAPL"]
+
+        # Nothing was cached, so a later miss computes again
+        await compute("AAPL")
+        assert calls == ["AAPL", "AAPL"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_failure(self):
+        """Test concurrent misses share one failing call, which is not cached."""
+        calls = []
+
+        @async_ttl_cache(maxsize=8, ttl_seconds=60)
+        async def compute(symbol):
+            calls.append(symbol)
+            await asyncio.sleep(0.01)
+            raise ValueError("upstream")
+
+        results = await asyncio.gather(*(compute("AAPL") for _ in range(10)), return_exceptions=True)
+
+        assert all(isinstance(result, ValueError) for result in results)
+        assert calls == ["AAPL"]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_cancel_computation(self):
+        """Test a cancelled caller leaves the shared computation running."""
+        calls = []
+
+        @async_ttl_cache(maxsize=8, ttl_seconds=60)
+        async def compute(symbol):
+            calls.append(symbol)
+            await asyncio.sleep(0.01)
+            return symbol
+
+        first = asyncio.ensure_future(compute("AAPL"))
+        second = asyncio.ensure_future(compute("AAPL"))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == "AAPL"
+        assert calls == ["AAPL"]
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction_and_clear(self):
+        """Test the least recently used entry is evicted and cache_clear empties it."""
+        calls = []
+
+        @async_ttl_cache(maxsize=2, ttl_seconds=60)
+        async def compute(symbol):
+            calls.append(symbol)
+            return symbol
+
+        await compute("A")
+        await compute("B")
+        await compute("A")  # A is now most recently used
+        await compute("C")  # evicts B
+        await compute("A")
+        await compute("B")
+        assert calls == ["A", "B", "C", "B"]
+
+        compute.cache_clear()
+        await compute("A")
+        assert calls[-1] == "A" and len(calls) == 5
@@ -10,6 +10,7 @@ import pytest
 import asyncio
 from unittest.mock import AsyncMock, patch, MagicMock
 import httpx
+import orjson
 
 from app.services.alphavantage_service import (
     get_price_with_history,
@@ -18,6 +19,7 @@ from app.services.alphavantage_service import (
     get_market_summary,
     _detect_asset_type,
     _fetch_alpha_vantage_price,
+    _fetch_alpha_vantage_history,
     _fetch_yahoo_finance_price,
     _fetch_coingecko_price,
     MarketDataError,
@@ -68,12 +70,12 @@ class TestAlphaVantageIntegration:
             }
         }
         
-        with patch('httpx.AsyncClient') as mock_client:
+        with patch('app.services.alphavantage_service.get_http_client') as mock_client:
             mock_response = MagicMock()
             mock_response.status_code = 200
-            mock_response.json.return_value = mock_response_data
+            mock_response.content = orjson.dumps(mock_response_data)
             
-            mock_client.return_value.__aenter__.return_value.get.return_value = mock_response
+            mock_client.return_value.get.return_value = mock_response
             
             result = await _fetch_alpha_vantage_price("AAPL")
             
@@ -91,12 +93,12 @@ class TestAlphaVantageIntegration:
             "Error Message": "Invalid API call"
         }
         
-        with patch('httpx.AsyncClient') as mock_client:
+        with patch('app.services.alphavantage_service.get_http_client') as mock_client:
             mock_response = MagicMock()
             mock_response.status_code = 200
-            mock_response.json.return_value = mock_response_data
+            mock_response.content = orjson.dumps(mock_response_data)
             
-            mock_client.return_value.__aenter__.return_value.get.return_value = mock_response
+            mock_client.return_value.get.return_value = mock_response
             
             result = await _fetch_alpha_vantage_price("INVALID")
             
@@ -109,17 +111,39 @@ class TestAlphaVantageIntegration:
             "Note": "Thank you for using Alpha Vantage! Our standard API call frequency is 25 requests per day and 5 requests per minute."
         }
         
-        with patch('httpx.AsyncClient') as mock_client:
+        with patch('app.services.alphavantage_service.get_http_client') as mock_client:
             mock_response = MagicMock()
             mock_response.status_code = 200
-            mock_response.json.return_value = mock_response_data
+            mock_response.content = orjson.dumps(mock_response_data)
             
-            mock_client.return_value.__aenter__.return_value.get.return_value = mock_response
+            mock_client.return_value.get.return_value = mock_response
             
             result = await _fetch_alpha_vantage_price("AAPL")
             
             assert result is None
 
+    
+    @pytest.mark.asyncio
+    async def test_history_keeps_latest_points(self):
+        """Test history keeps the most recent HISTORY_POINTS bars in date order."""
+        dates = [f"2024-{month:02d}-{day:02d}" for month in (1, 2) for day in range(1, 29)]
+        bar = {"1. open": "1.0", "2. high": "2.0", "3. low": "0.5", "4. close": "1.5", "5. volume": "100"}
+        mock_response_data = {"Monthly Time Series": {date: bar for date in reversed(dates)}}
+        
+        with patch('app.services.alphavantage_service.get_http_client') as mock_client, \
+             patch('app.services.alphavantage_service.acquire_rate_limit'):
+            mock_response = MagicMock()
+            mock_response.status_code = 200
+            mock_response.content = orjson.dumps(mock_response_data)
+            
+            mock_client.return_value.get.return_value = mock_response
+            
+            result = await _fetch_alpha_vantage_history("AAPL", "1mo")
+            
+            assert [point["date"] for point in result] == dates[-30:]
+            assert result[-1]["close"] == 1.5
+            assert result[-1]["volume"] == 100
+
 
 class TestYahooFinanceIntegration:
     """Test Yahoo Finance API integration."""
@@ -142,12 +166,12 @@ class TestYahooFinanceIntegration:
             }
         }
         
-        with patch('httpx.AsyncClient') as mock_client:
+        with patch('app.services.alphavantage_service.get_http_client') as mock_client:
             mock_response = MagicMock()
             mock_response.status_code = 200
-            mock_response.json.return_value = mock_response_data
+            mock_response.content = orjson.dumps(mock_response_data)
             
-            mock_client.return_value.__aenter__.return_value.get.return_value = mock_response
+            mock_client.return_value.get.return_value = mock_response
             
             result = await _fetch_yahoo_finance_price("AAPL")
             
@@ -167,12 +191,12 @@ class TestYahooFinanceIntegration:
             }
         }
         
-        with patch('httpx.AsyncClient') as mock_client:
+        with patch('app.services.alphavantage_service.get_http_client') as mock_client:
             mock_response = MagicMock()
             mock_response.status_code = 200
-            mock_response.json.return_value = mock_response_data
+            mock_response.content = orjson.dumps(mock_response_data)
             
-            mock_client.return_value.__aenter__.return_value.get.return_value = mock_response
+            mock_client.return_value.get.return_value = mock_response
             
             result = await _fetch_yahoo_finance_price("INVALID")
             
@@ -193,12 +217,12 @@ class TestCoinGeckoIntegration:
             }
         }
         
-        with patch('httpx.AsyncClient') as mock_client:
+        with patch('app.services.alphavantage_service.get_http_client') as mock_client:
             mock_response = MagicMock()
             mock_response.status_code = 200
-            mock_response.json.return_value = mock_response_data
+            mock_response.content = orjson.dumps(mock_response_data)
             
-            mock_client.return_value.__aenter__.return_value.get.return_value = mock_response
+            mock_client.return_value.get.return_value = mock_response
             
             result = await _fetch_coingecko_price("BTC")
             
@@ -262,16 +286,28 @@ class TestMainServiceFunctions:
     
     @pytest.mark.asyncio
     async def test_get_multiple_prices(self):
-        """Test fetching multiple prices concurrently."""
-        with patch('app.services.alphavantage_service.get_price_with_history') as mock_get_price:
-            mock_get_price.side_effect = [
-                {"symbol": "AAPL", "current_price": 152.50},
-                {"symbol": "GOOGL", "current_price": 2800.00},
-                None  # Third symbol fails
-            ]
+        """Test fetching multiple prices in one batched request."""
+        with patch('app.services.alphavantage_service.get_cached_price_data_batch') as mock_cache, \
+             patch('app.services.alphavantage_service.cache_price_data_batch') as mock_cache_set, \
+             patch('app.services.alphavantage_service._fetch_yahoo_quotes_batch') as mock_yf_batch, \
+             patch('app.services.alphavantage_service._fetch_yahoo_finance_price') as mock_yf:
+            
+            mock_cache.return_value = [None, None, None]
+            mock_yf_batch.return_value = {
+                "AAPL": {"symbol": "AAPL", "current_price": 152.50},
+                "GOOGL": {"symbol": "GOOGL", "current_price": 2800.00}
+                # Third symbol fails
+            }
+            mock_yf.return_value = None
             
             result = await get_multiple_prices(["AAPL", "GOOGL", "INVALID"])
             
+            mock_yf_batch.assert_called_once()
+            assert mock_yf_batch.call_args[0][0] == ["AAPL", "GOOGL", "INVALID"]
+            mock_yf.assert_called_once()
+            assert mock_yf.call_args[0][0] == "INVALID"
+            mock_cache.assert_called_once_with(["AAPL_1mo", "GOOGL_1mo", "INVALID_1mo"])
+            assert set(mock_cache_set.call_args[0][0]) == {"AAPL_1mo", "GOOGL_1mo"}
             assert "AAPL" in result
             assert "GOOGL" in result
             assert "INVALID" in result
@@ -279,15 +315,67 @@ class TestMainServiceFunctions:
             assert result["GOOGL"]["current_price"] == 2800.00
             assert result["INVALID"] is None
     
-    def test_search_symbols(self):
+    @pytest.mark.asyncio
+    async def test_batch_misses_fall_back_to_chart(self):
+        """Test symbols missing from the quote batch are retried on the chart endpoint."""
+        with patch('app.services.alphavantage_service.get_cached_price_data_batch') as mock_cache, \
+             patch('app.services.alphavantage_service.cache_price_data_batch'), \
+             patch('app.services.alphavantage_service.get_provider_failures') as mock_failures, \
+             patch('app.services.alphavantage_service.cache_provider_failures') as mock_record, \
+             patch('app.services.alphavantage_service._fetch_yahoo_quotes_batch') as mock_yf_batch, \
+             patch('app.services.alphavantage_service._fetch_yahoo_finance_price') as mock_yf:
+            
+            mock_cache.return_value = [None, None, None]
+            mock_failures.side_effect = lambda provider, symbols: [False] * len(symbols)
+            mock_yf_batch.return_value = {"AAPL": {"symbol": "AAPL", "current_price": 152.50}}
+            mock_yf.side_effect = lambda symbol, now_iso=None: (
+                {"symbol": symbol, "current_price": 2800.00} if symbol == "GOOGL" else None
+            )
+            
+            result = await get_multiple_prices(["AAPL", "GOOGL", "INVALID"])
+            
+            assert sorted(call[0][0] for call in mock_yf.call_args_list) == ["GOOGL", "INVALID"]
+            assert result["AAPL"]["current_price"] == 152.50
+            assert result["GOOGL"]["current_price"] == 2800.00
+            assert result["INVALID"] is None
+            recorded = {call[0][0]: call[0][1] for call in mock_record.call_args_list}
+            assert recorded == {"yahoo_quote": ["GOOGL", "INVALID"], "yahoo_chart": ["INVALID"]}
+    
+    @pytest.mark.asyncio
+    async def test_failed_batch_falls_back_to_chart(self):
+        """Test a failed quote batch still returns prices from the chart endpoint."""
+        with patch('app.services.alphavantage_service.get_cached_price_data_batch') as mock_cache, \
+             patch('app.services.alphavantage_service.cache_price_data_batch'), \
+             patch('app.services.alphavantage_service._fetch_yahoo_quotes_batch') as mock_yf_batch, \
+             patch('app.services.alphavantage_service._fetch_yahoo_finance_price') as mock_yf:
+            
+            mock_cache.return_value = [None, None]
+            mock_yf_batch.return_value = {}
+            mock_yf.side_effect = lambda symbol, now_iso=None: {"symbol": symbol, "current_price": 100.0}
+            
+            result = await get_multiple_prices(["AAPL", "MSFT"])
+            
+            assert mock_yf.call_count == 2
+            assert result["AAPL"]["current_price"] == 100.0
+            assert result["MSFT"]["current_price"] == 100.0
+    
+    @pytest.mark.asyncio
+    async def test_search_symbols(self):
         """Test symbol search functionality."""
-        result = search_symbols("Apple")
-        assert len(result) > 0
-        assert any(symbol["symbol"] == "AAPL" for symbol in result)
-        
-        result = search_symbols("BTC")
-        assert len(result) > 0
-        assert any(symbol["symbol"] == "BTC" for symbol in result)
+        with patch('app.services.alphavantage_service.get_http_client') as mock_client:
+            result = await search_symbols("Apple")
+            assert len(result) > 0
+            assert any(symbol["symbol"] == "AAPL" for symbol in result)
+            
+            result = await search_symbols("btc")
+            assert [symbol["symbol"] for symbol in result] == ["BTC"]
+            
+            assert await search_symbols("A", limit=2) == (await search_symbols("A"))[:2]
+            assert await search_symbols("A", limit=0) == []
+            assert await search_symbols("NOSUCHSYMBOL") == []
+            
+            # Search runs on the local symbol index, without network requests
+            mock_client.assert_not_called()
     
     @pytest.mark.asyncio
     async def test_get_market_summary(self):
@@ -317,8 +405,8 @@ class TestErrorHandling:
     @pytest.mark.asyncio
     async def test_network_timeout(self):
         """Test handling of network timeouts."""
-        with patch('httpx.AsyncClient') as mock_client:
-            mock_client.return_value.__aenter__.return_value.get.side_effect = httpx.TimeoutException("Timeout")
+        with patch('app.services.alphavantage_service.get_http_client') as mock_client:
+            mock_client.return_value.get.side_effect = httpx.TimeoutException("Timeout")
             
             result = await _fetch_alpha_vantage_price("AAPL")
             assert result is None
@@ -326,12 +414,12 @@ class TestErrorHandling:
     @pytest.mark.asyncio
     async def test_invalid_json_response(self):
         """Test handling of invalid JSON responses."""
-        with patch('httpx.AsyncClient') as mock_client:
+        with patch('app.services.alphavantage_service.get_http_client') as mock_client:
             mock_response = MagicMock()
             mock_response.status_code = 200
-            mock_response.json.side_effect = ValueError("Invalid JSON")
+            mock_response.content = b"Invalid JSON"
             
-            mock_client.return_value.__aenter__.return_value.get.return_value = mock_response
+            mock_client.return_value.get.return_value = mock_response
             
             result = await _fetch_alpha_vantage_price("AAPL")
             assert result is None
@@ -0,0 +1,40 @@
+"""
+Portfolio Route Tests
+=====================
+
+This module contains tests for the portfolio analytics helpers.
+"""
+
+from app.routes.portfolio import (
+    _EMPTY_ANALYTICS_TEMPLATE,
+    _NO_POSITIONS_RECOMMENDATION,
+    _NO_VALUE_RECOMMENDATION,
+    _empty_analytics
+)
+
+
+class TestEmptyAnalytics:
+    """Test zeroed analytics for portfolios without metrics."""
+    
+    def test_no_positions_message(self):
+        """Test portfolios without positions are asked to add some."""
+        analytics = _empty_analytics(1, _NO_POSITIONS_RECOMMENDATION)
+        
+        assert analytics.portfolio_id == 1
+        assert analytics.recommendations == [_NO_POSITIONS_RECOMMENDATION]
+        assert analytics.performance_metrics["total_return"] == 0.0
+    
+    def test_zero_value_message(self):
+        """Test zero-valued portfolios are not told to add positions."""
+        analytics = _empty_analytics(2, _NO_VALUE_RECOMMENDATION)
+        
+        assert analytics.recommendations == [_NO_VALUE_RECOMMENDATION]
+        assert _NO_POSITIONS_RECOMMENDATION not in analytics.recommendations
+    
+    def test_template_not_shared(self):
+        """Test returned analytics never alias the shared template."""
+        analytics = _empty_analytics(3, _NO_POSITIONS_RECOMMENDATION)
+        analytics.allocation_analysis["sector_allocation"]["Technology"] = 100.0
+        
+        assert _EMPTY_ANALYTICS_TEMPLATE["allocation_analysis"]["sector_allocation"] == {}
+        assert "recommendations" not in _EMPTY_ANALYTICS_TEMPLATE
@@ -0,0 +1,93 @@
+"""
+Portfolio Service Tests
+=======================
+
+This module contains tests for portfolio statistics, checking the compiled
+and NumPy series statistics against the per-metric reference formulas.
+"""
+
+import math
+import statistics
+
+import numpy as np
+import pytest
+
+from app.services import portfolio_kernels
+from app.services.portfolio_service import _calculate_series_statistics
+
+
+def reference_statistics(values):
+    """Per-metric formulas the series statistics must reproduce."""
+    returns = [
+        (values[i] - values[i - 1]) / values[i - 1]
+        for i in range(1, len(values))
+        if values[i - 1] > 0
+    ]
+    if not returns:
+        return None
+
+    peak = values[0]
+    max_drawdown = 0.0
+    for value in values:
+        if value > peak:
+            peak = value
+        drawdown = (peak - value) / peak if peak > 0 else 0.0
+        if drawdown > max_drawdown:
+            max_drawdown = drawdown
+
+    return {
+        "volatility": statistics.stdev(returns) * math.sqrt(252) if len(returns) > 1 else 0.0,
+        "annualized_return": statistics.mean(returns) * 252,
+        "max_drawdown": -max_drawdown,
+        "total_return": (values[-1] - values[0]) / values[0] if values[0] != 0 else 0.0
+    }
+
+
+SERIES = {
+    "flat": [100.0] * 10,
+    "length_two": [100.0, 110.0],
+    "zero_start": [0.0, 100.0, 110.0, 90.0, 120.0],
+    "negative_start": [-10.0, 50.0, 40.0, 60.0],
+    "drawdown_from_first": [100.0, 80.0, 90.0, 70.0, 95.0],
+    "random_walk": (1000.0 * np.cumprod(1 + np.random.default_rng(7).normal(0, 0.02, 500))).tolist()
+}
+
+
+@pytest.fixture(params=[True, False], ids=["numba", "numpy"])
+def kernel_path(request, monkeypatch):
+    """Run a test on both the compiled kernel and the NumPy fallback."""
+    monkeypatch.setattr(portfolio_kernels, "NUMBA_AVAILABLE", request.param)
+    return request.param
+
+
+class TestSeriesStatistics:
+    """Test series statistics against the per-metric formulas."""
+
+    @pytest.mark.parametrize("name", list(SERIES))
+    def test_matches_reference(self, kernel_path, name):
+        """Test every statistic matches the reference formulas."""
+        values = SERIES[name]
+
+        result = _calculate_series_statistics(np.array(values))
+        expected = reference_statistics(values)
+
+        assert result.keys() == expected.keys()
+        for key, value in expected.items():
+            assert result[key] == pytest.approx(value, rel=1e-9, abs=1e-12), key
+
+    def test_flat_series_has_no_risk(self, kernel_path):
+        """Test a flat series has zero volatility, return and drawdown."""
+        result = _calculate_series_statistics(np.array(SERIES["flat"]))
+
+        assert result == {"volatility": 0.0, "annualized_return": 0.0, "max_drawdown": 0.0, "total_return": 0.0}
+
+    def test_drawdown_from_first_point(self, kernel_path):
+        """Test a decline from the first value counts as drawdown."""
+        result = _calculate_series_statistics(np.array(SERIES["drawdown_from_first"]))
+
+        assert result["max_drawdown"] == pytest.approx(-0.3)
+
+    @pytest.mark.parametrize("values", [[100.0], [0.0, 10.0], [-5.0, 0.0, 3.0]])
+    def test_no_daily_returns(self, kernel_path, values):
+        """Test series without a positive base yield no statistics."""
+        assert _calculate_series_statistics(np.array(values)) is None
@@ -0,0 +1,80 @@
+"""
+Screener Route Tests
+====================
+
+This module contains tests for the screener endpoints, checking that
+pre-computed results are returned as ORJSONResponse payloads instead of
+being serialized and validated against the response models.
+"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.security import get_current_user
+from app.main import app
+from app.routes.screener import MarketBreadthResponse, ScreeningResponse, SectorAnalysisResponse
+
+
+@pytest.fixture
+def client():
+    """Test client with authentication bypassed."""
+    app.dependency_overrides[get_current_user] = lambda: {"username": "tester"}
+    yield TestClient(app)
+    app.dependency_overrides.pop(get_current_user, None)
+
+
+def _no_validation(*args, **kwargs):
+    raise AssertionError("response was validated against the response model")
+
+
+@pytest.fixture(autouse=True)
+def no_response_validation():
+    """Fail if FastAPI serializes a response through its response model."""
+    with patch("fastapi.routing.serialize_response", side_effect=_no_validation):
+        yield
+
+
+class TestScreenerResponses:
+    """Test screener responses skip response model validation."""
+
+    def test_screen_assets_not_revalidated(self, client):
+        """Test screening results are returned without model validation."""
+        prices = {"AAPL": {"current_price": 150.0, "change": 1.5, "change_percent": 1.0, "volume": 1000}}
+        signal = {"signal": "BUY", "confidence": 80.0}
+        with patch("app.routes.screener._cached_prices", AsyncMock(return_value=prices)), \
+             patch("app.routes.screener.compute_signal_bundle", AsyncMock(return_value=signal)), \
+             patch("app.routes.screener.batch_get_metadata", AsyncMock(return_value={})):
+            response = client.post("/screener/", json={"limit": 5})
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["total_results"] == 1
+        assert body["assets"][0]["symbol"] == "AAPL"
+        assert body["assets"][0]["rank"] == 1
+        assert body["performance_summary"]["buy_signals"] == 1
+        assert set(body) == set(ScreeningResponse.__fields__)
+
+    def test_sector_analysis_not_revalidated(self, client):
+        """Test sector analysis is returned without model validation."""
+        overview = {"symbols": {"AAPL": {"signal": "BUY"}}}
+        with patch("app.routes.screener._cached_prices", AsyncMock(return_value={})), \
+             patch("app.routes.screener.get_market_overview", AsyncMock(return_value=overview)):
+            response = client.get("/screener/sectors")
+
+        assert response.status_code == 200
+        assert set(response.json()) == set(SectorAnalysisResponse.__fields__)
+
+    def test_market_breadth_not_revalidated(self, client):
+        """Test market breadth is returned without model validation."""
+        overview = {"symbols": {"AAPL": {"signal": "BUY"}, "MSFT": {"signal": "SELL"}}}
+        with patch("app.routes.screener.get_market_overview", AsyncMock(return_value=overview)):
+            response = client.get("/screener/breadth")
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["advancing_stocks"] == 1
+        assert body["declining_stocks"] == 1
+        assert body["advance_decline_ratio"] == 1.0
+        assert set(body) == set(MarketBreadthResponse.__fields__)
@@ -0,0 +1,118 @@
+"""
+Signal Disk Cache Tests
+=======================
+
+This module contains tests for the disk-backed indicator cache, including
+content keying, eviction, and disabling on unusable directories.
+"""
+
+import errno
+import os
+import threading
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from app.config import settings
+from app.services import signal_disk_cache
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    """Point the disk cache at a fresh directory and reset its state."""
+    monkeypatch.setattr(settings, "SIGNAL_DISK_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(signal_disk_cache, "_disabled_dir", None)
+    monkeypatch.setattr(signal_disk_cache, "_writes_since_prune", 0)
+    return tmp_path
+
+
+class TestSignalDiskCache:
+    """Test disk cache keying and lifecycle."""
+    
+    def test_round_trip(self, cache_dir):
+        """Test an entry is served back for the same closes."""
+        closes = np.array([100.0, 101.5, 102.25])
+        value = [{"rsi": 55.5}, None, None, None]
+        
+        assert signal_disk_cache.get_entry("aapl", "1mo", closes) is None
+        assert signal_disk_cache.set_entry("aapl", "1mo", closes, value)
+        assert signal_disk_cache.get_entry("AAPL", "1mo", closes.copy()) == value
+    
+    def test_key_follows_closes(self, cache_dir):
+        """Test a revised close or a different window misses."""
+        closes = np.array([100.0, 101.5, 102.25])
+        signal_disk_cache.set_entry("AAPL", "1mo", closes, [1])
+        
+        revised = closes.copy()
+        revised[-1] = 102.5
+        assert signal_disk_cache.get_entry("AAPL", "1mo", revised) is None
+        assert signal_disk_cache.get_entry("AAPL", "1mo", closes[1:]) is None
+        assert signal_disk_cache.get_entry("AAPL", "3mo", closes) is None
+        assert signal_disk_cache.get_entry("MSFT", "1mo", closes) is None
+    
+    def test_prune_evicts_oldest(self, cache_dir):
+        """Test pruning removes the oldest entries first."""
+        windows = [np.array([float(i), float(i + 1)]) for i in range(3)]
+        for age, closes in enumerate(windows):
+            signal_disk_cache.set_entry("AAPL", "1mo", closes, [age])
+            path = signal_disk_cache._entry_path("AAPL", "1mo", closes)
+            os.utime(path, (age, age))
+        
+        entry_size = os.path.getsize(signal_disk_cache._entry_path("AAPL", "1mo", windows[0]))
+        assert signal_disk_cache.prune(size_limit=2 * entry_size) == 1
+        assert signal_disk_cache.get_entry("AAPL", "1mo", windows[0]) is None
+        assert signal_disk_cache.get_entry("AAPL", "1mo", windows[2]) == [2]
+    
+    def test_prune_runs_in_background(self, cache_dir, monkeypatch):
+        """Test the periodic prune runs outside the writing thread."""
+        monkeypatch.setattr(signal_disk_cache, "PRUNE_INTERVAL", 1)
+        prune_threads = []
+        monkeypatch.setattr(signal_disk_cache, "prune", lambda: prune_threads.append(threading.current_thread()))
+        
+        assert signal_disk_cache.set_entry("AAPL", "1mo", np.array([1.0, 2.0]), [1])
+        signal_disk_cache._prune_thread.join(timeout=5)
+        
+        assert len(prune_threads) == 1
+        assert prune_threads[0] is not threading.current_thread()
+    
+    def test_unconfigured_directory_is_off(self, cache_dir, monkeypatch):
+        """Test the cache is off without warnings when no directory is set."""
+        monkeypatch.setattr(settings, "SIGNAL_DISK_CACHE_DIR", "")
+        closes = np.array([1.0, 2.0])
+        
+        with patch.object(signal_disk_cache.logger, "warning") as mock_warning:
+            assert signal_disk_cache.get_entry("AAPL", "1mo", closes) is None
+            assert not signal_disk_cache.set_entry("AAPL", "1mo", closes, [1])
+        mock_warning.assert_not_called()
+        assert not any(cache_dir.iterdir())
+    
+    def test_unwritable_directory_disables_once(self, cache_dir, monkeypatch):
+        """Test a directory that cannot be written disables the cache with one warning."""
+        blocker = cache_dir / "not_a_directory"
+        blocker.write_text("")
+        monkeypatch.setattr(settings, "SIGNAL_DISK_CACHE_DIR", str(blocker))
+        closes = np.array([1.0, 2.0])
+        
+        with patch.object(signal_disk_cache.logger, "warning") as mock_warning:
+            assert not signal_disk_cache.set_entry("AAPL", "1mo", closes, [1])
+            assert not signal_disk_cache.set_entry("AAPL", "1mo", closes, [1])
+            assert signal_disk_cache.get_entry("AAPL", "1mo", closes) is None
+        mock_warning.assert_called_once()
+        
+        # Configuring a usable directory turns the cache back on
+        monkeypatch.setattr(settings, "SIGNAL_DISK_CACHE_DIR", str(cache_dir / "usable"))
+        assert signal_disk_cache.set_entry("AAPL", "1mo", closes, [1])
+        assert signal_disk_cache.get_entry("AAPL", "1mo", closes) == [1]
+    
+    def test_transient_write_error_skips_entry(self, cache_dir):
+        """Test a transient write error skips the entry but keeps the cache on."""
+        closes = np.array([1.0, 2.0])
+        
+        with patch("app.services.signal_disk_cache.tempfile.mkstemp",
+                   side_effect=OSError(errno.ENOSPC, "No space left on device")):
+            assert not signal_disk_cache.set_entry("AAPL", "1mo", closes, [1])
+        
+        assert signal_disk_cache._enabled()
+        assert signal_disk_cache.set_entry("AAPL", "1mo", closes, [1])
+        assert signal_disk_cache.get_entry("AAPL", "1mo", closes) == [1]
@@ -1,5 +1,102 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.security import get_current_user
+from app.main import app
+from app.routes.signals import SignalResponse, _signal_etag
+
+
 def test_placeholder():
     assert True
 
 
+def test_signal_etag_ignores_timestamp():
+    bundle = {
+        "symbol": "AAPL",
+        "period": "1mo",
+        "timestamp": "2024-01-01T00:00:00.000001",
+        "signal": "BUY",
+        "indicators": {"rsi": 41.25, "ema_20": 101.5}
+    }
+    other_worker = dict(bundle, timestamp="2024-01-01T00:00:03.141592")
+    assert _signal_etag(bundle) == _signal_etag(other_worker)
+    assert _signal_etag(bundle).startswith('W/"')
+    
+    changed = dict(bundle, indicators={"rsi": 41.26, "ema_20": 101.5})
+    assert _signal_etag(changed) != _signal_etag(bundle)
+
+
+BUNDLE = {
+    "symbol": "AAPL",
+    "current_price": 101.25,
+    "timestamp": "2024-01-01T00:00:00",
+    "period": "1mo",
+    "signal": "BUY",
+    "signal_strength": 4,
+    "confidence": 72.5,
+    "trend_direction": "bullish",
+    "risk_level": "medium",
+    "reasoning": ["RSI oversold"],
+    "indicators": {"rsi": 28.4, "ema_20": 100.1},
+    "macd": None,
+    "bollinger_bands": {},
+    "stochastic": {"k_percent": 18.0, "d_percent": 22.0},
+    "individual_signals": {"rsi": "BUY"}
+}
+
+
+@pytest.fixture
+def client():
+    app.dependency_overrides[get_current_user] = lambda: {"username": "tester"}
+    yield TestClient(app)
+    app.dependency_overrides.pop(get_current_user, None)
+
+
+@pytest.fixture
+def no_response_validation():
+    def fail(*args, **kwargs):
+        raise AssertionError("response was validated against the response model")
+    
+    with patch("fastapi.routing.serialize_response", side_effect=fail):
+        yield
+
+
+def test_get_signal_skips_response_validation(client, no_response_validation):
+    with patch("app.routes.signals._cached_signal_bundle", AsyncMock(return_value=BUNDLE)):
+        response = client.get("/signals/AAPL")
+    
+    assert response.status_code == 200
+    assert response.headers["etag"] == _signal_etag(BUNDLE)
+    body = response.json()
+    assert set(body) == set(SignalResponse.__fields__)
+    assert body["indicators"]["rsi"] == 28.4
+    assert body["indicators"]["atr"] is None
+    assert body["macd"] == {"macd": None, "signal": None, "histogram": None}
+    assert body["bollinger_bands"] == dict.fromkeys(("upper", "middle", "lower", "width", "percent_b"))
+    assert body["stochastic"] == {"k_percent": 18.0, "d_percent": 22.0}
+    assert SignalResponse.parse_obj(body).macd.histogram is None
+
+
+def test_get_signal_not_modified(client):
+    with patch("app.routes.signals._cached_signal_bundle", AsyncMock(return_value=BUNDLE)):
+        response = client.get("/signals/AAPL", headers={"If-None-Match": _signal_etag(BUNDLE)})
+    
+    assert response.status_code == 304
+
 
+def test_market_overview_skips_response_validation(client, no_response_validation):
+    overview = {
+        "timestamp": "2024-01-01T00:00:00",
+        "total_symbols": 1,
+        "successful_analyses": 1,
+        "signals_summary": {"BUY": 1, "SELL": 0, "HOLD": 0},
+        "strong_signals": [],
+        "symbols": {"AAPL": {"signal": "BUY"}}
+    }
+    with patch("app.routes.signals.get_market_overview", AsyncMock(return_value=overview)):
+        response = client.get("/signals/market/overview", params={"symbols": ["AAPL"]})
+    
+    assert response.status_code == 200
+    assert response.json() == overview